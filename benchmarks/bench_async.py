@@ -0,0 +1,54 @@
+# File: benchmarks/bench_async.py
+"""
+Async streaming benchmark: end-to-end latency and event-loop lag under load
+
+Runs the asynchronous.measure_latency harness (a sine stream through a
+Delay + Multiply AsyncPipeline to an in-process consumer) in four
+scenarios: ingest as fast as possible, ingest paced at --rate blocks per
+second, a slow consumer, and the same load with offloading disabled so
+every block is processed on the event loop. Reports latency and loop-lag
+percentiles, throughput and the most blocks buffered.
+
+Usage:
+    python benchmarks/bench_async.py [--blocks 200] [--block-size 65536] [--rate 200] [--consumer-delay 0.01]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+
+from signal_ICT_abhinaychoudhari_92400133174 import asynchronous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--block-size", type=int, default=asynchronous.DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--consumer-delay", type=float, default=0.01)
+    parser.add_argument("--queue-size", type=int, default=asynchronous.DEFAULT_QUEUE_SIZE)
+    args = parser.parse_args()
+    scenarios = [
+        ("unpaced", {}),
+        (f"paced {args.rate:g}/s", {"rate": args.rate}),
+        ("slow consumer", {"consumer_delay": args.consumer_delay}),
+        ("unpaced, inline", {"offload_samples": args.block_size + 1}),
+    ]
+
+    print("=" * 78)
+    print(f"ASYNC PIPELINE LATENCY ({args.blocks} blocks of {args.block_size}, queue {args.queue_size})")
+    print("=" * 78)
+    print(f"{'Scenario':<18} {'Msamples/s':>10} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'lag p50':>8} {'lag max':>8} {'In flight':>10}")
+    for name, options in scenarios:
+        metrics = asynchronous.measure_latency(args.blocks, args.block_size, queue_size=args.queue_size,
+                                               **options)
+        latency, lag = metrics["latency"], metrics["loop_lag"]
+        print(f"{name:<18} {metrics['samples_per_second'] / 1e6:10.1f} "
+              f"{latency['p50_seconds'] * 1e3:8.2f} {latency['p99_seconds'] * 1e3:8.2f} "
+              f"{lag['p50_seconds'] * 1e3:8.2f} {lag['max_seconds'] * 1e3:8.2f} {metrics['max_in_flight']:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# File: benchmarks/bench_compressed.py
+"""
+Compressed container benchmark: ratios, throughput and windowed reads
+
+Part 1 writes a sine capture (float64 and float32), a unit step and white
+noise with several codec and filter settings, and reports the compression
+ratio and the write and read throughput.
+
+Part 2 writes a long sine capture and reads a short time window from it:
+loading the whole .npy file and slicing it, decoding the whole container,
+and seeking with time_range(). It then decodes the whole container
+serially and with --workers threads.
+
+Usage:
+    python benchmarks/bench_compressed.py [--samples 2000000] [--capture 20000000] [--window 2.0] [--workers 4]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import compressed, sine_wave_stream, unit_step
+
+# Label -> save() options
+SETTINGS = {
+    'zlib': dict(codec='zlib', shuffle=False),
+    'zlib+shuffle': dict(codec='zlib'),
+    'zlib+delta+shuffle': dict(codec='zlib', delta=True),
+    'lzma+delta+shuffle': dict(codec='lzma', delta=True),
+}
+
+
+def best_time(func, repeat):
+    """Return the best of repeat timings of func() and its last result."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=2 * 10 ** 6)
+    parser.add_argument("--capture", type=int, default=2 * 10 ** 7)
+    parser.add_argument("--fs", type=float, default=48000.0)
+    parser.add_argument("--window", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sine = np.concatenate(list(sine_wave_stream(2, 5, 0, args.fs, 65536, args.samples)))
+    signals = {
+        'sine float64': sine,
+        'sine float32': sine.astype(np.float32),
+        'unit step': unit_step(np.arange(args.samples) - args.samples // 2),
+        'noise float64': np.random.default_rng(0).standard_normal(args.samples),
+    }
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "signal.sigz")
+        print("=" * 78)
+        print(f"COMPRESSION ({args.samples} samples, best of {args.repeat})")
+        print("=" * 78)
+        print(f"{'Signal':<15} {'Settings':<20} {'Ratio':>8} {'Write MB/s':>11} {'Read MB/s':>10}")
+        for name, x in signals.items():
+            for label, options in SETTINGS.items():
+                write, stored = best_time(lambda: compressed.save(x, path, **options), args.repeat)
+                read, _ = best_time(stored.read, args.repeat)
+                print(f"{name:<15} {label:<20} {stored.ratio:7.1f}x {x.nbytes / write / 1e6:11.0f} "
+                      f"{x.nbytes / read / 1e6:10.0f}")
+
+        print("\n" + "=" * 78)
+        print(f"WINDOWED READS ({args.capture} samples at {args.fs:g} Hz, {args.window:g} s window)")
+        print("=" * 78)
+        npy = os.path.join(folder, "capture.npy")
+        with compressed.CompressedWriter(path, delta=True, fs=args.fs) as writer:
+            for block in sine_wave_stream(2, 5, 0, args.fs, 65536, args.capture):
+                writer.write(block)
+        stored = compressed.load(path)
+        np.save(npy, stored.read())
+        middle = args.capture / args.fs / 2
+        whole_npy, _ = best_time(lambda: np.load(npy)[int(middle * args.fs):int((middle + args.window) * args.fs)],
+                                 args.repeat)
+        whole, _ = best_time(stored.read, args.repeat)
+        seek, (t, window) = best_time(lambda: stored.time_range(middle, middle + args.window), args.repeat)
+        print(f"Files: .npy {os.path.getsize(npy) / 1e6:.0f} MB, container {os.path.getsize(path) / 1e6:.0f} MB "
+              f"({stored.chunks} chunks)")
+        print(f"Load .npy and slice:        {whole_npy * 1e3:9.1f} ms")
+        print(f"Decode whole container:     {whole * 1e3:9.1f} ms")
+        print(f"time_range() window:        {seek * 1e3:9.1f} ms ({len(window)} samples)")
+        parallel_read, _ = best_time(lambda: stored.read(workers=args.workers), args.repeat)
+        print(f"Decode whole, {args.workers} workers:   {parallel_read * 1e3:9.1f} ms "
+              f"({whole / parallel_read:.1f}x; {os.cpu_count()} CPUs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# File: benchmarks/bench_dtype.py
+"""
+Dtype policy benchmark: memory traffic and time per storage dtype
+
+Runs generators and operations under the float64, float32 and float16
+(float32 compute) policies, with inputs already in the policy's dtype
+(as they are when a whole pipeline runs under it). Reports the bytes read
+and written per call, the best time, the effective bandwidth and the
+speed-up over float64. Memory-bound operations (addition,
+multiplication, shifting, the unitary generators) scale with the bytes
+moved, and sin-bound generation also gains from float32's cheaper sin.
+NumPy converts float16 to and from float32 in software (several ns per
+sample), so float16 arithmetic is slower than float64 itself: about 0.4×
+its speed for addition and multiplication, and below 1× for sine_wave.
+Its gains are the halved footprint and the copies and 0/1 generators that
+avoid conversion; the summary line reports the measured float16 factor.
+
+Usage:
+    python benchmarks/bench_dtype.py [--samples 10000000] [--repeat 5]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import (
+    dtype_policy, unit_step, ramp_signal, sine_wave, cosine_wave, time_shift,
+    signal_addition, signal_multiplication
+)
+
+POLICIES = ("float64", "float32", "float16")
+
+# Cases whose float16 samples go through float32 arithmetic
+ARITHMETIC = ("sine_wave", "signal_addition", "signal_multiplication")
+
+# Case name -> (input names, call)
+CASES = {
+    "unit_step": (("n",), lambda d: unit_step(d["n"])),
+    "sine_wave": (("t",), lambda d: sine_wave(2, 5, 0, d["t"])),
+    "time_shift": (("sine",), lambda d: time_shift(d["sine"], 5)),
+    "signal_addition": (("step", "ramp"), lambda d: signal_addition(d["step"], d["ramp"])),
+    "signal_multiplication": (("sine", "cosine"), lambda d: signal_multiplication(d["sine"], d["cosine"])),
+}
+
+
+def best_time(func, repeat):
+    """Return the best of repeat timings of func() and its last result."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10 ** 7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    size = args.samples
+
+    print("=" * 78)
+    print(f"DTYPE POLICY BENCHMARK ({size} samples, best of {args.repeat})")
+    print("=" * 78)
+    print(f"{'Case':>22} {'Policy':>8} {'MB moved':>9} {'Time ms':>9} {'GB/s':>7} {'Speed-up':>9}")
+    half = []
+    for name, (names, call) in CASES.items():
+        baseline = None
+        for policy in POLICIES:
+            # A float16 ramp saturates to inf past 65504 (documented)
+            with dtype_policy(policy), np.errstate(over="ignore"):
+                t = np.linspace(0, 1, size, dtype=policy)
+                n = np.arange(-(size // 2), size - size // 2)
+                inputs = {"t": t, "n": n, "sine": sine_wave(2, 5, 0, t), "cosine": cosine_wave(2, 5, 0, t),
+                          "step": unit_step(n), "ramp": ramp_signal(n)}
+                seconds, result = best_time(lambda: call(inputs), args.repeat)
+            moved = sum(inputs[key].nbytes for key in names) + result.nbytes
+            baseline = seconds if baseline is None else baseline
+            print(f"{name:>22} {policy:>8} {moved / 1e6:9.1f} {seconds * 1e3:9.2f} "
+                  f"{moved / seconds / 1e9:7.2f} {baseline / seconds:8.2f}x")
+            if policy == "float16" and name in ARITHMETIC:
+                half.append(baseline / seconds)
+            del inputs, result
+    print(f"\nfloat16 arithmetic ({', '.join(ARITHMETIC)}) runs at {np.exp(np.mean(np.log(half))):.2f}x "
+          f"the speed of float64 (geometric mean).\nNumPy converts float16 in software, so choose float32 "
+          f"for speed and float16 only for footprint.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# File: benchmarks/bench_import.py
+"""
+Import-time and first-call benchmark for signal_ICT_abhinaychoudhari_92400133174
+
+Each measurement runs in a fresh interpreter so it reflects cold-start cost.
+The package import (and the first headless generator call) should cost
+roughly what ``import numpy`` costs, far below ``import matplotlib.pyplot``.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ("import numpy", "import numpy"),
+    ("import package", "import signal_ICT_abhinaychoudhari_92400133174"),
+    ("package + first sine_wave call",
+     "import signal_ICT_abhinaychoudhari_92400133174 as s\n"
+     "import numpy as np\n"
+     "s.sine_wave(A=2, f=5, phi=0, t=np.linspace(0, 1, 1000))"),
+    ("import matplotlib.pyplot", "import matplotlib.pyplot"),
+]
+
+TEMPLATE = (
+    "import time\n"
+    "_start = time.perf_counter()\n"
+    "{body}\n"
+    "print(time.perf_counter() - _start)\n"
+)
+
+
+def time_cold(body, repeat):
+    """Return the median wall time (seconds) of running body in a new interpreter."""
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(body=body)],
+            capture_output=True, text=True, check=True, cwd=ROOT,
+        )
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7, help="runs per case (default 7)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("COLD-START BENCHMARK")
+    print("=" * 60)
+    for name, body in CASES:
+        elapsed = time_cold(body, args.repeat)
+        print(f"{name:35}: {elapsed * 1e3:8.2f} ms")
+
+    leaked = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, numpy as np\n"
+         "import signal_ICT_abhinaychoudhari_92400133174 as s\n"
+         "s.sine_wave(A=2, f=5, phi=0, t=np.linspace(0, 1, 10))\n"
+         "print('matplotlib' in sys.modules)"],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    ).stdout.strip()
+    print("-" * 60)
+    print(f"matplotlib loaded by headless call: {leaked}")
+
+
+if __name__ == "__main__":
+    main()
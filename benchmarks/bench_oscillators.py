@@ -0,0 +1,53 @@
+# File: benchmarks/bench_oscillators.py
+"""
+Oscillator benchmark: direct np.sin/np.cos evaluation vs. phasor rotation
+
+Usage:
+    python benchmarks/bench_oscillators.py [--sizes 1e5 1e6 1e7] [--repeat N]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import sine_wave, cosine_wave, quadrature_wave
+
+
+def best_of(func, repeat):
+    """Return the best wall time (seconds) of func() over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e5, 1e6, 1e7])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("OSCILLATOR BENCHMARK (sine + cosine, ns/sample)")
+    print("=" * 72)
+    print(f"{'Samples':>12} {'direct':>10} {'phasor':>10} {'quadrature':>12} {'max error':>12}")
+    for size in args.sizes:
+        t = np.linspace(0, 1, int(size))
+        direct = best_of(lambda: (sine_wave(2, 5, 0, t), cosine_wave(2, 5, 0, t)), args.repeat)
+        phasor = best_of(lambda: (sine_wave(2, 5, 0, t, method='phasor'),
+                                  cosine_wave(2, 5, 0, t, method='phasor')), args.repeat)
+        quad = best_of(lambda: quadrature_wave(2, 5, 0, t), args.repeat)
+        error = np.max(np.abs(quadrature_wave(2, 5, 0, t)[0] - sine_wave(2, 5, 0, t)))
+        scale = 1e9 / t.size
+        print(f"{t.size:12d} {direct * scale:10.2f} {phasor * scale:10.2f} "
+              f"{quad * scale:12.2f} {error:12.2e}")
+
+
+if __name__ == "__main__":
+    main()
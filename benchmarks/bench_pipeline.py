@@ -0,0 +1,80 @@
+# File: benchmarks/bench_pipeline.py
+"""
+Block pipeline benchmark: per-block latency and throughput
+
+Runs shift -> scale -> add -> multiply (Delay, Resample, Add with a unit
+step, Multiply with a carrier) over a stream at typical real-time block
+sizes and reports median/p99 block latency against the real-time budget,
+throughput, and the peak memory allocated while processing 1000 blocks.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--blocks 64 256 1024 4096] [--seconds 10]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import pipeline
+from signal_ICT_abhinaychoudhari_92400133174 import unit_step
+
+FS = 48000
+
+
+def build(block):
+    return pipeline.Pipeline([
+        pipeline.Delay(5, max_block=block),
+        pipeline.Resample(0.5, max_block=block),
+        pipeline.Add(pipeline.ArraySource(unit_step(np.arange(-100, 10 * FS))), max_block=2 * block),
+        pipeline.Multiply(pipeline.Oscillator(1, 1000, 0, 2 * FS), max_block=2 * block),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[64, 256, 1024, 4096])
+    parser.add_argument("--seconds", type=float, default=10, help="stream length in seconds of input")
+    args = parser.parse_args()
+
+    stream = np.random.default_rng(0).standard_normal(int(args.seconds * FS))
+
+    print("=" * 78)
+    print(f"PIPELINE BENCHMARK ({args.seconds:g} s of input at {FS} Hz)")
+    print("=" * 78)
+    print(f"{'Block':>7} {'median us':>10} {'p99 us':>10} {'budget us':>10} "
+          f"{'Msamples/s':>11} {'alloc bytes':>12}")
+    for size in args.blocks:
+        chain = build(size)
+        buffer = np.empty(size)
+        starts = range(0, len(stream) - size + 1, size)
+        latencies = np.empty(len(starts))
+        total = time.perf_counter()
+        for i, start in enumerate(starts):
+            buffer[:] = stream[start:start + size]
+            begin = time.perf_counter()
+            chain.process(buffer)
+            latencies[i] = time.perf_counter() - begin
+        total = time.perf_counter() - total
+
+        # Allocation is measured on a separate pass: tracing slows every call
+        chain.reset()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for start in starts[:1000]:
+            buffer[:] = stream[start:start + size]
+            chain.process(buffer)
+        allocated = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+        latencies *= 1e6
+        print(f"{size:7d} {np.median(latencies):10.1f} {np.percentile(latencies, 99):10.1f} "
+              f"{size / FS * 1e6:10.0f} {len(starts) * size / total / 1e6:11.2f} {allocated:12d}")
+
+
+if __name__ == "__main__":
+    main()
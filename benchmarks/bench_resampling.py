@@ -0,0 +1,72 @@
+# File: benchmarks/bench_resampling.py
+"""
+Resampling benchmark: polyphase time_scale vs. naive interpolation
+
+Compares throughput (output Msamples/s) of the polyphase resampler, the
+streaming Resampler, linear interpolation with np.interp and plain index
+picking, for integer and fractional ratios.
+
+Usage:
+    python benchmarks/bench_resampling.py [--samples 1000000] [--block 4096]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import time_scale, Resampler, resampling
+
+
+def timed(func):
+    """Return (result, seconds) of one call to func()."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def naive_interp(signal, k):
+    """Linear interpolation at t = k·n, with no anti-aliasing filter."""
+    up, down = resampling.ratio(k)
+    positions = np.arange(len(signal) * up // down) * down / up
+    return np.interp(positions, np.arange(len(signal)), signal)
+
+
+def streamed(signal, k, block):
+    resampler = Resampler(k)
+    parts = [resampler.process(signal[i:i + block]) for i in range(0, len(signal), block)]
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=1000000)
+    parser.add_argument("--block", type=int, default=4096, help="streaming block size")
+    args = parser.parse_args()
+
+    signal = np.random.default_rng(0).standard_normal(args.samples)
+    resampling.design.cache_clear()
+
+    print("=" * 78)
+    print(f"RESAMPLING BENCHMARK ({args.samples} input samples, output Msamples/s)")
+    print("=" * 78)
+    print(f"{'k':>10} {'up/down':>10} {'polyphase':>10} {'streamed':>10} "
+          f"{'np.interp':>10} {'index':>10} {'design ms':>10}")
+    for k in (2, 0.5, 1.5, 160 / 147, 44100 / 48000):
+        up, down = resampling.ratio(k)
+        _, design_time = timed(lambda: resampling.design(up, down))
+        out, poly = timed(lambda: time_scale(signal, k))
+        _, stream = timed(lambda: streamed(signal, k, args.block))
+        _, interp = timed(lambda: naive_interp(signal, k))
+        _, index = timed(lambda: time_scale(signal, k, method='index'))
+        rate = len(out) / 1e6
+        print(f"{k:10.4f} {f'{up}/{down}':>10} {rate / poly:10.1f} {rate / stream:10.1f} "
+              f"{rate / interp:10.1f} {rate / index:10.1f} {design_time * 1e3:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# File: benchmarks/bench_shared.py
+"""
+Shared signal benchmark: pickled hand-off vs. shared-memory handles
+
+A producer generates a sine wave and hands it to a worker process, which
+reduces it (np.sum), for increasing signal lengths. The hand-off is timed
+two ways: submitting the array itself, which is pickled, sent through a
+pipe and unpickled into a copy, and submitting a SharedSignal that
+sine_wave filled in place (out=), which pickles as its name and is
+attached by the worker. Reports the hand-off round trip and the bytes
+pickled per call.
+
+Usage:
+    python benchmarks/bench_shared.py [--lengths 100000 1000000 10000000] [--repeat 5]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import concurrent.futures
+import pickle
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import shared, sine_wave
+
+
+def best_time(func, repeat):
+    """Return the best of repeat timings of func()."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"HAND-OFF TO A WORKER PROCESS (best of {args.repeat})")
+    print("=" * 78)
+    print(f"{'Samples':>10} {'Pickled ms':>11} {'Shared ms':>10} {'Speed-up':>9} "
+          f"{'Pickled bytes':>14} {'Shared bytes':>13}")
+    with concurrent.futures.ProcessPoolExecutor(1) as pool:
+        pool.submit(int).result()  # start the worker outside the timings
+        for length in args.lengths:
+            t = np.linspace(0, 1, length)
+            array = sine_wave(2, 5, 0, t)
+            handle = shared.create(length)
+            sine_wave(2, 5, 0, t, out=handle)
+            pool.submit(np.sum, handle).result()  # the worker attaches once
+            copied = best_time(lambda: pool.submit(np.sum, array).result(), args.repeat)
+            zero_copy = best_time(lambda: pool.submit(np.sum, handle).result(), args.repeat)
+            print(f"{length:10d} {copied * 1e3:11.2f} {zero_copy * 1e3:10.2f} {copied / zero_copy:8.1f}x "
+                  f"{len(pickle.dumps(array)):14d} {len(pickle.dumps(handle)):13d}")
+            handle.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# File: benchmarks/bench_sparse.py
+"""
+Sparse signal benchmark: dense arrays vs. compact forms for event trains
+
+Builds two impulse trains of the given density over a long index range,
+gates their sum with a step, adds a ramp and shifts the result, once with
+dense arrays and once with the SparseSignal/PiecewiseSignal forms
+(compact=True). Reports the time and the bytes held by the result, and
+checks that both agree.
+
+Usage:
+    python benchmarks/bench_sparse.py [--samples 10000000] [--events 1000] [--repeat 3]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import (
+    SparseSignal, unit_step, ramp_signal, time_shift, signal_addition, signal_multiplication
+)
+
+
+def chain(step, ramp, train1, train2):
+    """(train1 + train2)·u[n] + r[n], delayed by 5 samples."""
+    gated = signal_multiplication(signal_addition(train1, train2), step)
+    return time_shift(signal_addition(gated, ramp), 5)
+
+
+def best_time(func, repeat):
+    """Return the best of repeat timings of func() and its last result."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10 ** 7)
+    parser.add_argument("--events", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    size = args.samples
+    n = range(-(size // 2), size - size // 2)
+    rng = np.random.default_rng(0)
+
+    print("=" * 78)
+    print(f"SPARSE SIGNAL BENCHMARK ({size} samples, best of {args.repeat})")
+    print("=" * 78)
+    print(f"{'Events':>8} {'Dense ms':>10} {'Compact ms':>11} {'Speed-up':>9} {'Dense MB':>9} {'Compact KB':>11}")
+    dense_n = np.asarray(n)
+    dense_step, dense_ramp = unit_step(dense_n), ramp_signal(dense_n)
+    step, ramp = unit_step(n, compact=True), ramp_signal(n, compact=True)
+    for events in args.events:
+        indices = [np.unique(rng.integers(0, size, events)) for _ in range(2)]
+        trains = [SparseSignal(index, rng.standard_normal(len(index)), size) for index in indices]
+        dense_trains = [train.to_array() for train in trains]
+        dense_seconds, dense = best_time(lambda: chain(dense_step, dense_ramp, *dense_trains), args.repeat)
+        compact_seconds, compact = best_time(lambda: chain(step, ramp, *trains), args.repeat)
+        assert np.allclose(compact.to_array(), dense), "Compact and dense results differ"
+        print(f"{events:8d} {dense_seconds * 1e3:10.2f} {compact_seconds * 1e3:11.3f} "
+              f"{dense_seconds / compact_seconds:8.0f}x {dense.nbytes / 1e6:9.1f} {compact.nbytes / 1e3:11.1f}")
+        del dense, dense_trains
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# File: benchmarks/bench_spectral.py
+"""
+Spectral benchmark: real FFTs at fast lengths and bounded-memory Welch
+
+Part 1 compares a hand-rolled amplitude spectrum, abs(np.fft.fft(x)) at the
+signal's own length, with spectrum(), which uses rfft padded to the next
+fast 5-smooth length, on round, awkward and prime lengths.
+
+Part 2 runs welch() over a memory-mapped .npy file and reports the time,
+the throughput and the tracemalloc peak against the file size and the
+memory budget.
+
+Usage:
+    python benchmarks/bench_spectral.py [--lengths 1000000 1000003 1048573] [--file-samples 50000000]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import outofcore, spectrum, welch
+
+
+def best_time(func, repeat):
+    """Return the best of repeat timings of func()."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10 ** 6, 10 ** 6 + 3, 1048573])
+    parser.add_argument("--file-samples", type=int, default=5 * 10 ** 7)
+    parser.add_argument("--nperseg", type=int, default=4096)
+    parser.add_argument("--memory-limit", type=int, default=16 * 1024 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print("=" * 78)
+    print(f"AMPLITUDE SPECTRUM (best of {args.repeat})")
+    print("=" * 78)
+    print(f"{'Length':>10} {'fft ms':>10} {'spectrum ms':>12} {'Speed-up':>9}")
+    for length in args.lengths:
+        x = rng.standard_normal(length)
+        naive = best_time(lambda: np.abs(np.fft.fft(x)), args.repeat)
+        fast = best_time(lambda: spectrum(x), args.repeat)
+        print(f"{length:10d} {naive * 1e3:10.1f} {fast * 1e3:12.1f} {naive / fast:8.1f}x")
+
+    print("\n" + "=" * 78)
+    print(f"WELCH OVER A MEMORY-MAPPED FILE ({args.file_samples} samples, nperseg={args.nperseg})")
+    print("=" * 78)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "signal.npy")
+        out = outofcore.create(path, args.file_samples, np.float32).memmap("r+")
+        for i in range(0, args.file_samples, 10 ** 7):
+            j = min(i + 10 ** 7, args.file_samples)
+            out[i:j] = rng.standard_normal(j - i)
+        out.flush()
+        del out
+        signal = outofcore.load(path)
+        tracemalloc.start()
+        start = time.perf_counter()
+        welch(signal, fs=1.0, nperseg=args.nperseg, memory_limit=args.memory_limit)
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    size = args.file_samples * 4
+    print(f"File {size / 1e6:.0f} MB, budget {args.memory_limit / 1e6:.0f} MB: {seconds:.2f} s "
+          f"({args.file_samples / seconds / 1e6:.0f} Msamples/s), peak {peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
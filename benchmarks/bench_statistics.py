@@ -0,0 +1,64 @@
+# File: benchmarks/bench_statistics.py
+"""
+Statistics benchmark: single-pass accumulator vs. four NumPy passes
+
+Compares the max/min/mean/RMS computation of main.py's original Section 7
+(np.max, np.min, np.mean and np.sqrt(np.mean(x**2))) with
+signal_statistics, which also returns variance and peak-to-RMS, on time
+and peak extra memory.
+
+Usage:
+    python benchmarks/bench_statistics.py [--samples 1000 100000 10000000] [--workers 1 4]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import signal_statistics
+
+
+def four_pass(x):
+    return np.max(x), np.min(x), np.mean(x), np.sqrt(np.mean(x ** 2))
+
+
+def measure(func, repeat=3):
+    """Return (best seconds, peak traced bytes) of func()."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, nargs="+", default=[1000, 100000, 10000000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("STATISTICS BENCHMARK (time and peak extra memory)")
+    print("=" * 78)
+    print(f"{'Samples':>10} {'Method':>18} {'Time ms':>10} {'ns/sample':>10} {'Peak MB':>9}")
+    for size in args.samples:
+        x = np.random.default_rng(0).standard_normal(size)
+        cases = [("four passes", lambda: four_pass(x))]
+        cases += [(f"single pass x{w}", lambda w=w: signal_statistics(x, workers=w)) for w in args.workers]
+        for name, case in cases:
+            seconds, peak = measure(case)
+            print(f"{size:10d} {name:>18} {seconds * 1e3:10.3f} {seconds / size * 1e9:10.2f} {peak / 1e6:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
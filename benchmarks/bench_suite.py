@@ -0,0 +1,178 @@
+# File: benchmarks/bench_suite.py
+"""
+Benchmark suite: every public function, with baseline regression gating
+
+Times unit_step, unit_impulse, ramp_signal, sine_wave, cosine_wave,
+exponential_signal, time_shift, time_scale, signal_addition and
+signal_multiplication for each input size and dtype. Each case records a
+cold run (first call after clearing the package's caches), a warm run
+(best of --repeat calls) and the peak memory traced during one call, and
+reports ns/sample.
+
+Results can be saved as a JSON baseline (--save) and later runs compared
+against it (--baseline): the run fails (exit status 1) when any case's
+warm ns/sample exceeds its baseline by more than --threshold. Cases whose
+baseline time is below --noise-floor seconds are reported but not gated.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000 ... 100000000] [--dtypes float32 float64]
+                                     [--functions sine_wave ...] [--repeat 5]
+                                     [--save baseline.json] [--baseline baseline.json]
+                                     [--threshold 1.25]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import signal_ICT_abhinaychoudhari_92400133174 as package
+from signal_ICT_abhinaychoudhari_92400133174 import (
+    unit_step, unit_impulse, ramp_signal, sine_wave, cosine_wave, exponential_signal,
+    time_shift, time_scale, signal_addition, signal_multiplication
+)
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7, 10**8]
+
+# Function name -> (input names, call)
+CASES = {
+    "unit_step": (("n",), lambda d: unit_step(d["n"])),
+    "unit_impulse": (("n",), lambda d: unit_impulse(d["n"])),
+    "ramp_signal": (("n",), lambda d: ramp_signal(d["n"])),
+    "sine_wave": (("t",), lambda d: sine_wave(2, 5, 0.3, d["t"])),
+    "cosine_wave": (("t",), lambda d: cosine_wave(2, 5, 0.3, d["t"])),
+    "exponential_signal": (("t",), lambda d: exponential_signal(1, -2, d["t"])),
+    "time_shift": (("x",), lambda d: time_shift(d["x"], 5)),
+    "time_scale": (("x",), lambda d: time_scale(d["x"], 0.5)),
+    "signal_addition": (("x", "y"), lambda d: signal_addition(d["x"], d["y"])),
+    "signal_multiplication": (("x", "y"), lambda d: signal_multiplication(d["x"], d["y"])),
+}
+
+
+def make_input(name, size, dtype):
+    """Build one named input of the given size and dtype."""
+    if name == "n":
+        return np.arange(-(size // 2), size - size // 2).astype(dtype)
+    if name == "t":
+        return np.linspace(0, 1, size, dtype=dtype)
+    seed = {"x": 0, "y": 1}[name]
+    return np.random.default_rng(seed).standard_normal(size).astype(dtype)
+
+
+def clear_caches():
+    """Reset the package's caches so the next call runs cold."""
+    package.resampling.design.cache_clear()
+    package.systems.clear_kernel_cache()
+    package.wavetable.table.cache_clear()
+    package.cache.clear()
+
+
+def run_case(call, data, repeat):
+    """Return cold seconds, warm (best) seconds and peak traced bytes of call(data)."""
+    clear_caches()
+    start = time.perf_counter()
+    call(data)
+    cold = time.perf_counter() - start
+    warm = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call(data)
+        warm = min(warm, time.perf_counter() - start)
+    # Memory is traced on a separate call: tracing slows every allocation
+    tracemalloc.start()
+    call(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return cold, warm, peak
+
+
+def compare(results, baseline, threshold, noise_floor):
+    """Return [(key, ratio)] of cases slower than baseline by more than threshold."""
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None or reference["warm_seconds"] < noise_floor:
+            continue
+        ratio = result["warm_ns_per_sample"] / reference["warm_ns_per_sample"]
+        result["baseline_ratio"] = ratio
+        if ratio > threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--dtypes", nargs="+", default=["float32", "float64"])
+    parser.add_argument("--functions", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5, help="warm calls per case (best is kept)")
+    parser.add_argument("--save", help="write the results to this JSON baseline file")
+    parser.add_argument("--baseline", help="compare against this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="fail when warm ns/sample exceeds baseline by this factor")
+    parser.add_argument("--noise-floor", type=float, default=20e-6,
+                        help="do not gate cases whose baseline warm time is below this (seconds)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    print("=" * 86)
+    print(f"BENCHMARK SUITE (numpy {np.__version__}, {platform.machine()}, repeat {args.repeat})")
+    print("=" * 86)
+    print(f"{'Function':>22} {'dtype':>8} {'Samples':>10} {'cold ns/s':>10} {'warm ns/s':>10} "
+          f"{'peak MB':>9} {'vs base':>8}")
+    results = {}
+    for size in args.sizes:
+        for dtype in args.dtypes:
+            inputs = {}
+            for name in args.functions:
+                names, call = CASES[name]
+                for input_name in names:
+                    if input_name not in inputs:
+                        inputs[input_name] = make_input(input_name, size, dtype)
+                cold, warm, peak = run_case(call, inputs, args.repeat)
+                key = f"{name}/{dtype}/{size}"
+                results[key] = {
+                    "function": name, "dtype": dtype, "samples": size,
+                    "cold_seconds": cold, "warm_seconds": warm,
+                    "cold_ns_per_sample": cold / size * 1e9,
+                    "warm_ns_per_sample": warm / size * 1e9,
+                    "peak_bytes": peak,
+                }
+                if baseline is not None:
+                    compare({key: results[key]}, baseline, args.threshold, args.noise_floor)
+                ratio = results[key].get("baseline_ratio")
+                print(f"{name:>22} {dtype:>8} {size:10d} {cold / size * 1e9:10.2f} "
+                      f"{warm / size * 1e9:10.2f} {peak / 1e6:9.2f} "
+                      f"{'' if ratio is None else f'{ratio:.2f}x':>8}")
+            del inputs
+
+    if args.save:
+        meta = {"numpy": np.__version__, "python": platform.python_version(),
+                "machine": platform.machine(), "processor": platform.processor()}
+        with open(args.save, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.noise_floor)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold}x:")
+            for key, ratio in regressions:
+                print(f"  {key}: {ratio:.2f}x")
+            sys.exit(1)
+        print(f"\nNo case slower than baseline by more than {args.threshold}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# File: benchmarks/bench_sweep.py
+"""
+Parameter sweep benchmark: scaling against worker count
+
+Sweeps an A x f x phi grid (as main.py's Task 2, at scale) with
+parameter_sweep for increasing numbers of worker processes, with and
+without an operations chain, and reports overall throughput, speed-up
+over one worker and the per-worker throughput spread.
+
+Usage:
+    python benchmarks/bench_sweep.py [--grid 10 100 10] [--samples 1000] [--workers 1 2 4 8]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import functools
+import os
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import parameter_sweep, signal_multiplication, time_shift
+
+
+def shifted_product(signal, carrier):
+    """Operations chain: delay by 5 samples, then modulate by a carrier."""
+    return signal_multiplication(time_shift(signal, 5), carrier)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--grid", type=int, nargs=3, default=[10, 100, 10], metavar=("A", "F", "PHI"))
+    parser.add_argument("--samples", type=int, default=1000, help="samples per combination")
+    default_workers = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    args = parser.parse_args()
+
+    t = np.linspace(0, 1, args.samples)
+    A = np.linspace(0.5, 5, args.grid[0])
+    f = np.linspace(1, 50, args.grid[1])
+    phi = np.linspace(0, np.pi, args.grid[2])
+    carrier = np.cos(2 * np.pi * 100 * np.linspace(0, 1, args.samples + 5))
+    chains = {"generate": None, "chain": functools.partial(shifted_product, carrier=carrier)}
+
+    print("=" * 78)
+    print(f"PARAMETER SWEEP BENCHMARK ({np.prod(args.grid)} combinations x {args.samples} samples, "
+          f"{os.cpu_count()} cores)")
+    print("=" * 78)
+    print(f"{'Mode':>9} {'Workers':>8} {'Msamples/s':>11} {'Speed-up':>9} "
+          f"{'worker min':>11} {'worker max':>11}")
+    for mode, chain in chains.items():
+        base = None
+        for workers in args.workers:
+            with parameter_sweep(t, A, f, phi, chain=chain, workers=workers) as result:
+                rate = result.samples_per_second
+                rates = [w["samples_per_second"] / 1e6 for w in result.workers]
+            base = base or rate
+            print(f"{mode:>9} {workers:8d} {rate / 1e6:11.1f} {rate / base:9.2f} "
+                  f"{min(rates):11.1f} {max(rates):11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# File: benchmarks/bench_threads.py
+"""
+Threaded evaluation benchmark: speed-up of workers= on long signals
+
+Times sine_wave, exponential_signal, signal_addition and
+signal_multiplication on one long signal with 1, 2, 4 and 8 threads,
+checks each result is identical to the serial one and reports throughput
+and speed-up over a single thread.
+
+Usage:
+    python benchmarks/bench_threads.py [--samples 100000000] [--workers 1 2 4 8] [--repeat 3]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import (
+    sine_wave, exponential_signal, signal_addition, signal_multiplication
+)
+
+
+def best_time(func, repeat):
+    """Return (result, best seconds) over repeat calls."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10**8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    t = np.linspace(0, 1, args.samples)
+    x = np.random.default_rng(0).standard_normal(args.samples)
+    y = np.random.default_rng(1).standard_normal(args.samples)
+    cases = {
+        "sine_wave": lambda w: sine_wave(2, 50, 0.3, t, workers=w),
+        "exponential_signal": lambda w: exponential_signal(1, -2, t, workers=w),
+        "signal_addition": lambda w: signal_addition(x, y, workers=w),
+        "signal_multiplication": lambda w: signal_multiplication(x, y, workers=w),
+    }
+
+    print("=" * 78)
+    print(f"THREADED EVALUATION BENCHMARK ({args.samples} samples, {os.cpu_count()} cores)")
+    print("=" * 78)
+    print(f"{'Function':>22} {'Workers':>8} {'Time ms':>10} {'Msamples/s':>11} {'Speed-up':>9} {'Identical':>10}")
+    for name, case in cases.items():
+        serial, base = best_time(lambda: case(None), args.repeat)
+        for workers in args.workers:
+            result, seconds = best_time(lambda: case(workers), args.repeat)
+            identical = np.array_equal(result, serial)
+            print(f"{name:>22} {workers:8d} {seconds * 1e3:10.1f} {args.samples / seconds / 1e6:11.1f} "
+                  f"{base / seconds:9.2f} {str(identical):>10}")
+            del result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# File: benchmarks/bench_tone_bank.py
+"""
+Tone-bank benchmark: Python loop of sine_wave calls vs. one batched call
+
+Usage:
+    python benchmarks/bench_tone_bank.py [--channels 1000 100000] [--samples 128]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import sine_wave
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--samples", type=int, default=128, help="samples per channel")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, args.samples)
+
+    print("=" * 72)
+    print(f"TONE BANK BENCHMARK ({args.samples} samples per channel)")
+    print("=" * 72)
+    print(f"{'Channels':>10} {'loop (s)':>10} {'batched (s)':>12} {'out= (s)':>10} {'speed-up':>10}")
+    for channels in args.channels:
+        A = rng.uniform(0.5, 2.0, channels)
+        f = rng.uniform(1.0, 50.0, channels)
+        phi = rng.uniform(0.0, 2 * np.pi, channels)
+        out = np.empty((channels, t.size))
+
+        start = time.perf_counter()
+        looped = np.array([sine_wave(A[i], f[i], phi[i], t) for i in range(channels)])
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = sine_wave(A, f, phi, t)
+        batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sine_wave(A, f, phi, t, out=out)
+        prealloc = time.perf_counter() - start
+
+        assert np.array_equal(looped, batched)
+        print(f"{channels:10d} {loop:10.3f} {batch:12.3f} {prealloc:10.3f} {loop / batch:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
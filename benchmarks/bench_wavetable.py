@@ -0,0 +1,73 @@
+# File: benchmarks/bench_wavetable.py
+"""
+Wavetable benchmark: interpolated table lookup vs. np.sin
+
+Times sine_wave with the direct np.sin path, the phasor oscillator and
+the wavetable backend (linear and cubic interpolation over a range of
+table sizes), and reports throughput, speed-up over np.sin and the SNR of
+each against the direct result.
+
+Usage:
+    python benchmarks/bench_wavetable.py [--samples 10000000] [--sizes 256 1024 4096 16384 65536]
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from signal_ICT_abhinaychoudhari_92400133174 import sine_wave, wavetable
+
+FS = 48000
+F = 997.123456
+
+
+def best_time(func, repeat=3):
+    """Return (result, best seconds) over repeat calls."""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def snr(signal, reference):
+    """Signal-to-noise ratio in dB of signal against reference."""
+    noise = np.mean((signal - reference) ** 2)
+    return np.inf if noise == 0 else 10 * np.log10(np.mean(reference ** 2) / noise)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10**7)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024, 4096, 16384, 65536])
+    args = parser.parse_args()
+
+    t = np.arange(args.samples) / FS
+    reference, base = best_time(lambda: sine_wave(1, F, 0.3, t))
+    cases = [("np.sin (direct)", lambda: reference), ("phasor", lambda: sine_wave(1, F, 0.3, t, method='phasor'))]
+    for interpolation in wavetable.INTERPOLATIONS:
+        for size in args.sizes:
+            wavetable.table(size, interpolation)  # tables are built once per process
+            cases.append((f"{interpolation} {size}",
+                          lambda i=interpolation, s=size: wavetable.wave(1, F, 0.3, t, size=s, interpolation=i)))
+
+    print("=" * 78)
+    print(f"WAVETABLE BENCHMARK ({args.samples} samples at {FS} Hz, f = {F} Hz)")
+    print("=" * 78)
+    print(f"{'Method':>16} {'Time ms':>10} {'Msamples/s':>11} {'vs np.sin':>10} {'SNR dB':>8}")
+    for name, case in cases:
+        if name.startswith("np.sin"):
+            result, seconds = reference, base
+        else:
+            result, seconds = best_time(case)
+        print(f"{name:>16} {seconds * 1e3:10.1f} {args.samples / seconds / 1e6:11.1f} "
+              f"{base / seconds:10.2f} {snr(result, reference):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/__init__.py
+"""
+signal_ICT_abhinaychoudhari_92400133174 - Signal generation and processing package
+
+Modules:
+    unitary_signals       - Unit step, unit impulse and ramp signals
+    trigonometric_signals - Sine, cosine and exponential signals
+    operations            - Time shifting, time scaling, addition and multiplication
+    container             - Offset-carrying Signal type for zero-copy shifting
+    expression            - Deferred, chunk-fused evaluation of signal expressions
+    resampling            - Polyphase rational resampling behind time_scale
+    systems               - Direct/FFT convolution for LTI system responses
+    pipeline              - Stateful block-processing stages for real-time streams
+    outofcore             - Chunked processing of memory-mapped .npy/raw signal files
+    sweep                 - Process-pool parameter sweeps into shared memory
+    parallel              - Thread-pool chunked evaluation behind workers=
+    cache                 - Opt-in LRU memoization of generated signals
+    wavetable             - Interpolated wavetable oscillator backend
+    statistics            - Single-pass, mergeable streaming signal statistics
+    instrumentation       - Opt-in call counts, timings and allocation metrics
+    plotting              - Min/max envelope decimation and Agg rendering of long signals
+    precision             - Package-wide dtype policy (float64, float32, float16 storage)
+    sparse                - Sparse (index, value) and piecewise run forms of the unitary signals
+    spectral              - Real-FFT amplitude spectra and bounded-memory Welch PSD
+    asynchronous          - asyncio block iterators and pipeline with backpressure
+    compressed            - Chunked, compressed signal container with a seek index
+    shared                - Zero-copy shared-memory signals for inter-process hand-off
+
+Submodules (and therefore NumPy) are imported lazily on first attribute
+access, and matplotlib is only imported when plotting is requested, so
+``import signal_ICT_abhinaychoudhari_92400133174`` is cheap for headless use.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import importlib
+
+__version__ = "1.0.0"
+__author__ = "Abhinay Choudhari"
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "unit_step": "unitary_signals",
+    "unit_impulse": "unitary_signals",
+    "ramp_signal": "unitary_signals",
+    "sine_wave": "trigonometric_signals",
+    "cosine_wave": "trigonometric_signals",
+    "exponential_signal": "trigonometric_signals",
+    "quadrature_wave": "trigonometric_signals",
+    "sine_wave_stream": "trigonometric_signals",
+    "cosine_wave_stream": "trigonometric_signals",
+    "time_shift": "operations",
+    "time_scale": "operations",
+    "signal_addition": "operations",
+    "signal_multiplication": "operations",
+    "Signal": "container",
+    "deferred": "expression",
+    "evaluate": "expression",
+    "Resampler": "resampling",
+    "convolve": "systems",
+    "BlockConvolver": "systems",
+    "Pipeline": "pipeline",
+    "SignalFile": "outofcore",
+    "parameter_sweep": "sweep",
+    "signal_statistics": "statistics",
+    "instrumented": "instrumentation",
+    "dtype_policy": "precision",
+    "set_default_dtype": "precision",
+    "SparseSignal": "sparse",
+    "PiecewiseSignal": "sparse",
+    "spectrum": "spectral",
+    "welch": "spectral",
+    "AsyncPipeline": "asynchronous",
+    "CompressedSignal": "compressed",
+    "CompressedWriter": "compressed",
+    "SharedSignal": "shared",
+}
+
+_SUBMODULES = (
+    "unitary_signals",
+    "trigonometric_signals",
+    "operations",
+    "container",
+    "expression",
+    "resampling",
+    "systems",
+    "pipeline",
+    "outofcore",
+    "sweep",
+    "parallel",
+    "cache",
+    "wavetable",
+    "statistics",
+    "instrumentation",
+    "plotting",
+    "precision",
+    "sparse",
+    "spectral",
+    "asynchronous",
+    "compressed",
+    "shared",
+)
+
+__all__ = list(_EXPORTS) + list(_SUBMODULES)
+
+
+def __getattr__(name):
+    """Import submodules and their public functions on first access."""
+    if name in _SUBMODULES:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    if name in _EXPORTS:
+        module = importlib.import_module("." + _EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
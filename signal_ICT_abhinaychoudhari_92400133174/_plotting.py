@@ -0,0 +1,50 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/_plotting.py
+"""
+Optional plotting helpers shared by the signal generators
+
+matplotlib is imported inside each helper, so it is only loaded when a
+caller explicitly asks for a plot (``plot=True``). Long signals are reduced
+to their per-pixel min/max envelope first (see the plotting module).
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+
+def plot_discrete(n, signal, title):
+    """
+    Stem-plot a discrete-time signal.
+
+    Parameters:
+        n (array-like): Sample indices
+        signal (array-like): Signal values
+        title (str): Plot title
+    """
+    import matplotlib.pyplot as plt
+
+    from .plotting import Panel
+
+    plt.figure(figsize=(10, 4))
+    Panel(title, 'n (sample index)').stem(n, signal, basefmt='b-').draw(plt.gca())
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_continuous(t, signal, title):
+    """
+    Line-plot a continuous-time signal.
+
+    Parameters:
+        t (array-like): Time vector
+        signal (array-like): Signal values, or a (channels, samples) bank
+        title (str): Plot title
+    """
+    import matplotlib.pyplot as plt
+
+    from .plotting import Panel
+
+    # One line per channel of a (channels..., samples) bank
+    plt.figure(figsize=(10, 4))
+    Panel(title, 'Time (s)').line(t, signal, linewidth=2).draw(plt.gca())
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,321 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/asynchronous.py
+"""
+asyncio streaming module
+
+Async counterparts of the generators, operations and block pipeline, for
+services built on asyncio, where a long NumPy call would block the event
+loop:
+
+    offload        - await any generator or operation, computed in an executor
+    generate       - async iterator over blocks of a whole-array generator
+    stream         - async iterator over a block iterator (sine_wave_stream, ...)
+    AsyncPipeline  - pipeline stages applied to an async block stream
+
+Blocks of at least ``offload`` samples are computed in an executor (the
+loop's default thread pool unless one is given); NumPy releases the GIL
+in its loops, so the event loop keeps running meanwhile. Smaller blocks are
+computed inline, because the hop to a thread would cost more than the
+block. The caller's context is carried into the executor, so a
+dtype_policy or deferred() block still applies.
+
+AsyncPipeline runs its source and stages in a producer task that feeds a
+bounded queue. When the consumer falls behind, the queue fills and the
+producer waits, so at most queue_size processed blocks are ever buffered
+and the source is not read ahead of demand: slow consumers apply
+backpressure all the way to the source. Blocks are queued in their own
+float dtype (or that of the dtype policy), never promoted to float64.
+
+``measure_latency`` is a load harness. It feeds a paced sine stream through a
+Delay + Multiply pipeline to an in-process consumer and reports
+end-to-end latency percentiles, event-loop lag and buffered blocks.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import asyncio
+import collections
+import contextvars
+import functools
+import time
+
+import numpy as np
+
+from . import pipeline, precision, trigonometric_signals
+from .instrumentation import PERCENTILES
+
+# Samples per block of generate() and of the latency harness
+DEFAULT_BLOCK_SIZE = 65536
+
+# Blocks of at least this many samples are computed in the executor
+OFFLOAD_SAMPLES = 16384
+
+# Processed blocks an AsyncPipeline buffers ahead of its consumer
+DEFAULT_QUEUE_SIZE = 4
+
+# Interval of the harness's event-loop lag probe, in seconds
+_PROBE_INTERVAL = 0.001
+
+# Marks the end of an AsyncPipeline's queue
+_DONE = object()
+
+
+async def offload(func, *args, executor=None, **kwargs):
+    """
+    Call func(*args, **kwargs) in an executor and await its result.
+
+    Parameters:
+        func (callable): Generator or operation, e.g. signal_addition
+        *args, **kwargs: Its arguments
+        executor (concurrent.futures.Executor): Where to run it (default:
+            the event loop's default thread pool)
+
+    Returns:
+        The function's result
+    """
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+async def _compute(size, offload_samples, executor, func, *args):
+    """Run func(*args) in the executor for blocks of offload_samples or more, else inline."""
+    if size >= offload_samples:
+        return await offload(func, *args, executor=executor)
+    await asyncio.sleep(0)  # let other tasks run between inline blocks
+    return func(*args)
+
+
+async def generate(generator, *args, block_size=DEFAULT_BLOCK_SIZE, executor=None,
+                   offload_samples=OFFLOAD_SAMPLES, **kwargs):
+    """
+    Yield a whole-array generator's output block by block.
+
+    The time grid is passed as the keyword t= or n= (as named by the
+    generator) and sliced into blocks; each block is the generator called
+    on its slice, so the concatenated blocks equal the whole-array call.
+
+    Parameters:
+        generator (callable): e.g. sine_wave or unit_step
+        *args: The generator's other positional arguments (A, f, phi, ...)
+        block_size (int): Samples per block
+        executor (concurrent.futures.Executor): Executor for large blocks
+        offload_samples (int): Smallest block computed in the executor
+        **kwargs: t= or n= grid, and further keyword arguments
+
+    Yields:
+        numpy.ndarray: Consecutive output blocks
+    """
+    names = [name for name in ('t', 'n') if name in kwargs]
+    if len(names) != 1:
+        raise ValueError("Pass the time grid as exactly one of t= or n=")
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, got {block_size}")
+    name = names[0]
+    grid = np.asarray(kwargs.pop(name))
+    call = functools.partial(generator, *args, **kwargs)
+    for start in range(0, grid.shape[-1], block_size):
+        part = grid[..., start:start + block_size]
+        yield await _compute(part.size, offload_samples, executor,
+                             functools.partial(call, **{name: part}))
+
+
+async def stream(blocks, executor=None, offload_samples=OFFLOAD_SAMPLES):
+    """
+    Yield the blocks of a synchronous block iterator without blocking the loop.
+
+    Each block is computed by next() in the executor once the previous
+    block was of at least offload_samples samples, inline otherwise.
+
+    Parameters:
+        blocks (iterable): e.g. sine_wave_stream(2, 5, 0, fs, block_size=65536)
+        executor (concurrent.futures.Executor): Executor for large blocks
+        offload_samples (int): Smallest block computed in the executor
+
+    Yields:
+        numpy.ndarray: The iterator's blocks
+    """
+    iterator = iter(blocks)
+    size = offload_samples
+    while True:
+        block = await _compute(size, offload_samples, executor, next, iterator, _DONE)
+        if block is _DONE:
+            return
+        size = np.size(block)
+        yield block
+
+
+class AsyncPipeline:
+    """
+    Pipeline stages applied to a block stream, consumed with ``async for``.
+
+    The output blocks are copies, owned by the consumer. Stages keep their
+    state across blocks exactly as in a synchronous Pipeline, so the
+    concatenated outputs equal the synchronous result.
+
+    Parameters:
+        source (async or sync iterable): Input blocks (sync iterables are
+            read through stream())
+        stages (iterable of Stage, or Pipeline): Stages in processing order
+        executor (concurrent.futures.Executor): Executor for large blocks
+        queue_size (int): Processed blocks buffered ahead of the consumer
+        offload_samples (int): Smallest block processed in the executor
+        dtype (numpy dtype): Dtype blocks are processed and queued in
+            (default: the dtype policy in effect, else each block's own
+            float dtype, float64 for integer blocks); build the stages with
+            the same dtype
+
+    Attributes:
+        max_depth (int): Most blocks buffered at once so far
+    """
+
+    __slots__ = ('source', 'pipeline', 'executor', 'queue_size', 'offload_samples', 'dtype', 'max_depth')
+
+    def __init__(self, source, stages=(), executor=None, queue_size=DEFAULT_QUEUE_SIZE,
+                 offload_samples=OFFLOAD_SAMPLES, dtype=None):
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self.source = source
+        self.pipeline = stages if isinstance(stages, pipeline.Pipeline) else pipeline.Pipeline(stages)
+        self.executor = executor
+        self.queue_size = int(queue_size)
+        self.offload_samples = int(offload_samples)
+        self.dtype = precision.resolve(dtype)
+        self.max_depth = 0
+
+    def _process(self, block):
+        output = self.pipeline.process(block)
+        # Length-preserving stages return the block itself; others their own buffer
+        return output if np.may_share_memory(output, block) else output.copy()
+
+    async def _produce(self, queue):
+        source = self.source
+        if not hasattr(source, '__aiter__'):
+            source = stream(source, self.executor, self.offload_samples)
+        try:
+            async for block in source:
+                block = np.asarray(block)
+                dtype = self.dtype
+                if dtype is None:
+                    dtype = block.dtype if block.dtype.kind in 'fc' else np.dtype(float)
+                block = np.array(block, dtype=dtype)  # stages work in place, on a copy we own
+                output = await _compute(len(block), self.offload_samples, self.executor,
+                                        self._process, block)
+                await queue.put(output)
+                self.max_depth = max(self.max_depth, queue.qsize())
+        except Exception as error:
+            await queue.put(error)
+        else:
+            await queue.put(_DONE)
+
+    async def __aiter__(self):
+        queue = asyncio.Queue(self.queue_size)
+        producer = asyncio.create_task(self._produce(queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+
+async def _paced(blocks, rate, stamps):
+    """Yield blocks at most rate per second, recording when each one is ingested."""
+    loop = asyncio.get_running_loop()
+    due = loop.time()
+    for block in blocks:
+        if rate:
+            due += 1.0 / rate
+            await asyncio.sleep(max(due - loop.time(), 0))
+        stamps.append(time.perf_counter())
+        yield block
+
+
+async def _probe(lags, stop):
+    """Record how late the event loop wakes a task that sleeps _PROBE_INTERVAL."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - _PROBE_INTERVAL)
+
+
+def _summary(values):
+    values = np.asarray(values, dtype=float)
+    if not values.size:
+        values = np.zeros(1)
+    quantiles = np.percentile(values, PERCENTILES)
+    return {**{f'p{p}_seconds': float(q) for p, q in zip(PERCENTILES, quantiles)},
+            'max_seconds': float(values.max())}
+
+
+async def _harness(blocks, block_size, fs, rate, consumer_delay, queue_size, executor, offload_samples):
+    stamps = collections.deque()
+    latencies, lags = [], []
+    in_flight = 0
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    sine = trigonometric_signals.sine_wave_stream(2, 5, 0, fs, block_size, blocks * block_size)
+    source = _paced(sine, rate, stamps)
+    carrier = pipeline.Oscillator(2, 5, 0, fs, 'cosine', block_size)
+    stages = [pipeline.Delay(5, block_size), pipeline.Multiply(carrier, block_size)]
+    flow = AsyncPipeline(source, stages, executor, queue_size, offload_samples)
+    start = time.perf_counter()
+    received = 0
+    try:
+        async for block in flow:
+            in_flight = max(in_flight, len(stamps))
+            latencies.append(time.perf_counter() - stamps.popleft())
+            received += len(block)
+            if consumer_delay:
+                await asyncio.sleep(consumer_delay)
+    finally:
+        stop.set()
+        await probe
+    seconds = time.perf_counter() - start
+    return {
+        'blocks': len(latencies), 'samples': received, 'seconds': seconds,
+        'samples_per_second': received / seconds if seconds else float('inf'),
+        'latency': _summary(latencies), 'loop_lag': _summary(lags),
+        'max_in_flight': in_flight, 'max_queue_depth': flow.max_depth, 'queue_size': queue_size,
+    }
+
+
+def measure_latency(blocks=200, block_size=DEFAULT_BLOCK_SIZE, fs=48000.0, rate=None, consumer_delay=0.0,
+                    queue_size=DEFAULT_QUEUE_SIZE, executor=None, offload_samples=OFFLOAD_SAMPLES):
+    """
+    Measure end-to-end latency of an AsyncPipeline under load.
+
+    A paced ingest source emits sine blocks, a Delay + Multiply pipeline
+    (time_shift and signal_multiplication with a cosine carrier) processes
+    them, and an in-process consumer receives them, optionally taking
+    consumer_delay per block to act as a slow client. A probe task measures
+    how late the event loop runs meanwhile.
+
+    Parameters:
+        blocks (int): Blocks to push through
+        block_size (int): Samples per block
+        fs (float): Sample rate of the stream
+        rate (float): Ingest rate in blocks per second (None: as fast as possible)
+        consumer_delay (float): Seconds the consumer spends per block
+        queue_size (int): AsyncPipeline queue bound
+        executor (concurrent.futures.Executor): Executor for large blocks
+        offload_samples (int): Smallest block processed in the executor
+
+    Returns:
+        dict: blocks, samples, seconds and samples_per_second; latency and
+        loop_lag percentiles (ingest to receipt, and probe lateness);
+        max_in_flight (most blocks ingested but not yet received),
+        max_queue_depth and queue_size
+    """
+    if blocks < 1 or block_size < 1:
+        raise ValueError("blocks and block_size must be at least 1")
+    return asyncio.run(_harness(blocks, block_size, fs, rate, consumer_delay, queue_size, executor,
+                                offload_samples))
@@ -0,0 +1,183 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/batch.py
+"""
+Headless batch mode of the signal-demo entry point
+
+Runs the demonstration's generators and operations at a requested scale,
+without matplotlib or any prompt, so signal-demo can serve as a load
+driver. Each task is timed over --repeat runs (the best is reported)
+and its throughput is printed as samples/s of output and MB/s of input plus
+output. Peak memory is the tracemalloc peak above the memory held
+before the task. Results are written to the output directory as .npy
+files, with the metrics in summary.json.
+
+Every task runs under the requested dtype policy (see the precision
+module), so each output, and the throughput and .npy file reported for
+it, is in that dtype. Inputs are built once, outside the timings, in the
+policy's compute dtype (float16 runs generate from float32 grids and
+int64 indices, which float16 cannot hold exactly), and released as soon as
+no remaining task needs them, so memory stays a few signal sizes whatever
+the number of tasks.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import collections
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import operations, parallel, precision, trigonometric_signals, unitary_signals
+
+DEFAULT_SAMPLES = 10 ** 6
+
+DEFAULT_REPEAT = 3
+
+DTYPES = ('float16', 'float32', 'float64')
+
+# Task name -> (input names, call(inputs, workers)); the demonstration's tasks at scale
+TASKS = {
+    'unit_step': (('n',), lambda d, w: unitary_signals.unit_step(d['n'], workers=w)),
+    'unit_impulse': (('n',), lambda d, w: unitary_signals.unit_impulse(d['n'], workers=w)),
+    'ramp_signal': (('n',), lambda d, w: unitary_signals.ramp_signal(d['n'], workers=w)),
+    'sine_wave': (('t',), lambda d, w: trigonometric_signals.sine_wave(2, 5, 0, d['t'], workers=w)),
+    'cosine_wave': (('t',), lambda d, w: trigonometric_signals.cosine_wave(2, 5, 0, d['t'], workers=w)),
+    'exponential_signal': (('t',), lambda d, w: trigonometric_signals.exponential_signal(1, -2, d['t'], workers=w)),
+    'time_shift': (('sine',), lambda d, w: operations.time_shift(d['sine'], 5)),
+    'time_scale': (('sine',), lambda d, w: operations.time_scale(d['sine'], 2)),
+    'signal_addition': (('step', 'ramp'), lambda d, w: operations.signal_addition(d['step'], d['ramp'], workers=w)),
+    'signal_multiplication': (('sine', 'cosine'),
+                              lambda d, w: operations.signal_multiplication(d['sine'], d['cosine'], workers=w)),
+}
+
+
+def _index(samples, dtype):
+    """Index vector of the given float dtype (int64 if float16, which cannot hold it)."""
+    n = np.arange(-(samples // 2), samples - samples // 2)
+    return n if np.dtype(dtype) == np.float16 else n.astype(dtype)
+
+
+def _make_input(name, samples, dtype, workers):
+    """Build one named task input (call under the dtype policy)."""
+    compute = precision.compute_dtype(dtype)
+    if name == 'n':
+        return _index(samples, dtype)
+    if name == 't':
+        return np.linspace(0, 1, samples, dtype=compute)
+    t = np.linspace(0, 1, samples, dtype=compute)
+    if name in ('sine', 'cosine'):
+        generator = trigonometric_signals.sine_wave if name == 'sine' else trigonometric_signals.cosine_wave
+        return generator(2, 5, 0, t, workers=workers)
+    n = _index(samples, dtype)
+    if name == 'step':
+        return unitary_signals.unit_step(n, workers=workers)
+    return unitary_signals.ramp_signal(n, workers=workers)
+
+
+def _time_task(call, inputs, workers, repeat):
+    """Return the last result, the best and mean seconds and the peak bytes of repeat calls."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if hasattr(tracemalloc, 'reset_peak'):  # Python >= 3.9
+        tracemalloc.reset_peak()
+    times = []
+    try:
+        for _ in range(repeat):
+            result = None  # release the previous run's output before the next one
+            start = time.perf_counter()
+            result = call(inputs, workers)
+            times.append(time.perf_counter() - start)
+    finally:
+        peak = tracemalloc.get_traced_memory()[1]
+        if started:
+            tracemalloc.stop()
+    return result, min(times), sum(times) / len(times), max(peak - before, 0)
+
+
+def run(samples=DEFAULT_SAMPLES, dtype='float64', workers=None, repeat=DEFAULT_REPEAT, output=None,
+        tasks=None, stream=None):
+    """
+    Run the batch tasks and print their throughput.
+
+    Parameters:
+        samples (int): Samples per generated signal
+        dtype (str): Dtype policy every task runs under: 'float16',
+            'float32' or 'float64'
+        workers (int): Threads per generator/operation (default: serial)
+        repeat (int): Timed runs per task
+        output (str): Directory for <task>.npy results and summary.json
+            (created if needed; nothing is written if None)
+        tasks (sequence of str): Task names (default: all of TASKS)
+        stream (file): Where the report is printed (default: sys.stdout)
+
+    Returns:
+        list: One metrics dict per task
+    """
+    stream = sys.stdout if stream is None else stream
+    tasks = list(TASKS) if tasks is None else list(tasks)
+    unknown = [name for name in tasks if name not in TASKS]
+    if unknown:
+        raise ValueError(f"Unknown task(s) {unknown}; expected some of {list(TASKS)}")
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}")
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype {dtype!r}; expected one of {DTYPES}")
+    if workers is not None:
+        parallel.check_workers(workers)
+    if output is not None:
+        os.makedirs(output, exist_ok=True)
+
+    remaining = collections.Counter(name for task in tasks for name in TASKS[task][0])
+    inputs = {}
+    results = []
+    print("=" * 80, file=stream)
+    print(f"BATCH MODE: {samples} samples, {dtype}, workers={workers}, repeat={repeat}", file=stream)
+    print("=" * 80, file=stream)
+    print(f"{'Task':>22} {'Samples':>11} {'Best s':>9} {'Msamples/s':>11} {'MB/s':>9} {'Peak MB':>9}",
+          file=stream)
+    for task in tasks:
+        names, call = TASKS[task]
+        # A float16 ramp saturates to inf past 65504 (see the precision module)
+        with precision.dtype_policy(dtype), np.errstate(over='ignore'):
+            for name in names:
+                if name not in inputs:
+                    inputs[name] = _make_input(name, samples, dtype, workers)
+            result, best, mean, peak = _time_task(call, inputs, workers, repeat)
+        result = np.asarray(result)
+        moved = sum(inputs[name].nbytes for name in names) + result.nbytes
+        metrics = {
+            'task': task, 'samples': int(result.size), 'dtype': str(result.dtype),
+            'best_seconds': best, 'mean_seconds': mean,
+            'samples_per_second': result.size / best if best else float('inf'),
+            'mb_per_second': moved / best / 1e6 if best else float('inf'),
+            'peak_bytes': int(peak),
+        }
+        if output is not None:
+            path = os.path.join(output, f"{task}.npy")
+            np.save(path, result)
+            metrics['path'] = path
+        results.append(metrics)
+        print(f"{task:>22} {result.size:11d} {best:9.4f} {metrics['samples_per_second'] / 1e6:11.1f} "
+              f"{metrics['mb_per_second']:9.1f} {peak / 1e6:9.1f}", file=stream)
+        del result
+        for name in names:
+            remaining[name] -= 1
+            if not remaining[name]:
+                del inputs[name]
+
+    if output is not None:
+        summary = {'samples': samples, 'dtype': dtype, 'workers': workers, 'repeat': repeat,
+                   'numpy': np.__version__, 'tasks': results}
+        path = os.path.join(output, 'summary.json')
+        with open(path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nResults written to {output}", file=stream)
+    return results
@@ -0,0 +1,261 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/cache.py
+"""
+Generated-signal cache module
+
+An opt-in memoization cache in front of sine_wave, cosine_wave,
+exponential_signal and the unitary generators. While it is enabled
+(``enable()`` or ``with caching():``), a call whose parameters and time
+grid match an earlier call returns the stored array instead of
+regenerating it. Cached arrays are read-only, because every caller shares
+them. Entries are evicted least-recently-used once the cache exceeds its
+byte budget; ``stats()`` reports hits, misses and evictions.
+
+Keys combine the generator, its parameters (array parameters by a digest
+of their bytes), the dtype policy in effect and a fingerprint of the time
+grid: its shape, dtype and a SHA-256 digest of every sample, so grids that
+differ anywhere never share an entry. (SHA-256 rather than BLAKE2b because
+most CPUs accelerate it in hardware.) Hashing a grid costs about half a
+regeneration, so it is done once per read-only grid: the digest is
+remembered by the array's identity (a weak reference) for as long as the
+array and every array it views stay read-only. Writeable grids are hashed
+on every call; freeze(t) returns a read-only grid so lookups cost O(1).
+
+Calls with ``plot=True``, ``out=`` or ``compact=True``, and calls inside
+``deferred()``, always bypass the cache.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import collections
+import contextlib
+import functools
+import hashlib
+import inspect
+import threading
+import weakref
+
+import numpy as np
+
+from . import expression, precision
+
+# Default byte budget of the cache
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Arguments that do not change the generated values
+_IGNORED = ('plot', 'out', 'workers')
+
+# Fingerprints of read-only grids: id(grid) -> (weak reference, fingerprint)
+_grid_fingerprints = {}
+_grid_lock = threading.Lock()
+
+
+class SignalCache:
+    """
+    Byte-budgeted LRU store of generated arrays.
+
+    Parameters:
+        max_bytes (int): Largest total size of the cached arrays
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached array for key (and mark it recently used), or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a read-only array, evicting least-recently-used entries to fit."""
+        if value.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = value
+            self.nbytes += value.nbytes
+            self._evict()
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._entries:
+            _, value = self._entries.popitem(last=False)
+            self.nbytes -= value.nbytes
+            self.evictions += 1
+
+    def resize(self, max_bytes):
+        """Change the byte budget, evicting entries that no longer fit."""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self):
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return hits, misses, evictions, entries, bytes and max_bytes as a dict."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'entries': len(self._entries), 'bytes': self.nbytes, 'max_bytes': self.max_bytes}
+
+
+_cache = SignalCache()
+_enabled = False
+
+
+def enable(max_bytes=None):
+    """Turn the cache on, optionally with a new byte budget."""
+    global _enabled
+    if max_bytes is not None:
+        _cache.resize(max_bytes)
+    _enabled = True
+
+
+def disable():
+    """Turn the cache off (entries are kept until clear())."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Return True while the cache is on."""
+    return _enabled
+
+
+@contextlib.contextmanager
+def caching(max_bytes=None):
+    """Context manager that enables the cache and restores the previous state on exit."""
+    previous = _enabled
+    enable(max_bytes)
+    try:
+        yield _cache
+    finally:
+        if not previous:
+            disable()
+
+
+def stats():
+    """Return the cache statistics (see SignalCache.stats)."""
+    return _cache.stats()
+
+
+def clear():
+    """Drop every cached signal and reset the statistics."""
+    _cache.clear()
+
+
+def _digest(array):
+    """SHA-256 of an array's samples, hashed in place rather than through a tobytes() copy."""
+    return hashlib.sha256(np.ascontiguousarray(array).reshape(-1).view(np.uint8)).digest()
+
+
+def _immutable(array):
+    """True if neither array nor any array it views is writeable."""
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return array is None or isinstance(array, bytes)
+
+
+def _forget(ident, ref):
+    with _grid_lock:
+        if _grid_fingerprints.get(ident, (None,))[0] is ref:
+            del _grid_fingerprints[ident]
+
+
+def fingerprint(grid):
+    """
+    Identity of a time grid: shape, dtype and a digest of all its samples.
+
+    A read-only grid is hashed once; its fingerprint is then looked up by
+    identity until the array is garbage collected. Writeable grids are
+    hashed on every call.
+    """
+    if not isinstance(grid, np.ndarray) or not _immutable(grid):
+        grid = np.asarray(grid)
+        return grid.shape, grid.dtype.str, _digest(grid)
+    with _grid_lock:
+        ref, key = _grid_fingerprints.get(id(grid), (None, None))
+    if ref is not None and ref() is grid:
+        return key
+    key = grid.shape, grid.dtype.str, _digest(grid)
+    ref = weakref.ref(grid, functools.partial(_forget, id(grid)))
+    with _grid_lock:
+        _grid_fingerprints[id(grid)] = ref, key
+    return key
+
+
+def freeze(grid):
+    """
+    Return a time grid as a read-only array, so cache lookups hash it only once.
+
+    A grid that is already read-only is returned as is; otherwise a
+    read-only copy is returned and the caller's array is left untouched.
+    """
+    grid = np.asarray(grid)
+    if not _immutable(grid):
+        grid = grid.copy()
+        grid.setflags(write=False)
+    return grid
+
+
+def _freeze(value):
+    """Hashable, type-aware form of a generator parameter."""
+    if isinstance(value, (bool, int, float, complex, str, type(None))):
+        return type(value).__name__, value
+    if isinstance(value, (np.dtype, type)):
+        return 'dtype', np.dtype(value).str
+    value = np.asarray(value)
+    return value.shape, value.dtype.str, _digest(value)
+
+
+def memoize(grid_name):
+    """
+    Decorator routing a generator through the cache while it is enabled.
+
+    Parameters:
+        grid_name (str): Name of the time-grid parameter ('t' or 'n')
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled or expression.is_deferred():
+                return func(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            arguments = arguments.arguments
+            if arguments.get('plot') or arguments.get('compact') or arguments.get('out') is not None:
+                return func(*args, **kwargs)
+            key = (func.__module__, func.__qualname__, fingerprint(arguments[grid_name]),
+                   tuple((name, _freeze(value)) for name, value in arguments.items()
+                         if name != grid_name and name not in _IGNORED),
+                   _freeze(precision.get_default_dtype()))
+            signal = _cache.get(key)
+            if signal is None:
+                signal = func(*args, **kwargs)
+                signal.setflags(write=False)
+                _cache.put(key, signal)
+            return signal
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,484 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/compressed.py
+"""
+Compressed signal container module
+
+Stores 1-D signals in a chunked, compressed container file (``.sigz``):
+
+    header   - magic, format version and JSON metadata (dtype, chunk size,
+               codec, filters, sample rate and start time)
+    records  - one per chunk of chunk_size samples (the last may be
+               shorter): compressed size, sample count and payload
+    index    - byte offset of every record, then a trailer locating it
+
+Every chunk is compressed on its own with a standard-library codec (zlib
+or lzma), so sample k lives in chunk k // chunk_size and any sample or
+time range is read by seeking straight to its chunks and decoding only
+those. Several chunks can be decoded on the thread pool (``workers=``);
+zlib and lzma release the GIL while they work.
+
+Before compression, each chunk's samples are viewed as unsigned integers
+and optionally delta-encoded (``delta=True``, for smooth signals such as
+sine_wave output, ramps and steps), then byte-shuffled so bytes of equal
+significance sit together (``shuffle=True``). Both filters are exact: the
+decoded samples are bit-identical to those written.
+
+CompressedWriter only ever appends. It buffers up to one chunk, so blocks
+of any size from the streaming generators (sine_wave_stream, Pipeline
+output, ...) can be written as they are produced, and the index is
+written on close. A file whose writer never closed still opens: its
+records are scanned instead, and append=True resumes writing it.
+
+A CompressedSignal is an expression node (see the expression module), so
+it can be passed to the operations, outofcore.save or spectral.welch and
+is decoded chunk by chunk.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import json
+import lzma
+import math
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from . import expression, parallel
+
+# Default samples per chunk
+DEFAULT_CHUNK_SIZE = 65536
+
+# Format version written to the header
+FORMAT_VERSION = 1
+
+# Codec name -> (compress(data, level), decompress(data), default level)
+_CODECS = {
+    'zlib': (lambda data, level: zlib.compress(data, level), zlib.decompress, 6),
+    'lzma': (lambda data, level: lzma.compress(data, preset=level), lzma.decompress, 1),
+    'none': (lambda data, level: bytes(data), bytes, 0),
+}
+
+# Header: magic, version, metadata bytes (the JSON metadata follows)
+_HEADER = struct.Struct('<4sHI')
+_MAGIC = b'SIGZ'
+
+# Record header: compressed bytes, samples
+_RECORD = struct.Struct('<II')
+
+# Trailer: index offset, chunks, samples, magic (the index precedes it)
+_TRAILER = struct.Struct('<QQQ4s')
+_END = b'SIGE'
+
+
+def _lanes(dtype):
+    """Unsigned integer dtype the filters view samples of dtype as."""
+    size = dtype.itemsize // 2 if dtype.kind == 'c' else dtype.itemsize
+    return np.dtype(f'u{size}')
+
+
+def _encode(chunk, codec, level, delta, shuffle):
+    """Filter and compress one chunk of samples."""
+    lanes = np.ascontiguousarray(chunk).view(_lanes(chunk.dtype))
+    if delta:
+        lanes = np.diff(lanes, prepend=lanes.dtype.type(0))  # wraps around, so it is exact
+    if shuffle and lanes.itemsize > 1:
+        lanes = lanes.view(np.uint8).reshape(-1, lanes.itemsize).T
+    return _CODECS[codec][0](np.ascontiguousarray(lanes).data, level)
+
+
+def _decode(payload, samples, dtype, codec, delta, shuffle):
+    """Decompress and unfilter one chunk into a new array of samples."""
+    lanes_dtype = _lanes(dtype)
+    raw = np.frombuffer(_CODECS[codec][1](payload), dtype=np.uint8)
+    if shuffle and lanes_dtype.itemsize > 1:
+        raw = raw.reshape(lanes_dtype.itemsize, -1).T
+    lanes = np.array(raw, order='C').view(lanes_dtype).reshape(-1)
+    if delta:
+        np.cumsum(lanes, out=lanes)
+    chunk = lanes.view(dtype)
+    if len(chunk) != samples:
+        raise ValueError(f"Corrupt chunk: {len(chunk)} samples decoded, {samples} recorded")
+    return chunk
+
+
+def _check_options(dtype, chunk_size, codec, level):
+    if dtype.hasobject or dtype.kind not in 'biufc':
+        raise ValueError(f"Cannot store samples of dtype {dtype}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown codec {codec!r}; expected one of {tuple(_CODECS)}")
+    return _CODECS[codec][2] if level is None else int(level)
+
+
+def _read_layout(f):
+    """Return (metadata, record offsets + end, length, closed) of an open container file."""
+    head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        raise ValueError("Not a compressed signal file (too short)")
+    magic, version, size = _HEADER.unpack(head)
+    if magic != _MAGIC:
+        raise ValueError("Not a compressed signal file (bad magic)")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    metadata = json.loads(f.read(size).decode('utf-8'))
+    start = _HEADER.size + size
+    end = f.seek(0, os.SEEK_END)
+    if end - start >= _TRAILER.size:
+        f.seek(end - _TRAILER.size)
+        index_offset, count, length, tail = _TRAILER.unpack(f.read(_TRAILER.size))
+        if tail == _END and index_offset + 8 * count + _TRAILER.size == end:
+            f.seek(index_offset)
+            offsets = np.frombuffer(f.read(8 * count), dtype='<u8').astype(np.int64)
+            return metadata, np.append(offsets, index_offset), length, True
+    # No index: the writer did not close, so scan the complete records
+    offsets, length, position = [], 0, start
+    f.seek(start)
+    while True:
+        record = f.read(_RECORD.size)
+        if len(record) < _RECORD.size:
+            break
+        nbytes, samples = _RECORD.unpack(record)
+        if position + _RECORD.size + nbytes > end or samples > metadata['chunk_size']:
+            break
+        offsets.append(position)
+        length += samples
+        position = f.seek(nbytes, os.SEEK_CUR)
+    offsets.append(position)
+    return metadata, np.asarray(offsets, dtype=np.int64), length, False
+
+
+class CompressedSignal(expression.Expr):
+    """
+    A 1-D signal stored in a compressed container file.
+
+    Parameters:
+        path (str or PathLike): Container file
+
+    Attributes:
+        chunk_size (int): Samples per chunk
+        codec (str): 'zlib', 'lzma' or 'none'
+        delta, shuffle (bool): Filters applied before compression
+        fs (float or None): Sample rate in Hz, if recorded
+        start_time (float): Time of sample 0 in seconds
+        closed (bool): False if the writer did not close (the index was rebuilt by scanning)
+    """
+
+    __slots__ = ('path', 'chunk_size', 'codec', 'level', 'delta', 'shuffle', 'fs', 'start_time',
+                 'closed', '_offsets', '_last')
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as f:
+            metadata, self._offsets, self.length, self.closed = _read_layout(f)
+        self.dtype = np.dtype(metadata['dtype'])
+        self.chunk_size = int(metadata['chunk_size'])
+        self.codec = metadata['codec']
+        self.level = metadata['level']
+        self.delta = metadata['delta']
+        self.shuffle = metadata['shuffle']
+        self.fs = metadata['fs']
+        self.start_time = metadata['start_time']
+        self._last = None
+
+    def __repr__(self):
+        return (f"CompressedSignal({self.path!r}, samples={self.length}, dtype={self.dtype}, "
+                f"codec={self.codec!r}, ratio={self.ratio:.1f})")
+
+    @property
+    def chunks(self):
+        """Number of chunks."""
+        return len(self._offsets) - 1
+
+    @property
+    def compressed_bytes(self):
+        """Bytes taken by the chunk records."""
+        return int(self._offsets[-1] - self._offsets[0])
+
+    @property
+    def ratio(self):
+        """Uncompressed sample bytes per stored byte."""
+        return self.length * self.dtype.itemsize / max(self.compressed_bytes, 1)
+
+    def _decode_records(self, data, base, k):
+        position = int(self._offsets[k]) - base
+        nbytes, samples = _RECORD.unpack_from(data, position)
+        start = position + _RECORD.size
+        return _decode(data[start:start + nbytes], samples, self.dtype, self.codec,
+                       self.delta, self.shuffle)
+
+    def _cached(self, k):
+        """Decode chunk k, reusing the last chunk decoded (the result is shared)."""
+        last = self._last
+        if last is not None and last[0] == k:
+            return last[1]
+        base = int(self._offsets[k])
+        with open(self.path, 'rb') as f:
+            f.seek(base)
+            data = memoryview(f.read(int(self._offsets[k + 1]) - base))
+        samples = self._decode_records(data, base, k)
+        self._last = (k, samples)
+        return samples
+
+    def chunk(self, k):
+        """
+        Decode chunk k (samples [k * chunk_size, (k + 1) * chunk_size)).
+
+        Returns:
+            numpy.ndarray: The chunk's samples (a new array)
+        """
+        if not 0 <= k < self.chunks:
+            raise IndexError(f"Chunk {k} out of range for {self.chunks} chunks")
+        return self._cached(k).copy()
+
+    def read(self, start=0, stop=None, workers=None, out=None):
+        """
+        Read samples [start, stop), decoding only the chunks they fall in.
+
+        The chunks' records are read from disk in one pass; with workers > 1
+        they are decoded on the thread pool.
+
+        Parameters:
+            start, stop (int): Sample range, within [0, len(self)] (stop
+                defaults to the end)
+            workers (int): Threads decoding chunks (None or 1 decodes serially)
+            out (numpy.ndarray): Preallocated output of stop - start samples
+
+        Returns:
+            numpy.ndarray: The samples
+        """
+        stop = self.length if stop is None else stop
+        if not 0 <= start <= stop <= self.length:
+            raise ValueError(f"Sample range [{start}, {stop}) not within [0, {self.length}]")
+        if out is None:
+            out = np.empty(stop - start, dtype=self.dtype)
+        elif out.shape != (stop - start,):
+            raise ValueError(f"out has shape {out.shape}, expected {(stop - start,)}")
+        if start == stop:
+            return out
+        size = self.chunk_size
+        first, last = start // size, (stop - 1) // size
+        if first == last:
+            # Reads within one chunk (e.g. by expression evaluation) reuse its decoding
+            out[:] = self._cached(first)[start - first * size:stop - first * size]
+            return out
+        base = int(self._offsets[first])
+        with open(self.path, 'rb') as f:
+            f.seek(base)
+            data = memoryview(f.read(int(self._offsets[last + 1]) - base))
+
+        def decode(k):
+            samples = self._decode_records(data, base, k)
+            lo, hi = max(start, k * size), min(stop, (k + 1) * size)
+            out[lo - start:hi - start] = samples[lo - k * size:hi - k * size]
+
+        parallel.for_each(decode, range(first, last + 1), workers)
+        return out
+
+    def sample_range(self, t_start, t_stop):
+        """Return the sample range [start, stop) of times in [t_start, t_stop)."""
+        if not self.fs:
+            raise ValueError("The file records no sample rate; use read() with sample indices")
+
+        def bound(t):
+            # First sample at or after t (with a tolerance for rounding of t)
+            return min(max(math.ceil((t - self.start_time) * self.fs - 1e-9), 0), self.length)
+
+        start = bound(t_start)
+        return start, max(bound(t_stop), start)
+
+    def time_range(self, t_start, t_stop, workers=None):
+        """
+        Read the samples whose times fall in [t_start, t_stop).
+
+        Parameters:
+            t_start, t_stop (float): Time range in seconds
+            workers (int): Threads decoding chunks
+
+        Returns:
+            tuple: (t, samples), the sample times and values
+        """
+        start, stop = self.sample_range(t_start, t_stop)
+        t = self.start_time + np.arange(start, stop) / self.fs
+        return t, self.read(start, stop, workers)
+
+    def _chunk(self, i, j):
+        return self.read(i, j)
+
+
+class CompressedWriter:
+    """
+    Append-only writer of a compressed container file.
+
+    Samples are buffered until a whole chunk is available, then compressed
+    and appended; close() writes the remaining partial chunk and the index.
+    Use as a context manager.
+
+    Parameters:
+        path (str or PathLike): Container file (created or truncated, unless append)
+        dtype (numpy dtype): Sample dtype
+        chunk_size (int): Samples per chunk
+        codec (str): 'zlib', 'lzma' or 'none'
+        level (int): Compression level (default 6 for zlib, 1 for lzma)
+        delta (bool): Delta-encode samples (helps smooth signals)
+        shuffle (bool): Byte-shuffle samples (helps nearly all signals)
+        fs (float): Sample rate in Hz, enabling time-range reads
+        start_time (float): Time of sample 0 in seconds
+        append (bool): Continue an existing file with its own settings (the
+            other options are then ignored)
+    """
+
+    __slots__ = ('path', 'dtype', 'chunk_size', 'codec', 'level', 'delta', 'shuffle', 'fs',
+                 'start_time', 'length', '_file', '_offsets', '_buffer', '_filled')
+
+    def __init__(self, path, dtype=float, chunk_size=DEFAULT_CHUNK_SIZE, codec='zlib', level=None,
+                 delta=False, shuffle=True, fs=None, start_time=0.0, append=False):
+        self.path = os.fspath(path)
+        if append and os.path.exists(self.path):
+            self._resume()
+            return
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = int(chunk_size)
+        self.level = _check_options(self.dtype, self.chunk_size, codec, level)
+        self.codec = codec
+        self.delta, self.shuffle = bool(delta), bool(shuffle)
+        self.fs = None if fs is None else float(fs)
+        self.start_time = float(start_time)
+        metadata = json.dumps({
+            'dtype': self.dtype.str, 'chunk_size': self.chunk_size, 'codec': codec,
+            'level': self.level, 'delta': self.delta, 'shuffle': self.shuffle,
+            'fs': self.fs, 'start_time': self.start_time,
+        }).encode('utf-8')
+        self._file = open(self.path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(metadata)) + metadata)
+        self._offsets = []
+        self._buffer = np.empty(self.chunk_size, dtype=self.dtype)
+        self._filled = 0
+        self.length = 0
+
+    def _resume(self):
+        """Reopen an existing file: drop its index and reload a trailing partial chunk."""
+        signal = CompressedSignal(self.path)
+        self.dtype, self.chunk_size = signal.dtype, signal.chunk_size
+        self.codec, self.level = signal.codec, signal.level
+        self.delta, self.shuffle = signal.delta, signal.shuffle
+        self.fs, self.start_time = signal.fs, signal.start_time
+        self._offsets = [int(offset) for offset in signal._offsets[:-1]]
+        self._buffer = np.empty(self.chunk_size, dtype=self.dtype)
+        self._filled = 0
+        end = int(signal._offsets[-1])
+        if self._offsets and signal.length % self.chunk_size:
+            tail = signal.chunk(len(self._offsets) - 1)
+            self._filled = len(tail)
+            self._buffer[:self._filled] = tail
+            end = self._offsets.pop()
+        self.length = signal.length
+        self._file = open(self.path, 'r+b')
+        self._file.truncate(end)
+        self._file.seek(end)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _append(self, chunk):
+        payload = _encode(chunk, self.codec, self.level, self.delta, self.shuffle)
+        self._offsets.append(self._file.tell())
+        self._file.write(_RECORD.pack(len(payload), len(chunk)))
+        self._file.write(payload)
+
+    def write(self, block):
+        """
+        Append a block of samples (cast to the file's dtype).
+
+        Parameters:
+            block (array-like): 1-D samples, of any length
+        """
+        if self._file is None:
+            raise ValueError("Writing to a closed CompressedWriter")
+        block = np.asarray(block)
+        if block.ndim != 1:
+            raise ValueError(f"Blocks must be 1-D, got shape {block.shape}")
+        size, position = self.chunk_size, 0
+        if self._filled:
+            position = min(size - self._filled, len(block))
+            self._buffer[self._filled:self._filled + position] = block[:position]
+            self._filled += position
+            if self._filled == size:
+                self._append(self._buffer)
+                self._filled = 0
+        while len(block) - position >= size:
+            self._append(block[position:position + size].astype(self.dtype, copy=False))
+            position += size
+        rest = len(block) - position
+        self._buffer[self._filled:self._filled + rest] = block[position:]
+        self._filled += rest
+        self.length += len(block)
+
+    def extend(self, blocks):
+        """Append every block of an iterable, e.g. sine_wave_stream(...)."""
+        for block in blocks:
+            self.write(block)
+
+    def close(self):
+        """Write the partial chunk and the index, and close the file (idempotent)."""
+        if self._file is None:
+            return
+        try:
+            if self._filled:
+                self._append(self._buffer[:self._filled])
+                self._filled = 0
+            index_offset = self._file.tell()
+            self._file.write(np.asarray(self._offsets, dtype='<u8').tobytes())
+            self._file.write(_TRAILER.pack(index_offset, len(self._offsets), self.length, _END))
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def load(path):
+    """
+    Open a compressed container file (only its index is read).
+
+    Returns:
+        CompressedSignal: Expression node usable with the operations
+    """
+    return CompressedSignal(path)
+
+
+def save(signal, path, chunk_size=DEFAULT_CHUNK_SIZE, codec='zlib', level=None, delta=False,
+         shuffle=True, fs=None, start_time=0.0, dtype=None):
+    """
+    Write a signal to a compressed container file chunk by chunk.
+
+    Parameters:
+        signal (array-like or Expr): Signal, deferred expression or signal file
+        path (str or PathLike): Output file
+        chunk_size (int): Samples per chunk
+        codec (str): 'zlib', 'lzma' or 'none'
+        level (int): Compression level (default 6 for zlib, 1 for lzma)
+        delta (bool): Delta-encode samples (helps smooth signals)
+        shuffle (bool): Byte-shuffle samples
+        fs (float): Sample rate in Hz, enabling time-range reads
+        start_time (float): Time of sample 0 in seconds
+        dtype (numpy dtype): Stored dtype (default: the signal's dtype)
+
+    Returns:
+        CompressedSignal: The written file
+    """
+    signal = expression.as_expr(signal)
+    dtype = np.dtype(dtype or signal.dtype)
+    options = dict(chunk_size=chunk_size, codec=codec, level=level, delta=delta, shuffle=shuffle,
+                   fs=fs, start_time=start_time)
+    token = expression._deferred.set(False)
+    try:
+        with CompressedWriter(path, dtype, **options) as writer:
+            for i in range(0, signal.length, writer.chunk_size):
+                writer.write(signal._chunk(i, min(i + writer.chunk_size, signal.length)))
+    finally:
+        expression._deferred.reset(token)
+    return CompressedSignal(path)
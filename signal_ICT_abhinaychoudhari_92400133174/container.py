@@ -0,0 +1,135 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/container.py
+"""
+Signal container module
+
+A lightweight offset-carrying signal: the sample buffer plus the index of
+its first sample and an optional sample rate. Shifting a Signal only
+changes its start index, and operations align Signals by index, so no
+zero padding is materialised until a flat array is requested.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import numpy as np
+
+from . import precision
+
+
+class Signal:
+    """
+    Discrete signal x[n] stored as a buffer starting at sample index ``start``.
+
+    Samples outside [start, start + len(data)) are zero.
+
+    Attributes:
+        data (numpy.ndarray): Sample values (not copied)
+        start (int): Index n of data[0]
+        fs (float or None): Sample rate in Hz, if known
+    """
+
+    __slots__ = ('data', 'start', 'fs')
+
+    def __init__(self, data, start=0, fs=None):
+        self.data = np.asarray(data)
+        self.start = int(start)
+        self.fs = fs
+
+    def __repr__(self):
+        return f"Signal(samples={len(self.data)}, start={self.start}, fs={self.fs})"
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def end(self):
+        """Index one past the last stored sample."""
+        return self.start + len(self.data)
+
+    def shift(self, k):
+        """Return the signal delayed by k samples (advanced for k<0) in O(1)."""
+        return Signal(self.data, self.start + int(k), self.fs)
+
+    def indices(self):
+        """Return the sample indices n of the stored samples."""
+        return np.arange(self.start, self.end)
+
+    def times(self):
+        """Return the sample times n/fs of the stored samples."""
+        if self.fs is None:
+            raise ValueError("Signal has no sample rate")
+        return self.indices() / self.fs
+
+    def to_array(self, start=0, end=None):
+        """
+        Densify the signal over the index window [start, end).
+
+        Parameters:
+            start (int): First index of the window (default 0)
+            end (int): One past the last index (default: self.end)
+
+        Returns:
+            numpy.ndarray: Samples x[start:end], zero outside the stored support
+        """
+        end = self.end if end is None else int(end)
+        out = np.zeros(max(end - start, 0), dtype=self.data.dtype)
+        lo, hi = max(start, self.start), min(end, self.end)
+        if lo < hi:
+            out[lo - start:hi - start] = self.data[lo - self.start:hi - self.start]
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+
+def _common_rate(signal1, signal2):
+    """Return the shared sample rate of two Signals, or raise if they differ."""
+    if signal1.fs is None:
+        return signal2.fs
+    if signal2.fs is not None and signal1.fs != signal2.fs:
+        raise ValueError(f"Sample rates differ: {signal1.fs} vs {signal2.fs}")
+    return signal1.fs
+
+
+def add(signal1, signal2, dtype=None):
+    """
+    Add two Signals aligned by sample index.
+
+    Parameters:
+        dtype (numpy dtype): Output dtype (default: NumPy promotion)
+
+    Returns:
+        Signal: Sum over the union of both supports
+    """
+    fs = _common_rate(signal1, signal2)
+    start = min(signal1.start, signal2.start)
+    end = max(signal1.end, signal2.end)
+    if dtype is None:
+        dtype = np.result_type(signal1.data, signal2.data)
+    out = np.zeros(end - start, dtype=dtype)
+    out[signal1.start - start:signal1.end - start] = signal1.data
+    out[signal2.start - start:signal2.end - start] += signal2.data
+    return Signal(out, start, fs)
+
+
+def multiply(signal1, signal2, dtype=None):
+    """
+    Multiply two Signals aligned by sample index.
+
+    Parameters:
+        dtype (numpy dtype): Output dtype, multiplied in its compute dtype
+            (default: NumPy promotion)
+
+    Returns:
+        Signal: Product over the overlap of both supports (zero elsewhere)
+    """
+    fs = _common_rate(signal1, signal2)
+    start = max(signal1.start, signal2.start)
+    end = max(min(signal1.end, signal2.end), start)
+    a = signal1.data[start - signal1.start:end - signal1.start]
+    b = signal2.data[start - signal2.start:end - signal2.start]
+    if dtype is None:
+        return Signal(a * b, start, fs)
+    out = np.multiply(a, b, out=np.empty(end - start, dtype=dtype), dtype=precision.compute_dtype(dtype))
+    return Signal(out, start, fs)
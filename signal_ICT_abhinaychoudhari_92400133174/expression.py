@@ -0,0 +1,310 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/expression.py
+"""
+Deferred expression evaluation module
+
+Inside ``with deferred():`` the generators and operations return Expr
+nodes instead of arrays, building an expression graph such as
+``signal_multiplication(signal_addition(step, ramp), sine)``. Evaluating
+the graph walks it once per cache-sized chunk, so every intermediate is
+only chunk-sized and the whole chain is computed in a single pass over the
+output. Each chunk applies the same element-wise NumPy operations as the
+eager path, so results are bit-for-bit identical.
+
+Deferred graphs support 1-D signals.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import contextlib
+import contextvars
+import inspect
+
+import numpy as np
+
+from . import resampling
+
+# Samples per chunk: a few float64 intermediates of this size fit in L2 cache
+DEFAULT_CHUNK_SIZE = 16384
+
+_deferred = contextvars.ContextVar('deferred', default=False)
+
+# While a Generator evaluates a chunk: (whole time grid, chunk start, chunk stop)
+_chunk_origin = contextvars.ContextVar('chunk_origin', default=None)
+
+
+@contextlib.contextmanager
+def deferred():
+    """Context manager in which generators and operations build Expr graphs."""
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def is_deferred():
+    """Return True inside a ``deferred()`` block."""
+    return _deferred.get()
+
+
+def grid_position(t):
+    """
+    Return (grid, first): the whole time grid t is a chunk of, and the index
+    of t's first sample in it, while a Generator evaluates that chunk;
+    otherwise (t, 0).
+
+    Methods whose output depends on the whole grid (the phasor recurrence,
+    the wavetable phase accumulator) use it so that chunks continue the
+    eager computation instead of restarting it.
+    """
+    origin = _chunk_origin.get()
+    if origin is not None and np.ndim(t) == 1 and len(t) == origin[2] - origin[1]:
+        return origin[0], origin[1]
+    return t, 0
+
+
+def grid_spacing(t):
+    """
+    Return (t0, dt, first) of the uniformly spaced grid t is (a chunk of).
+
+    t0 and dt are the first sample and the spacing of the whole grid (see
+    grid_position) and first is the index of t's first sample in it. t is
+    checked against t0 + dt·k in blocks, allowing a few ulps of rounding
+    from linspace or arange in t's dtype.
+
+    Raises:
+        ValueError: If t is not evenly spaced
+    """
+    grid, first = grid_position(t)
+    flat, t = np.ravel(grid), np.ravel(t)
+    if flat.size < 2:
+        return (float(flat[0]) if flat.size else 0.0), 0.0, first
+    t0, t1 = float(flat[0]), float(flat[-1])
+    dt = (t1 - t0) / (flat.size - 1)
+    eps = np.finfo(t.dtype if t.dtype.kind == 'f' else float).eps
+    tolerance = 1e-6 * abs(dt) + 8 * eps * max(abs(t0), abs(t1))
+    steps = dt * np.arange(min(DEFAULT_CHUNK_SIZE, t.size))
+    deviation = np.empty_like(steps)
+    for i in range(0, t.size, DEFAULT_CHUNK_SIZE):
+        part = t[i:i + DEFAULT_CHUNK_SIZE]
+        error = deviation[:len(part)]
+        np.add(steps[:len(part)], t0 + dt * (first + i), out=error)
+        np.subtract(part, error, out=error)
+        if not np.abs(error, out=error).max() <= tolerance:  # also catches NaN
+            raise ValueError("This method needs an evenly spaced time vector t")
+    return t0, dt, first
+
+
+class Expr:
+    """
+    Node of a deferred signal expression.
+
+    Attributes:
+        length (int): Number of samples the node evaluates to
+        dtype (numpy.dtype): Dtype of the evaluated samples
+    """
+
+    __slots__ = ('length', 'dtype')
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def shape(self):
+        return (self.length,)
+
+    def evaluate(self, chunk_size=DEFAULT_CHUNK_SIZE, out=None):
+        """
+        Evaluate the expression chunk by chunk.
+
+        Parameters:
+            chunk_size (int): Samples computed per pass through the graph
+            out (numpy.ndarray): Preallocated output of shape (len(self),)
+
+        Returns:
+            numpy.ndarray: The evaluated signal
+        """
+        if out is None:
+            out = np.empty(self.length, dtype=self.dtype)
+        elif out.shape != self.shape:
+            raise ValueError(f"out has shape {out.shape}, expected {self.shape}")
+        token = _deferred.set(False)
+        try:
+            for i in range(0, self.length, chunk_size):
+                j = min(i + chunk_size, self.length)
+                out[i:j] = self._chunk(i, j)
+        finally:
+            _deferred.reset(token)
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.evaluate()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def _chunk(self, i, j):
+        """Return samples [i, j), with 0 <= i <= j <= length."""
+        raise NotImplementedError
+
+    def _window(self, i, j):
+        """Return samples [i, j), zero outside [0, length)."""
+        lo, hi = max(i, 0), min(j, self.length)
+        if lo == i and hi == j:
+            return self._chunk(i, j)
+        window = np.zeros(max(j - i, 0), dtype=self.dtype)
+        if lo < hi:
+            window[lo - i:hi - i] = self._chunk(lo, hi)
+        return window
+
+
+def _check_1d(array):
+    if np.ndim(array) != 1:
+        raise ValueError("Deferred evaluation supports 1-D signals only")
+
+
+class Source(Expr):
+    """Leaf node wrapping an existing array."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = np.asarray(data)
+        _check_1d(self.data)
+        self.length = len(self.data)
+        self.dtype = self.data.dtype
+
+    def _chunk(self, i, j):
+        return self.data[i:j]
+
+
+class Generator(Expr):
+    """Leaf node calling a signal generator on slices of its time grid."""
+
+    __slots__ = ('func', 'grid_name', 'grid', 'params')
+
+    def __init__(self, func, grid_name, grid, params):
+        # Call the generator itself, not its cache or instrumentation wrappers:
+        # chunks are not reused, and the call was recorded when it was deferred
+        self.func = inspect.unwrap(func)
+        self.grid_name = grid_name
+        self.grid = np.asarray(grid)
+        self.params = params
+        _check_1d(self.grid)
+        self.length = len(self.grid)
+        token = _deferred.set(False)
+        try:
+            empty = self.func(**{grid_name: self.grid[:0]}, **params)
+        finally:
+            _deferred.reset(token)
+        _check_1d(empty)
+        self.dtype = empty.dtype
+
+    def _chunk(self, i, j):
+        token = _chunk_origin.set((self.grid, i, j))
+        try:
+            return self.func(**{self.grid_name: self.grid[i:j]}, **self.params)
+        finally:
+            _chunk_origin.reset(token)
+
+
+class Binary(Expr):
+    """Element-wise ufunc of two nodes; the shorter one is zero-padded."""
+
+    __slots__ = ('ufunc', 'left', 'right')
+
+    def __init__(self, ufunc, left, right):
+        self.ufunc = ufunc
+        self.left = left
+        self.right = right
+        self.length = max(left.length, right.length)
+        self.dtype = np.result_type(left.dtype, right.dtype)
+
+    def _chunk(self, i, j):
+        return self.ufunc(self.left._window(i, j), self.right._window(i, j))
+
+
+class Shift(Expr):
+    """y[n] = x[n - k]: delay (k>0) or advance (k<0), as operations.time_shift."""
+
+    __slots__ = ('child', 'k')
+
+    def __init__(self, child, k):
+        self.child = child
+        self.k = int(k)
+        self.length = max(child.length + self.k, 0)
+        self.dtype = child.dtype
+
+    def _chunk(self, i, j):
+        return self.child._window(i - self.k, j - self.k)
+
+
+class Scale(Expr):
+    """y[n] = x(k·n), as operations.time_scale with the given method."""
+
+    __slots__ = ('child', 'k', 'method', 'up', 'down')
+
+    def __init__(self, child, k, method='polyphase'):
+        if k <= 0:
+            raise ValueError("Scaling factor k must be positive")
+        self.child = child
+        self.k = k
+        self.method = method
+        if method == 'polyphase':
+            self.up, self.down = resampling.ratio(k)
+            self.length = resampling.output_length(child.length, self.up, self.down)
+            self.dtype = np.result_type(child.dtype, float)
+        else:
+            self.up = self.down = None
+            self.length = int(child.length / k)
+            self.dtype = child.dtype
+
+    def _chunk(self, i, j):
+        if self.method == 'polyphase':
+            lo, hi = resampling.input_span(i, j, self.up, self.down)
+            window = self.child._window(lo, hi)
+            return resampling.polyphase(window, lo, i, j, self.up, self.down)
+        indices = (np.arange(i, j) * self.k).astype(int)
+        if indices.size == 0:
+            return self.child._chunk(0, 0)
+        lo = indices[0]
+        return self.child._chunk(lo, indices[-1] + 1)[indices - lo]
+
+
+class Cast(Expr):
+    """A node's samples converted chunk by chunk to another dtype (a dtype policy's storage)."""
+
+    __slots__ = ('child',)
+
+    def __init__(self, child, dtype):
+        self.child = child
+        self.length = child.length
+        self.dtype = np.dtype(dtype)
+
+    def _chunk(self, i, j):
+        return self.child._chunk(i, j).astype(self.dtype, copy=False)
+
+
+def cast(node, dtype):
+    """Return node converted to dtype (node itself if dtype is None or already matches)."""
+    if dtype is None or node.dtype == dtype:
+        return node
+    return Cast(node, dtype)
+
+
+def as_expr(signal):
+    """Wrap an array-like (or pass through an Expr) as an expression node."""
+    if isinstance(signal, Expr):
+        return signal
+    return Source(signal)
+
+
+def involves(*signals):
+    """Return True if deferral is active or any operand is already an Expr."""
+    return is_deferred() or any(isinstance(s, Expr) for s in signals)
+
+
+def evaluate(signal, chunk_size=DEFAULT_CHUNK_SIZE, out=None):
+    """Evaluate an Expr (arrays are returned unchanged)."""
+    if isinstance(signal, Expr):
+        return signal.evaluate(chunk_size=chunk_size, out=out)
+    return signal
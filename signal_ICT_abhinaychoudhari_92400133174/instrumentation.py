@@ -0,0 +1,240 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/instrumentation.py
+"""
+Instrumentation module
+
+Records, for every generator and operation, the number of calls, the
+cumulative and percentile (p50/p90/p99) wall time, the input samples and
+the bytes allocated. Recording is off by default. Turn it on with
+``enable()``, with ``with instrumented():``, or by setting the environment
+variable SIGNAL_ICT_INSTRUMENT=1 (or =memory) before the package is
+imported. While it is off, an instrumented function costs one global flag
+test on top of the call itself.
+
+Bytes allocated are the nbytes of the returned array (summed over the
+arrays of a tuple result, such as quadrature_wave's). With ``memory=True``
+(SIGNAL_ICT_INSTRUMENT=memory) they are instead the tracemalloc peak of
+the call, which includes temporaries but slows every allocation. Only the
+outermost instrumented call on a thread is traced.
+
+Percentiles are computed over the most recent _RESERVOIR calls of each
+function. ``to_json()`` and ``to_prometheus()`` export the registry.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+# Environment variable turning instrumentation on at import ("1" or "memory")
+ENVIRONMENT_VARIABLE = "SIGNAL_ICT_INSTRUMENT"
+
+# Durations kept per function for the percentiles
+_RESERVOIR = 1024
+
+PERCENTILES = (50, 90, 99)
+
+# Prefix of the exported Prometheus metric names
+_METRIC_PREFIX = "signal_ict"
+
+
+class _Metrics:
+    """Running totals of one instrumented function."""
+
+    __slots__ = ('calls', 'seconds', 'durations', 'input_samples', 'max_input_samples',
+                 'allocated_bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.durations = collections.deque(maxlen=_RESERVOIR)
+        self.input_samples = 0
+        self.max_input_samples = 0
+        self.allocated_bytes = 0
+
+    def result(self):
+        quantiles = np.percentile(np.fromiter(self.durations, dtype=float), PERCENTILES)
+        return {
+            'calls': self.calls,
+            'total_seconds': self.seconds,
+            'mean_seconds': self.seconds / self.calls,
+            **{f'p{p}_seconds': float(q) for p, q in zip(PERCENTILES, quantiles)},
+            'input_samples': self.input_samples,
+            'max_input_samples': self.max_input_samples,
+            'allocated_bytes': self.allocated_bytes,
+        }
+
+
+_registry = {}
+_lock = threading.Lock()
+_local = threading.local()
+_enabled = False
+_memory = False
+
+
+def enable(memory=False):
+    """Start recording; with memory=True, bytes allocated are traced with tracemalloc."""
+    global _enabled, _memory
+    _memory = bool(memory)
+    _enabled = True
+
+
+def disable():
+    """Stop recording (the registry is kept until reset())."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Return True while calls are being recorded."""
+    return _enabled
+
+
+@contextlib.contextmanager
+def instrumented(memory=False):
+    """Context manager that records calls and restores the previous state on exit."""
+    previous = _enabled, _memory
+    enable(memory)
+    try:
+        yield
+    finally:
+        if previous[0]:
+            enable(previous[1])
+        else:
+            disable()
+
+
+def reset():
+    """Drop every recorded metric."""
+    with _lock:
+        _registry.clear()
+
+
+def report():
+    """Return {function name: metrics dict} for every function called while recording."""
+    with _lock:
+        return {name: metrics.result() for name, metrics in sorted(_registry.items())}
+
+
+def to_json(indent=2):
+    """Return the registry as a JSON document."""
+    return json.dumps(report(), indent=indent)
+
+
+def to_prometheus():
+    """Return the registry in the Prometheus text exposition format."""
+    data = report()
+    lines = []
+
+    def metric(name, kind, text, values):
+        lines.append(f"# HELP {_METRIC_PREFIX}_{name} {text}")
+        lines.append(f"# TYPE {_METRIC_PREFIX}_{name} {kind}")
+        lines.extend(values)
+
+    def sample(name, function, value, **labels):
+        labels = ",".join([f'function="{function}"'] + [f'{k}="{v}"' for k, v in labels.items()])
+        return f"{_METRIC_PREFIX}_{name}{{{labels}}} {value!r}"
+
+    summary = []
+    for function, metrics in data.items():
+        for p in PERCENTILES:
+            summary.append(sample("call_seconds", function, metrics[f'p{p}_seconds'], quantile=p / 100))
+        summary.append(sample("call_seconds_sum", function, metrics['total_seconds']))
+        summary.append(sample("call_seconds_count", function, metrics['calls']))
+    metric("call_seconds", "summary", "Wall time of calls to the function.", summary)
+    metric("input_samples_total", "counter", "Input samples passed to the function.",
+           [sample("input_samples_total", f, m['input_samples']) for f, m in data.items()])
+    metric("max_input_samples", "gauge", "Largest input passed to the function, in samples.",
+           [sample("max_input_samples", f, m['max_input_samples']) for f, m in data.items()])
+    metric("allocated_bytes_total", "counter", "Bytes allocated by the function.",
+           [sample("allocated_bytes_total", f, m['allocated_bytes']) for f, m in data.items()])
+    return "\n".join(lines) + "\n"
+
+
+def _samples(values):
+    """Total array size of the array-like arguments."""
+    total = 0
+    for value in values:
+        size = getattr(value, 'size', None)
+        if isinstance(size, (int, np.integer)):
+            total += int(size)
+        elif hasattr(value, 'length'):  # deferred expression
+            total += int(value.length)
+        elif hasattr(value, '__len__') and not isinstance(value, (str, dict)):  # list or Signal
+            total += len(value)
+    return total
+
+
+def _nbytes(result):
+    """Bytes of a returned array, or of the arrays in a returned tuple or list."""
+    if isinstance(result, (tuple, list)):
+        return sum(_nbytes(part) for part in result)
+    nbytes = getattr(result, 'nbytes', 0)
+    return int(nbytes) if isinstance(nbytes, (int, np.integer)) else 0
+
+
+def _record(name, seconds, samples, allocated):
+    with _lock:
+        metrics = _registry.get(name)
+        if metrics is None:
+            metrics = _registry[name] = _Metrics()
+        metrics.calls += 1
+        metrics.seconds += seconds
+        metrics.durations.append(seconds)
+        metrics.input_samples += samples
+        metrics.max_input_samples = max(metrics.max_input_samples, samples)
+        metrics.allocated_bytes += allocated
+
+
+def _call_traced(func, args, kwargs):
+    """Call func and return (result, tracemalloc peak bytes) unless already traced on this thread."""
+    if getattr(_local, 'tracing', False):
+        return func(*args, **kwargs), 0
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if hasattr(tracemalloc, 'reset_peak'):  # Python >= 3.9
+        tracemalloc.reset_peak()
+    _local.tracing = True
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        _local.tracing = False
+        peak = tracemalloc.get_traced_memory()[1]
+        if started:
+            tracemalloc.stop()
+    return result, max(peak - before, 0)
+
+
+def instrument(func):
+    """Decorator recording calls to func while instrumentation is enabled."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        if _memory:
+            result, allocated = _call_traced(func, args, kwargs)
+        else:
+            result = func(*args, **kwargs)
+            allocated = _nbytes(result)
+        seconds = time.perf_counter() - start
+        _record(name, seconds, _samples(args) + _samples(kwargs.values()), int(allocated))
+        return result
+
+    return wrapper
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    enable(memory=os.environ[ENVIRONMENT_VARIABLE].strip().lower() == "memory")
@@ -0,0 +1,253 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/operations.py
+"""
+Signal operations module
+
+Time shifting, time scaling and point-wise addition/multiplication of
+discrete signals.
+
+Every operation accepts plain arrays (indexed from n=0) or offset-carrying
+Signal objects. With Signals, time_shift is an O(1) change of the start
+index and addition/multiplication align operands by index without padding;
+call Signal.to_array() (or np.asarray) to densify. The compact forms of
+the sparse module (SparseSignal, PiecewiseSignal) are likewise shifted,
+added and multiplied on their nonzeros or segments only.
+
+Inside ``expression.deferred()``, or when an operand is already an
+expression node, the operations build a deferred expression graph that is
+evaluated in cache-sized chunks (see the expression module).
+
+Under a dtype policy, or with ``dtype=``, results are stored in that dtype
+and mixed operands (e.g. an int step plus a float64 ramp) are cast inside
+the ufunc loops rather than promoted (see the precision module). ``out=``
+writes the result of addition/multiplication into a given array or a
+named shared-memory segment (see the shared module).
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import numpy as np
+
+from . import container, expression, instrumentation, parallel, precision, resampling, shared, sparse
+from .container import Signal
+
+
+_SCALE_METHODS = ('polyphase', 'index')
+
+
+def _match_lengths(signal1, signal2):
+    """Zero-pad the shorter of two signals so both have the same length."""
+    signal1 = np.asarray(signal1)
+    signal2 = np.asarray(signal2)
+    length = max(len(signal1), len(signal2))
+    if len(signal1) < length:
+        signal1 = np.pad(signal1, (0, length - len(signal1)))
+    if len(signal2) < length:
+        signal2 = np.pad(signal2, (0, length - len(signal2)))
+    return signal1, signal2
+
+
+def _binary(ufunc, signal1, signal2, workers, dtype=None, out=None):
+    """
+    Apply ufunc to two zero-padded arrays, filling one output from a thread pool.
+
+    The overlap is computed pairwise and the tail of the longer operand
+    against a zero of the shorter operand's dtype, exactly as with padding.
+    With a dtype, the output has that dtype and the ufunc loop runs in its
+    compute dtype, casting the operands inside its buffers. ``out`` is an
+    array, SharedSignal or shared segment name to write into (see
+    shared.resolve); without a dtype, an existing out keeps its own.
+    """
+    signal1 = np.asarray(signal1)
+    signal2 = np.asarray(signal2)
+    overlap = min(len(signal1), len(signal2))
+    length = max(len(signal1), len(signal2))
+    compute = None if dtype is None else precision.compute_dtype(dtype)
+    if dtype is None:
+        dtype = np.result_type(signal1, signal2) if out is None or isinstance(out, str) else np.asarray(out).dtype
+    if out is None:
+        out = np.empty(length, dtype=dtype)
+    else:
+        out = shared.resolve(out, (length,), dtype)
+        if out.shape != (length,):
+            raise ValueError(f"out has shape {out.shape}, expected {(length,)}")
+    parallel.fill(lambda out, a, b: ufunc(a, b, out=out, dtype=compute), out[:overlap],
+                  signal1[:overlap], signal2[:overlap], workers=workers)
+    if len(signal1) > overlap:
+        zero = np.zeros(1, dtype=signal2.dtype)
+        parallel.fill(lambda out, a: ufunc(a, zero, out=out, dtype=compute), out[overlap:],
+                      signal1[overlap:], workers=workers)
+    elif len(signal2) > overlap:
+        zero = np.zeros(1, dtype=signal1.dtype)
+        parallel.fill(lambda out, b: ufunc(zero, b, out=out, dtype=compute), out[overlap:],
+                      signal2[overlap:], workers=workers)
+    return out
+
+
+def _binary_into(ufunc, signal1, signal2, workers, dtype, out):
+    """Write ufunc of two array operands (or expressions, evaluated chunk by chunk) into out."""
+    if sparse.involves(signal1, signal2) or _as_signals(signal1, signal2) is not None:
+        raise ValueError("out= needs array or expression operands, not Signals or compact forms")
+    if expression.involves(signal1, signal2):
+        node = expression.cast(expression.Binary(ufunc, expression.as_expr(signal1),
+                                                 expression.as_expr(signal2)), dtype)
+        return node.evaluate(out=shared.resolve(out, node.shape, node.dtype))
+    return _binary(ufunc, signal1, signal2, workers, dtype, out)
+
+
+def _as_signals(signal1, signal2):
+    """Return both operands as Signals if either one is a Signal, else None."""
+    if not isinstance(signal1, Signal) and not isinstance(signal2, Signal):
+        return None
+    if not isinstance(signal1, Signal):
+        signal1 = Signal(signal1)
+    if not isinstance(signal2, Signal):
+        signal2 = Signal(signal2)
+    return signal1, signal2
+
+
+@instrumentation.instrument
+def time_shift(signal, k, dtype=None):
+    """
+    Shift a signal by k units in the time domain.
+
+    Parameters:
+        signal (array-like, Signal, SparseSignal or PiecewiseSignal): Input signal
+        k (int): Shift amount (positive=right shift/delay, negative=left shift/advance)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else the signal's dtype)
+
+    Returns:
+        numpy.ndarray: Time-shifted signal of length len(signal) + k. A delay
+        prepends k zeros; an advance drops the first |k| samples.
+        For a Signal input, a Signal sharing the same buffer with its start
+        index moved by k (no copy).
+        For a SparseSignal or PiecewiseSignal, the same form, shifted in
+        O(nonzeros) or O(segments).
+    """
+    dtype = precision.resolve(dtype)
+    if isinstance(signal, Signal):
+        if dtype is None:
+            return signal.shift(k)
+        return Signal(signal.data.astype(dtype, copy=False), signal.start + int(k), signal.fs)
+    if sparse.involves(signal):
+        shifted = signal.shift(k)
+        return shifted if dtype is None else shifted.astype(dtype)
+    if expression.involves(signal):
+        return expression.cast(expression.Shift(expression.as_expr(signal), k), dtype)
+    signal = np.asarray(signal)
+    k = int(k)
+    dtype = signal.dtype if dtype is None else dtype
+    if k >= 0:
+        shifted = np.empty(len(signal) + k, dtype=dtype)
+        shifted[:k] = 0
+        shifted[k:] = signal
+        return shifted
+    return signal[-k:].astype(dtype)
+
+
+@instrumentation.instrument
+def time_scale(signal, k, method='polyphase', dtype=None):
+    """
+    Scale the time axis of a signal by factor k, y[n] = x(k·n).
+
+    Parameters:
+        signal (array-like): Input signal
+        k (float): Scaling factor (k>1=compress, 0<k<1=expand); approximated
+            by a rational down/up with up, down <= resampling.MAX_DENOMINATOR
+        method (str): 'polyphase' (default) low-pass filters and resamples by
+            the rational ratio without aliasing; 'index' picks x[int(k·n)]
+        dtype (numpy dtype): Output dtype; 'polyphase' filters in its compute
+            dtype (default: the dtype policy in effect, else float64)
+
+    Returns:
+        numpy.ndarray: Time-scaled signal of length len(signal)·up//down
+        ('polyphase') or int(len(signal) / k) ('index')
+    """
+    if method not in _SCALE_METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {_SCALE_METHODS}")
+    if k <= 0:
+        raise ValueError("Scaling factor k must be positive")
+    dtype = precision.resolve(dtype)
+    if expression.involves(signal):
+        return expression.cast(expression.Scale(expression.as_expr(signal), k, method), dtype)
+    signal = np.asarray(signal)
+    if method == 'polyphase':
+        up, down = resampling.ratio(k)
+        return resampling.resample(signal, up, down, dtype)
+    length = int(len(signal) / k)
+    indices = (np.arange(length) * k).astype(int)
+    scaled = signal[indices]
+    return scaled if dtype is None else scaled.astype(dtype, copy=False)
+
+
+@instrumentation.instrument
+def signal_addition(signal1, signal2, workers=None, dtype=None, out=None):
+    """
+    Perform point-wise addition of two signals.
+
+    Parameters:
+        signal1, signal2 (array-like, Signal, SparseSignal or PiecewiseSignal):
+            Input signals (the shorter array is zero-padded; Signals are
+            aligned by sample index)
+        workers (int): Threads computing array operands in chunks (default: serial)
+        dtype (numpy dtype): Output dtype, computed without promoting past it
+            (default: the dtype policy in effect, else NumPy promotion)
+        out (numpy.ndarray, SharedSignal or str): Output to write array operands'
+            result into, or the name of a shared-memory segment (see the shared module)
+
+    Returns:
+        numpy.ndarray or Signal: Sum of input signals (a Signal if either input is one;
+        with a SparseSignal or PiecewiseSignal operand, see sparse.add)
+    """
+    dtype = precision.resolve(dtype)
+    if out is not None:
+        return _binary_into(np.add, signal1, signal2, workers, dtype, out)
+    if sparse.involves(signal1, signal2):
+        return sparse.add(signal1, signal2, dtype)
+    if expression.involves(signal1, signal2):
+        node = expression.Binary(np.add, expression.as_expr(signal1), expression.as_expr(signal2))
+        return expression.cast(node, dtype)
+    signals = _as_signals(signal1, signal2)
+    if signals is not None:
+        return container.add(*signals, dtype=dtype)
+    if workers is not None or dtype is not None:
+        return _binary(np.add, signal1, signal2, workers, dtype)
+    signal1, signal2 = _match_lengths(signal1, signal2)
+    return signal1 + signal2
+
+
+@instrumentation.instrument
+def signal_multiplication(signal1, signal2, workers=None, dtype=None, out=None):
+    """
+    Perform point-wise multiplication of two signals.
+
+    Parameters:
+        signal1, signal2 (array-like, Signal, SparseSignal or PiecewiseSignal):
+            Input signals (the shorter array is zero-padded; Signals are
+            aligned by sample index)
+        workers (int): Threads computing array operands in chunks (default: serial)
+        dtype (numpy dtype): Output dtype, computed without promoting past it
+            (default: the dtype policy in effect, else NumPy promotion)
+        out (numpy.ndarray, SharedSignal or str): Output to write array operands'
+            result into, or the name of a shared-memory segment (see the shared module)
+
+    Returns:
+        numpy.ndarray or Signal: Product of input signals (a Signal if either input is one;
+        with a SparseSignal or PiecewiseSignal operand, see sparse.multiply)
+    """
+    dtype = precision.resolve(dtype)
+    if out is not None:
+        return _binary_into(np.multiply, signal1, signal2, workers, dtype, out)
+    if sparse.involves(signal1, signal2):
+        return sparse.multiply(signal1, signal2, dtype)
+    if expression.involves(signal1, signal2):
+        node = expression.Binary(np.multiply, expression.as_expr(signal1), expression.as_expr(signal2))
+        return expression.cast(node, dtype)
+    signals = _as_signals(signal1, signal2)
+    if signals is not None:
+        return container.multiply(*signals, dtype=dtype)
+    if workers is not None or dtype is not None:
+        return _binary(np.multiply, signal1, signal2, workers, dtype)
+    signal1, signal2 = _match_lengths(signal1, signal2)
+    return signal1 * signal2
@@ -0,0 +1,166 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/outofcore.py
+"""
+Out-of-core signal files module
+
+Reads and writes 1-D signals stored as ``.npy`` files or raw binary files
+through memory maps, one window at a time. A SignalFile is an expression
+node, so passing it to signal_addition, signal_multiplication, time_shift
+or time_scale builds a deferred expression graph (see the expression
+module) instead of loading the file; save() then evaluates the graph chunk
+by chunk into a memory-mapped output file. Each chunk maps only its own
+window of every input and of the output and unmaps it afterwards, so peak
+memory is set by ``memory_limit``, not by the file sizes.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import os
+
+import numpy as np
+
+from . import expression
+
+# Default working-memory budget for chunked processing, in bytes
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Chunk-sized buffers assumed live at once when sizing chunks from the budget
+_WORKING_BUFFERS = 8
+
+
+def _is_npy(path):
+    return os.fspath(path).endswith('.npy')
+
+
+def _read_npy_header(path):
+    """Return (dtype, length, data offset) of a 1-D .npy file."""
+    with open(path, 'rb') as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if len(shape) != 1:
+        raise ValueError(f"{path} holds an array of shape {shape}; signals must be 1-D")
+    return dtype, shape[0], offset
+
+
+class SignalFile(expression.Expr):
+    """
+    A 1-D signal stored in a ``.npy`` or raw binary file.
+
+    Parameters:
+        path (str or PathLike): File path (``.npy`` files carry their own dtype)
+        dtype (numpy dtype): Sample dtype of a raw file (default float64)
+        offset (int): Byte offset of the first sample in a raw file
+    """
+
+    __slots__ = ('path', 'offset')
+
+    def __init__(self, path, dtype=None, offset=0):
+        self.path = os.fspath(path)
+        if _is_npy(self.path):
+            self.dtype, self.length, self.offset = _read_npy_header(self.path)
+        else:
+            self.dtype = np.dtype(dtype or float)
+            self.offset = int(offset)
+            self.length = (os.path.getsize(self.path) - self.offset) // self.dtype.itemsize
+
+    def __repr__(self):
+        return f"SignalFile({self.path!r}, samples={self.length}, dtype={self.dtype})"
+
+    def window(self, start, stop, mode='r'):
+        """
+        Memory-map samples [start, stop) of the file.
+
+        Parameters:
+            start, stop (int): Sample range, within [0, len(self)]
+            mode (str): 'r' for read-only, 'r+' for read-write
+
+        Returns:
+            numpy.memmap: The mapped window (unmapped when released)
+        """
+        return np.memmap(self.path, dtype=self.dtype, mode=mode,
+                         offset=self.offset + start * self.dtype.itemsize,
+                         shape=(stop - start,))
+
+    def memmap(self, mode='r'):
+        """Memory-map the whole signal."""
+        return self.window(0, self.length, mode)
+
+    def _chunk(self, i, j):
+        if i == j:
+            return np.zeros(0, dtype=self.dtype)
+        window = self.window(i, j)
+        chunk = np.array(window)
+        del window
+        return chunk
+
+
+def load(path, dtype=None, offset=0):
+    """
+    Open a signal file for out-of-core processing (no data is read).
+
+    Parameters:
+        path (str or PathLike): ``.npy`` or raw binary file
+        dtype (numpy dtype): Sample dtype of a raw file (default float64)
+        offset (int): Byte offset of the first sample in a raw file
+
+    Returns:
+        SignalFile: Expression node usable with the operations
+    """
+    return SignalFile(path, dtype=dtype, offset=offset)
+
+
+def create(path, length, dtype=float):
+    """
+    Create a zero-filled signal file of the given length.
+
+    Returns:
+        SignalFile: The new file
+    """
+    path = os.fspath(path)
+    dtype = np.dtype(dtype)
+    if _is_npy(path):
+        mapped = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(length,))
+        del mapped
+    else:
+        with open(path, 'wb') as f:
+            f.truncate(length * dtype.itemsize)
+    return SignalFile(path, dtype=dtype)
+
+
+def chunk_size_for(memory_limit, dtype=float):
+    """Number of samples per chunk that keeps processing within memory_limit bytes."""
+    return max(int(memory_limit) // (_WORKING_BUFFERS * np.dtype(dtype).itemsize), 1)
+
+
+def save(signal, path, memory_limit=DEFAULT_MEMORY_LIMIT, dtype=None):
+    """
+    Write a signal to a ``.npy`` or raw file chunk by chunk.
+
+    Parameters:
+        signal (array-like or Expr): Signal, deferred expression or SignalFile
+        path (str or PathLike): Output file (``.npy`` suffix writes a header)
+        memory_limit (int): Working-memory budget in bytes
+        dtype (numpy dtype): Output dtype (default: the signal's dtype)
+
+    Returns:
+        SignalFile: The written file
+    """
+    signal = expression.as_expr(signal)
+    dtype = np.dtype(dtype or signal.dtype)
+    out = create(path, signal.length, dtype)
+    step = chunk_size_for(memory_limit, np.result_type(signal.dtype, dtype))
+    token = expression._deferred.set(False)
+    try:
+        for i in range(0, signal.length, step):
+            j = min(i + step, signal.length)
+            window = out.window(i, j, mode='r+')
+            window[:] = signal._chunk(i, j)
+            window.flush()
+            del window
+    finally:
+        expression._deferred.reset(token)
+    return out
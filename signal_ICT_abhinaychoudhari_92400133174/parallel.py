@@ -0,0 +1,117 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/parallel.py
+"""
+Multi-threaded chunked evaluation module
+
+Backs the ``workers=`` option of the generators and of signal_addition /
+signal_multiplication. The output array is allocated once and split into
+contiguous chunks along its last (sample) axis; the chunks are filled from
+a shared thread pool. NumPy ufuncs release the GIL, so the chunks run on
+separate cores, and each chunk applies the same element-wise operations as
+the serial path, so results are identical.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import concurrent.futures
+import threading
+
+import numpy as np
+
+# Chunks shorter than this are not worth handing to another thread
+MIN_CHUNK_SIZE = 1 << 16
+
+# Chunks per worker, so a slow chunk does not leave the others idle
+_CHUNKS_PER_WORKER = 4
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _pool(workers):
+    """Return the shared thread pool with the given number of threads."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = concurrent.futures.ThreadPoolExecutor(
+                workers, thread_name_prefix='signal-worker')
+        return pool
+
+
+def check_workers(workers):
+    """Return workers as a positive int (None means 1)."""
+    if workers is None:
+        return 1
+    if int(workers) < 1:
+        raise ValueError("workers must be a positive integer")
+    return int(workers)
+
+
+def chunk_bounds(length, workers, min_chunk=MIN_CHUNK_SIZE):
+    """Return [(start, stop), ...] splitting range(length) for the given workers."""
+    count = max(min(workers * _CHUNKS_PER_WORKER, length // max(min_chunk, 1)), 1)
+    edges = [length * i // count for i in range(count + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def fill(func, out, *arrays, workers=None, min_chunk=MIN_CHUNK_SIZE):
+    """
+    Call func(out_part, *array_parts) over chunks of the last axis.
+
+    Parameters:
+        func (callable): Writes the result for one chunk into out_part
+        out (numpy.ndarray): Output array, filled in place
+        *arrays (numpy.ndarray): Inputs sliced alongside out (their last
+            axis must match out's); other inputs are captured by func
+        workers (int): Threads to use (None or 1 runs serially)
+        min_chunk (int): Smallest chunk handed to a thread
+
+    Returns:
+        numpy.ndarray: out
+    """
+    workers = check_workers(workers)
+    if workers == 1 or out.ndim == 0 or any(a.ndim == 0 for a in arrays):
+        func(out, *arrays)
+        return out
+    bounds = chunk_bounds(out.shape[-1], workers, min_chunk)
+    if len(bounds) == 1:
+        func(out, *arrays)
+        return out
+
+    def run(bound):
+        i, j = bound
+        func(out[..., i:j], *(a[..., i:j] for a in arrays))
+
+    for future in [_pool(workers).submit(run, bound) for bound in bounds]:
+        future.result()
+    return out
+
+
+def for_each(func, items, workers=None):
+    """Call func(item) for every item, on the thread pool if workers > 1."""
+    workers = check_workers(workers)
+    items = list(items)
+    if workers == 1 or len(items) < 2:
+        for item in items:
+            func(item)
+        return
+    for future in [_pool(workers).submit(func, item) for item in items]:
+        future.result()
+
+
+def elementwise(func, array, workers=None, min_chunk=MIN_CHUNK_SIZE):
+    """
+    Return func(array) for an element-wise func, computed in chunks.
+
+    With workers > 1 the result is preallocated (its dtype taken from
+    func on an empty slice) and each chunk is filled from the thread pool.
+    """
+    workers = check_workers(workers)
+    if workers == 1 or array.ndim == 0:
+        return func(array)
+    out = np.empty(array.shape, dtype=func(array[..., :0]).dtype)
+
+    def chunk(out, part):
+        out[...] = func(part)
+
+    return fill(chunk, out, array, workers=workers, min_chunk=min_chunk)
@@ -0,0 +1,352 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/pipeline.py
+"""
+Block-processing pipeline module
+
+Stateful, streaming counterparts of the operations for real-time use:
+
+    Delay     - time_shift by k samples through a ring-buffer delay line
+    Resample  - time_scale by polyphase resampling with carried filter state
+    Add       - signal_addition with a second stream (a Source)
+    Multiply  - signal_multiplication with a second stream (a Source)
+
+Sources produce the second operand block by block: Oscillator (a
+phase-continuous sine/cosine carrier, as sine_wave_stream) and ArraySource
+(an existing array, e.g. a unit step).
+
+All buffers are preallocated for ``max_block`` samples, so processing a
+block allocates no sample memory. Every stage and source takes
+``dtype=`` (default: the dtype policy in effect, else float64) for its
+buffers, so a float32 or float16 stream is never promoted; float16 is
+computed in float32 scratch buffers, as in the precision module. Length-preserving stages work in place
+on the block they are given; Resample writes into its own output buffer.
+Stage.process returns the output block, which is only valid until the
+next call.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+from fractions import Fraction
+
+import numpy as np
+
+from . import precision, resampling
+
+# Default capacity, in samples, of per-block buffers
+DEFAULT_MAX_BLOCK = 4096
+
+
+def _dtype(dtype):
+    """Sample dtype of a stage: dtype, else the dtype policy in effect, else float64."""
+    dtype = precision.resolve(dtype)
+    return np.dtype(float) if dtype is None else dtype
+
+
+class Stage:
+    """Base class of pipeline stages."""
+
+    __slots__ = ()
+
+    def process(self, block):
+        """Process one block and return the output block."""
+        raise NotImplementedError
+
+    def reset(self):
+        """Clear the stage state and start a new stream."""
+
+
+class Source:
+    """Base class of block sources used as the second operand of mixers."""
+
+    __slots__ = ()
+
+    def read(self, out):
+        """Fill out with the next len(out) samples of the stream."""
+        raise NotImplementedError
+
+    def reset(self):
+        """Restart the stream from its first sample."""
+
+
+class Delay(Stage):
+    """
+    Delay a stream by k samples, as time_shift(signal, k) for k >= 0.
+
+    Each block is written into a ring buffer of k + max_block samples and
+    the output is read back k samples behind the write position, so blocks
+    can be processed in place.
+
+    Parameters:
+        k (int): Delay in samples (a causal stream cannot be advanced)
+        max_block (int): Largest block processed in one ring-buffer pass
+        dtype (numpy dtype): Sample dtype of the delay line (default: the
+            dtype policy in effect, else float64)
+    """
+
+    __slots__ = ('k', 'max_block', '_ring', '_write')
+
+    def __init__(self, k, max_block=DEFAULT_MAX_BLOCK, dtype=None):
+        if k < 0:
+            raise ValueError("Delay k must be non-negative; a stream cannot be advanced")
+        self.k = int(k)
+        self.max_block = int(max_block)
+        self._ring = np.zeros(self.k + self.max_block, dtype=_dtype(dtype))
+        self.reset()
+
+    def reset(self):
+        self._ring.fill(0)
+        self._write = 0
+
+    def _copy_in(self, block):
+        ring, size = self._ring, len(self._ring)
+        first = min(len(block), size - self._write)
+        ring[self._write:self._write + first] = block[:first]
+        ring[:len(block) - first] = block[first:]
+
+    def _copy_out(self, out, position):
+        ring, size = self._ring, len(self._ring)
+        first = min(len(out), size - position)
+        out[:first] = ring[position:position + first]
+        out[first:] = ring[:len(out) - first]
+
+    def process(self, block):
+        size = len(self._ring)
+        for start in range(0, len(block), self.max_block):
+            part = block[start:start + self.max_block]
+            self._copy_in(part)
+            self._copy_out(part, (self._write - self.k) % size)
+            self._write = (self._write + len(part)) % size
+        return block
+
+
+class Resample(Stage):
+    """
+    Resample a stream by a scaling factor k, as time_scale(signal, k).
+
+    Outputs are emitted as soon as all the input they depend on has
+    arrived, so the concatenated outputs equal time_scale of the whole
+    stream (without its last few samples, which need input past the end).
+
+    Parameters:
+        k (float): Time-scaling factor (k>1=compress, 0<k<1=expand)
+        max_block (int): Largest input block accepted
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else float64); history and filtering use its compute dtype
+    """
+
+    __slots__ = ('up', 'down', 'max_block', '_buffers', '_active', '_offset',
+                 '_received', '_produced', '_out', '_scratch', '_lead', '_store')
+
+    def __init__(self, k, max_block=DEFAULT_MAX_BLOCK, dtype=None):
+        self.up, self.down = resampling.ratio(k)
+        self.max_block = int(max_block)
+        bank, delay = resampling.design(self.up, self.down)
+        # Zeros standing in for the samples before the stream starts, and
+        # room for the history that later outputs still need
+        self._lead = bank.shape[1] + delay // self.up + 1
+        capacity = self.max_block + 2 * self._lead + self.down // self.up + 2
+        dtype = _dtype(dtype)
+        compute = precision.compute_dtype(dtype)
+        self._buffers = (np.zeros(capacity, dtype=compute), np.zeros(capacity, dtype=compute))
+        outputs = self.max_block * self.up // self.down + 2
+        self._out = np.zeros(outputs, dtype=compute)
+        self._scratch = np.zeros(outputs // self.up + 1, dtype=compute)
+        # Storage-dtype copy of each output block when it differs from compute (float16)
+        self._store = None if dtype == compute else np.zeros(outputs, dtype=dtype)
+        self.reset()
+
+    def reset(self):
+        self._active = 0
+        self._buffers[0].fill(0)
+        self._offset = -self._lead
+        self._received = 0
+        self._produced = 0
+
+    def process(self, block):
+        if len(block) > self.max_block:
+            raise ValueError(f"Block of {len(block)} samples exceeds max_block={self.max_block}")
+        history = self._buffers[self._active]
+        filled = self._received - self._offset
+        history[filled:filled + len(block)] = block
+        self._received += len(block)
+
+        delay = resampling.design(self.up, self.down)[1]
+        ready = max((self._received * self.up - delay - 1) // self.down + 1, 0)
+        stop = min(ready, resampling.output_length(self._received, self.up, self.down))
+        start = self._produced
+        out = self._out[:max(stop - start, 0)]
+        if stop > start:
+            lo, hi = resampling.input_span(start, stop, self.up, self.down)
+            window = history[lo - self._offset:hi - self._offset]
+            resampling.polyphase(window, lo, start, stop, self.up, self.down,
+                                 out=out, scratch=self._scratch, dtype=out.dtype)
+            self._produced = stop
+
+        # Move the history the next output needs to the front of the other buffer
+        keep = resampling.input_span(self._produced, self._produced + 1, self.up, self.down)[0]
+        keep = max(keep, self._offset)
+        retained = history[keep - self._offset:self._received - self._offset]
+        self._active = 1 - self._active
+        self._buffers[self._active][:len(retained)] = retained
+        self._offset = keep
+        if self._store is None:
+            return out
+        stored = self._store[:len(out)]
+        stored[...] = out
+        return stored
+
+
+class Add(Stage):
+    """
+    Add a second stream to the pipeline, as signal_addition.
+
+    Parameters:
+        source (Source): Stream supplying the second operand
+        max_block (int): Capacity of the operand buffer
+        dtype (numpy dtype): Dtype of the operand buffer (default: the
+            dtype policy in effect, else float64)
+    """
+
+    __slots__ = ('source', '_operand')
+
+    def __init__(self, source, max_block=DEFAULT_MAX_BLOCK, dtype=None):
+        self.source = source
+        self._operand = np.zeros(max_block, dtype=_dtype(dtype))
+
+    def reset(self):
+        self.source.reset()
+
+    def process(self, block):
+        for start in range(0, len(block), len(self._operand)):
+            part = block[start:start + len(self._operand)]
+            operand = self._operand[:len(part)]
+            self.source.read(operand)
+            part += operand
+        return block
+
+
+class Multiply(Add):
+    """
+    Multiply the pipeline by a second stream, as signal_multiplication.
+
+    Parameters:
+        source (Source): Stream supplying the second operand
+        max_block (int): Capacity of the operand buffer
+        dtype (numpy dtype): Dtype of the operand buffer (default: the
+            dtype policy in effect, else float64)
+    """
+
+    __slots__ = ()
+
+    def process(self, block):
+        for start in range(0, len(block), len(self._operand)):
+            part = block[start:start + len(self._operand)]
+            operand = self._operand[:len(part)]
+            self.source.read(operand)
+            part *= operand
+        return block
+
+
+class Oscillator(Source):
+    """
+    Phase-continuous sine or cosine carrier, as sine_wave_stream /
+    cosine_wave_stream (exact rational phase accumulation across blocks).
+
+    Parameters:
+        A (float): Amplitude
+        f (float): Frequency in Hz
+        phi (float): Phase shift in radians
+        fs (float): Sampling rate in Hz
+        waveform (str): 'sine' or 'cosine'
+        max_block (int): Largest block read at once
+        dtype (numpy dtype): Dtype the carrier is computed for (default: the
+            dtype policy in effect, else float64); it is computed in that
+            dtype's compute dtype and stored into the reader's buffer
+    """
+
+    __slots__ = ('A', 'phi', '_step', '_offsets', '_scratch', '_index', '_func')
+
+    def __init__(self, A, f, phi, fs, waveform='sine', max_block=DEFAULT_MAX_BLOCK, dtype=None):
+        if fs <= 0:
+            raise ValueError("Sampling rate fs must be positive")
+        if waveform not in ('sine', 'cosine'):
+            raise ValueError(f"Unknown waveform {waveform!r}; expected 'sine' or 'cosine'")
+        self.A = A
+        self.phi = phi
+        self._step = Fraction(float(f)) / Fraction(float(fs))
+        compute = precision.compute_dtype(_dtype(dtype))
+        self._offsets = (np.arange(max_block) * float(self._step)).astype(compute)
+        self._scratch = np.empty(max_block, dtype=compute)
+        self._func = np.sin if waveform == 'sine' else np.cos
+        self.reset()
+
+    def reset(self):
+        self._index = 0
+
+    def read(self, out):
+        for start in range(0, len(out), len(self._offsets)):
+            part = out[start:start + len(self._offsets)]
+            work = part if part.dtype == self._offsets.dtype else self._scratch[:len(part)]
+            cycles = float((self._index * self._step) % 1)
+            np.add(self._offsets[:len(part)], cycles, out=work)
+            work *= 2 * np.pi
+            work += self.phi
+            self._func(work, out=work)
+            work *= self.A
+            if work is not part:
+                part[...] = work
+            self._index += len(part)
+
+
+class ArraySource(Source):
+    """
+    Stream an existing array block by block, then zeros once it is exhausted.
+
+    Parameters:
+        data (array-like): Samples to stream
+    """
+
+    __slots__ = ('data', '_position')
+
+    def __init__(self, data):
+        self.data = np.asarray(data)
+        self.reset()
+
+    def reset(self):
+        self._position = 0
+
+    def read(self, out):
+        part = self.data[self._position:self._position + len(out)]
+        out[:len(part)] = part
+        out[len(part):] = 0
+        self._position += len(out)
+
+
+class Pipeline:
+    """
+    Chain of stages applied to each block in turn.
+
+    Parameters:
+        stages (iterable of Stage): Stages in processing order
+    """
+
+    __slots__ = ('stages',)
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    def process(self, block):
+        """
+        Push one block through every stage.
+
+        Returns:
+            numpy.ndarray: The output block (valid until the next call)
+        """
+        for stage in self.stages:
+            block = stage.process(block)
+        return block
+
+    def reset(self):
+        """Reset every stage."""
+        for stage in self.stages:
+            stage.reset()
@@ -0,0 +1,222 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/plotting.py
+"""
+Large-signal plotting module
+
+Plots of millions of samples are reduced to what the screen can show
+before they reach matplotlib. ``envelope`` splits a signal into one bucket
+per horizontal pixel and keeps the minimum and the maximum of each bucket,
+in time order, so the decimated line passes through every peak exactly and
+covers the same vertical range in each pixel column as the full signal.
+The buckets are reduced block by block (argmin/argmax over a cache-sized
+(buckets, bucket) view), so the signal is read from memory once.
+
+``Panel`` collects decimated line and stem traces for one set of axes, and
+``render`` draws panels into an image file with the Agg backend, without
+pyplot or a display. ``render_all`` renders several multi-panel figures
+concurrently in a process pool; panels are decimated before they are sent
+to the workers, so only a few thousand points per trace are pickled.
+
+matplotlib is imported inside the rendering functions; ``envelope`` and
+``Panel`` only need NumPy.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import concurrent.futures
+
+import numpy as np
+
+from . import parallel
+
+# Buckets per trace when the width is not given (about a 2000-pixel axes)
+DEFAULT_PIXELS = 2000
+
+# Samples reduced per block, so argmin/argmax read the block from cache
+_BLOCK = 1 << 15
+
+# Keyword arguments of Axes.stem that do not apply to a decimated stem band
+_STEM_ONLY = ('linefmt', 'markerfmt', 'basefmt', 'bottom')
+
+
+def envelope(signal, pixels=DEFAULT_PIXELS):
+    """
+    Reduce a signal to its per-pixel min/max envelope.
+
+    Parameters:
+        signal (array-like): 1-D signal (arrays and memmaps are read once)
+        pixels (int): Number of buckets (horizontal pixels)
+
+    Returns:
+        tuple: (index, values) - sample indices (ascending) and values of the
+        kept samples: the minimum and maximum of each bucket, so two per
+        bucket. Signals of at most 2·pixels samples are returned whole.
+    """
+    signal = np.asarray(signal)
+    if signal.ndim != 1:
+        raise ValueError(f"Expected a 1-D signal, got shape {signal.shape}")
+    if pixels < 1:
+        raise ValueError(f"pixels must be at least 1, got {pixels}")
+    n = len(signal)
+    if n <= 2 * pixels:
+        index = np.arange(n)
+        return index, signal[index]
+    bucket = -(-n // pixels)
+    full = n // bucket
+    buckets = -(-n // bucket)
+    index = np.empty((buckets, 2), dtype=np.intp)
+    rows = max(1, _BLOCK // bucket)
+    for r0 in range(0, full, rows):
+        r1 = min(r0 + rows, full)
+        block = signal[r0 * bucket:r1 * bucket].reshape(r1 - r0, bucket)
+        low = block.argmin(axis=1)
+        high = block.argmax(axis=1)
+        base = np.arange(r0 * bucket, r1 * bucket, bucket)
+        np.add(base, np.minimum(low, high), out=index[r0:r1, 0])
+        np.add(base, np.maximum(low, high), out=index[r0:r1, 1])
+    if full < buckets:
+        tail = signal[full * bucket:]
+        low, high = int(tail.argmin()), int(tail.argmax())
+        index[full] = full * bucket + min(low, high), full * bucket + max(low, high)
+    index = index.reshape(-1)
+    return index, signal[index]
+
+
+class Panel:
+    """
+    One set of axes of a figure, holding decimated traces.
+
+    Traces are decimated when they are added, so a Panel stays small
+    whatever the signal length and can be sent to a worker process.
+
+    Parameters:
+        title, xlabel, ylabel (str): Axes labels
+        pixels (int): Envelope buckets per trace
+    """
+
+    __slots__ = ('title', 'xlabel', 'ylabel', 'pixels', 'traces')
+
+    def __init__(self, title='', xlabel='', ylabel='Amplitude', pixels=DEFAULT_PIXELS):
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.pixels = pixels
+        self.traces = []
+
+    def line(self, x, y, **style):
+        """
+        Add a line trace (one per channel of a (channels..., samples) bank).
+
+        Parameters:
+            x (array-like or None): Sample positions (None for 0, 1, 2, ...)
+            y (array-like): Signal values
+            **style: Keyword arguments of Axes.plot
+        """
+        y = np.asarray(y)
+        rows = y.reshape(-1, y.shape[-1]) if y.ndim > 1 else [y]
+        for k, row in enumerate(rows):
+            index, values = envelope(row, self.pixels)
+            channel_style = style if k == 0 else {key: v for key, v in style.items() if key != 'label'}
+            self.traces.append(('line', self._positions(x, index), values, channel_style))
+        return self
+
+    def stem(self, x, y, **style):
+        """
+        Add a stem trace; beyond 2·pixels samples it is drawn as the band of
+        stems from the baseline to each bucket's extremes.
+
+        Parameters:
+            x (array-like or None): Sample positions (None for 0, 1, 2, ...)
+            y (array-like): Signal values
+            **style: Keyword arguments of Axes.stem
+        """
+        y = np.asarray(y)
+        index, values = envelope(y, self.pixels)
+        positions = self._positions(x, index)
+        if len(y) <= 2 * self.pixels:
+            self.traces.append(('stem', positions, values, style))
+        else:
+            pairs = values.reshape(-1, 2)
+            low = np.minimum(pairs.min(axis=1), 0)
+            high = np.maximum(pairs.max(axis=1), 0)
+            self.traces.append(('band', positions[::2], (low, high), style))
+        return self
+
+    @staticmethod
+    def _positions(x, index):
+        return index if x is None else np.asarray(x)[index]
+
+    def draw(self, ax):
+        """Draw the traces, labels and grid on a matplotlib Axes."""
+        labelled = False
+        for kind, x, y, style in self.traces:
+            labelled = labelled or 'label' in style
+            if kind == 'line':
+                ax.plot(x, y, **style)
+            elif kind == 'stem':
+                ax.stem(x, y, **style)
+            else:
+                band_style = {key: v for key, v in style.items() if key not in _STEM_ONLY}
+                ax.vlines(x, *y, **band_style)
+                ax.axhline(0, linewidth=1)
+        ax.set_title(self.title)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        ax.grid(True, alpha=0.3)
+        if labelled:
+            ax.legend()
+
+
+def render(path, panels, ncols=1, figsize=None, dpi=100, title=None):
+    """
+    Render panels into an image file with the Agg backend.
+
+    Parameters:
+        path (str): Output file; the format follows the extension (.png, ...)
+        panels (sequence of Panel): Panels, filled row by row
+        ncols (int): Panels per row
+        figsize (tuple): Figure size in inches (default: 10 wide, 3 per row)
+        dpi (int): Resolution
+        title (str): Figure title
+
+    Returns:
+        str: path
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    nrows = -(-len(panels) // ncols)
+    figure = Figure(figsize=figsize or (10, 3 * nrows), dpi=dpi)
+    FigureCanvasAgg(figure)
+    for k, panel in enumerate(panels):
+        panel.draw(figure.add_subplot(nrows, ncols, k + 1))
+    if title:
+        figure.suptitle(title)
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+
+def _render_job(job):
+    path, panels, options = job
+    return render(path, panels, **options)
+
+
+def render_all(figures, workers=None):
+    """
+    Render several figures, concurrently in a process pool.
+
+    Parameters:
+        figures (iterable): (path, panels) or (path, panels, render options)
+            tuples, as the arguments of render
+        workers (int): Worker processes (default: serial in this process)
+
+    Returns:
+        list: The written paths, in order
+    """
+    jobs = [(figure[0], figure[1], figure[2] if len(figure) > 2 else {}) for figure in figures]
+    workers = min(parallel.check_workers(workers), len(jobs) or 1)
+    if workers == 1:
+        return [_render_job(job) for job in jobs]
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_render_job, jobs))
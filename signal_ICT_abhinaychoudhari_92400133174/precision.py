@@ -0,0 +1,120 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/precision.py
+"""
+Dtype policy module
+
+Chooses the dtype the generators and operations store their samples in,
+and the dtype they compute in:
+
+    policy     storage    compute
+    float64    float64    float64
+    float32    float32    float32
+    float16    float16    float32
+
+A per-call ``dtype=`` takes precedence over ``with dtype_policy(...):``,
+which takes precedence over the global ``set_default_dtype(...)``. With no
+policy at all (the default) every function keeps its historical dtype:
+float64 from the trigonometric generators, int64 from unit_step and
+ramp_signal on integer indices, and NumPy promotion in the operations.
+
+Under a policy each output is allocated once in the storage dtype and
+nothing is promoted past it: integer or float64 inputs are cast inside
+the ufunc loops' internal buffers or in cache-sized scratch blocks, never
+as signal-sized temporaries. float16 samples are computed in float32
+blocks, because float16 cannot hold phases such as 2πft accurately. Note
+that float16 represents integers exactly only up to 2048, and finite values
+only up to 65504.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import contextlib
+import contextvars
+import math
+
+import numpy as np
+
+# Storage dtypes accepted as a global or context policy
+POLICIES = ('float64', 'float32', 'float16')
+
+# Storage dtype -> wider dtype its samples are computed in
+_COMPUTE = {np.dtype(np.float16): np.dtype(np.float32)}
+
+# Elements per scratch block when computing in a wider dtype (fits in L2 cache)
+_BLOCK = 16384
+
+_default = None
+_policy = contextvars.ContextVar('dtype_policy', default=None)
+
+
+def _check_policy(dtype):
+    """Return dtype as a policy storage dtype, or raise ValueError."""
+    dtype = np.dtype(dtype)
+    if dtype.name not in POLICIES:
+        raise ValueError(f"Unsupported dtype policy {dtype.name!r}; expected one of {POLICIES}")
+    return dtype
+
+
+def set_default_dtype(dtype):
+    """Set the package-wide storage dtype ('float64', 'float32', 'float16'; None for historical dtypes)."""
+    global _default
+    _default = None if dtype is None else _check_policy(dtype)
+
+
+def get_default_dtype():
+    """Return the storage dtype in effect (a dtype_policy context, else the global default), or None."""
+    policy = _policy.get()
+    return _default if policy is None else policy
+
+
+@contextlib.contextmanager
+def dtype_policy(dtype):
+    """Context manager applying a storage dtype policy to the calls made inside it."""
+    token = _policy.set(_check_policy(dtype))
+    try:
+        yield
+    finally:
+        _policy.reset(token)
+
+
+def resolve(dtype=None):
+    """Return the storage dtype of a call: its dtype= argument, else the policy in effect, or None."""
+    return get_default_dtype() if dtype is None else np.dtype(dtype)
+
+
+def compute_dtype(dtype):
+    """Return the dtype samples of the given storage dtype are computed in."""
+    dtype = np.dtype(dtype)
+    return _COMPUTE.get(dtype, dtype)
+
+
+def blockwise(fill, out, *arrays):
+    """
+    Call fill(buffer, *array_parts) with a buffer of out's compute dtype.
+
+    If out is already of its compute dtype, fill writes into it directly.
+    Otherwise fill runs on cache-sized blocks of the last axis in a scratch
+    buffer, and each block is stored into out.
+
+    Parameters:
+        fill (callable): Writes the result for one block into buffer
+        out (numpy.ndarray): Output array, filled in place
+        *arrays (numpy.ndarray): Inputs sliced alongside out (their last
+            axis must match out's)
+
+    Returns:
+        numpy.ndarray: out
+    """
+    compute = compute_dtype(out.dtype)
+    if compute == out.dtype or out.ndim == 0 or any(a.ndim == 0 for a in arrays):
+        fill(out, *arrays)
+        return out
+    length = out.shape[-1]
+    block = max(_BLOCK // max(math.prod(out.shape[:-1]), 1), 1)
+    scratch = np.empty(out.shape[:-1] + (min(block, length),), dtype=compute)
+    for i in range(0, length, block):
+        j = min(i + block, length)
+        buffer = scratch[..., :j - i]
+        fill(buffer, *(a[..., i:j] for a in arrays))
+        out[..., i:j] = buffer
+    return out
@@ -0,0 +1,244 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/resampling.py
+"""
+Polyphase resampling module
+
+Anti-aliased rational resampling used by operations.time_scale. A scaling
+factor k is approximated by a ratio down/up; the signal is (conceptually)
+upsampled by ``up``, low-pass filtered with a Kaiser-windowed sinc and
+decimated by ``down``. The filter is split into ``up`` polyphase branches so
+only the taps that touch real input samples are evaluated, and designs are
+cached per ratio.
+
+Every output sample is accumulated tap by tap in the same order whichever
+block it is computed in, so the streaming Resampler and chunked deferred
+evaluation reproduce the whole-array result exactly.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import functools
+from fractions import Fraction
+
+import numpy as np
+
+from . import precision
+
+# Largest up/down factor used when approximating a scaling factor
+MAX_DENOMINATOR = 1000
+
+# Filter half-length in taps per polyphase branch, and Kaiser window beta
+HALF_TAPS = 10
+KAISER_BETA = 5.0
+
+# Below this many outputs per polyphase branch, polyphase() gathers instead
+# of looping over branches
+_MIN_BRANCH_RUN = 64
+
+
+def ratio(k):
+    """
+    Approximate a time-scaling factor k by a rational down/up.
+
+    Returns:
+        tuple: (up, down) with k ≈ down / up
+    """
+    if k <= 0:
+        raise ValueError("Scaling factor k must be positive")
+    # Fraction() rejects NumPy scalars; item() converts them exactly
+    fraction = Fraction(k.item() if isinstance(k, np.generic) else k).limit_denominator(MAX_DENOMINATOR)
+    if fraction == 0:
+        raise ValueError(f"Scaling factor {k} is too small to resample")
+    return fraction.denominator, fraction.numerator
+
+
+@functools.lru_cache(maxsize=64)
+def design(up, down):
+    """
+    Design (and cache) the polyphase filter bank for an up/down ratio.
+
+    Returns:
+        tuple: (bank, delay) where bank[p, q] = h[p + q·up] is the read-only
+        (up, taps) polyphase matrix and delay is the filter's group delay in
+        upsampled samples
+    """
+    rate = max(up, down)
+    delay = HALF_TAPS * rate
+    length = 2 * delay + 1
+    n = np.arange(length) - delay
+    cutoff = 1.0 / rate
+    h = up * cutoff * np.sinc(cutoff * n) * np.kaiser(length, KAISER_BETA)
+    taps = -(-length // up)
+    h = np.pad(h, (0, taps * up - length))
+    bank = np.ascontiguousarray(h.reshape(taps, up).T)
+    bank.setflags(write=False)
+    return bank, delay
+
+
+def output_length(length, up, down):
+    """Number of output samples produced from ``length`` input samples."""
+    return length * up // down
+
+
+def input_span(start, stop, up, down):
+    """
+    Input index range [lo, hi) needed to compute outputs [start, stop).
+    """
+    bank, delay = design(up, down)
+    lo = (start * down + delay) // up - (bank.shape[1] - 1)
+    hi = ((stop - 1) * down + delay) // up + 1
+    return lo, hi
+
+
+def polyphase(window, offset, start, stop, up, down, out=None, scratch=None, dtype=None):
+    """
+    Compute resampled outputs [start, stop) from an input window.
+
+    Parameters:
+        window (numpy.ndarray): Input samples x[offset:offset + len(window)],
+            covering at least input_span(start, stop, up, down)
+        offset (int): Input index of window[0]
+        start, stop (int): Output index range
+        up, down (int): Resampling ratio
+        out (numpy.ndarray): Optional buffer of length stop - start to fill
+        scratch (numpy.ndarray): Optional buffer of at least
+            ceil((stop - start) / up) samples for products; with out and
+            scratch given no arrays are allocated
+        dtype (numpy dtype): Dtype of the filter taps and of an allocated
+            out (default: promoted from window, at least float64)
+
+    Returns:
+        numpy.ndarray: Output samples y[start:stop]
+    """
+    bank, delay = design(up, down)
+    if dtype is None:
+        dtype = np.result_type(window.dtype, bank.dtype)
+    else:
+        bank = bank.astype(dtype, copy=False)
+    if out is None:
+        out = np.zeros(max(stop - start, 0), dtype=dtype)
+    else:
+        out.fill(0)
+    if scratch is None and len(out) < _MIN_BRANCH_RUN * up:
+        # Few outputs per branch: gather branch coefficients and inputs for
+        # the whole range, one multiply-add per tap
+        n = np.arange(start, stop) * down + delay
+        phase, base = n % up, n // up - offset
+        for q in range(bank.shape[1]):
+            out += bank[phase, q] * window[base - q]
+        return out
+    # Outputs m, m+up, m+2·up, ... share a polyphase branch and step through
+    # the input with stride ``down``, so each branch/tap pair is one strided
+    # multiply-add.
+    for r in range(min(up, len(out))):
+        n = (start + r) * down + delay
+        phase, base = n % up, n // up - offset
+        target = out[r::up]
+        span = len(target) * down
+        for q in range(bank.shape[1]):
+            if scratch is None:
+                target += bank[phase, q] * window[base - q:base - q + span:down]
+            else:
+                product = scratch[:len(target)]
+                np.multiply(bank[phase, q], window[base - q:base - q + span:down], out=product)
+                target += product
+    return out
+
+
+def _padded(signal, lo, hi):
+    """Return signal[lo:hi] with zeros outside [0, len(signal))."""
+    left, right = max(-lo, 0), max(hi - len(signal), 0)
+    window = signal[max(lo, 0):min(hi, len(signal))]
+    if left or right:
+        window = np.pad(window, (left, right))
+    return window
+
+
+def resample(signal, up, down, dtype=None):
+    """
+    Resample a whole signal by the rational factor up/down.
+
+    Parameters:
+        dtype (numpy dtype): Output dtype, filtered in its compute dtype
+            (default: promoted from the signal, at least float64)
+
+    Returns:
+        numpy.ndarray: len(signal)·up//down anti-aliased output samples
+    """
+    signal = np.asarray(signal)
+    length = output_length(len(signal), up, down)
+    if length == 0:
+        return np.zeros(0, dtype=np.result_type(signal.dtype, float) if dtype is None else dtype)
+    lo, hi = input_span(0, length, up, down)
+    compute = None if dtype is None else precision.compute_dtype(dtype)
+    out = polyphase(_padded(signal, lo, hi), lo, 0, length, up, down, dtype=compute)
+    return out if dtype is None else out.astype(dtype, copy=False)
+
+
+class Resampler:
+    """
+    Streaming polyphase resampler carrying filter state between blocks.
+
+    Concatenating the outputs of process() for every block and then flush()
+    gives exactly resample(whole_signal, up, down).
+
+    Parameters:
+        k (float): Time-scaling factor (k>1=compress, 0<k<1=expand), or
+        up, down (int): Explicit resampling ratio
+    """
+
+    __slots__ = ('up', 'down', '_history', '_offset', '_received', '_produced')
+
+    def __init__(self, k=None, up=None, down=None):
+        if k is not None:
+            up, down = ratio(k)
+        if up is None or down is None or up <= 0 or down <= 0:
+            raise ValueError("Give a positive k or positive up and down factors")
+        self.up, self.down = int(up), int(down)
+        self.reset()
+
+    def reset(self):
+        """Forget all buffered input and start a new stream."""
+        self._history = np.zeros(0)
+        self._offset = 0
+        self._received = 0
+        self._produced = 0
+
+    def _emit(self, stop):
+        """Produce outputs up to ``stop`` from the history buffer."""
+        start = self._produced
+        if stop <= start:
+            return np.zeros(0, dtype=np.result_type(self._history.dtype, float))
+        lo, hi = input_span(start, stop, self.up, self.down)
+        window = _padded(self._history, lo - self._offset, hi - self._offset)
+        out = polyphase(window, lo, start, stop, self.up, self.down)
+        self._produced = stop
+        # Drop history the next output no longer needs
+        keep = input_span(stop, stop + 1, self.up, self.down)[0] - self._offset
+        if keep > 0:
+            self._history = self._history[keep:]
+            self._offset += keep
+        return out
+
+    def process(self, block):
+        """
+        Feed one block of input and return every output that is now complete.
+
+        Returns:
+            numpy.ndarray: Newly available output samples (possibly empty)
+        """
+        block = np.asarray(block)
+        if self._received == 0:
+            self._history = block.copy()
+        else:
+            self._history = np.concatenate((self._history, block))
+        self._received += len(block)
+        delay = design(self.up, self.down)[1]
+        # Output m is complete once input (m·down + delay)//up has arrived
+        ready = max((self._received * self.up - delay - 1) // self.down + 1, 0)
+        stop = min(ready, output_length(self._received, self.up, self.down))
+        return self._emit(stop)
+
+    def flush(self):
+        """Return the remaining outputs, treating the input as ended."""
+        return self._emit(output_length(self._received, self.up, self.down))
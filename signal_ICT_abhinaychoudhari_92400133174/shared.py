@@ -0,0 +1,399 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/shared.py
+"""
+Shared-memory signals module
+
+Hands signals between processes without pickling or copying them. A
+SharedSignal is a named multiprocessing.shared_memory segment that holds
+a small header (dtype, shape and a table of attached process ids)
+followed by the samples:
+
+    create(shape, dtype, name)  - allocate a new named segment
+    share(array, name)          - copy an existing array into a new segment
+    attach(name)                - map a segment another process created
+    output(name, shape, dtype)  - the segment a generator or operation
+                                  writes into when given ``out='name'``
+
+sine_wave and the other trigonometric generators, signal_addition and
+signal_multiplication accept ``out=`` as a SharedSignal or as a segment
+name, and write their result straight into the segment. Another process
+calls attach(name), or receives the handle itself (it pickles as its
+name), and reads the same memory. ``np.asarray(handle)`` and
+``handle.values`` are zero-copy views; ``handle.buf`` is a memoryview,
+and ``memoryview(handle)`` works directly on Python 3.12+ (PEP 688).
+
+Every process attached to a segment holds one entry in its id table.
+close() drops the caller's entry together with those of processes that
+have exited, so a worker that crashed without closing its handle is not
+counted, and the last process to close unlinks the segment. Handles are
+kept in a per-process registry and closed at interpreter exit. A segment
+whose remaining processes die without closing (a crashed worker, or a
+pool worker ended with os._exit) is unlinked by collect(), which runs at
+exit for every segment the process closed while others were attached.
+
+Table updates are serialised with flock() on POSIX. On Windows the OS
+frees a segment when its last handle closes, so ids are only recorded.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import atexit
+import contextlib
+import inspect
+import math
+import os
+import struct
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Most processes attached to one segment at once
+MAX_ATTACHED = 64
+
+# Most dimensions of a shared signal
+MAX_DIMS = 8
+
+# Header: magic, format version, dimensions, dtype string; then MAX_DIMS
+# extents and MAX_ATTACHED process ids. Samples start on a 64-byte boundary.
+_HEADER = struct.Struct('<4sHH24s')
+_MAGIC = b'SHSG'
+_VERSION = 1
+_SHAPE_OFFSET = _HEADER.size
+_PIDS_OFFSET = _SHAPE_OFFSET + 8 * MAX_DIMS
+_DATA_OFFSET = -(-(_PIDS_OFFSET + 8 * MAX_ATTACHED) // 64) * 64
+
+# SharedMemory(track=False) exists from Python 3.13; before, POSIX segments
+# are registered with the resource tracker whether created or attached
+_TRACK_OPTION = 'track' in inspect.signature(shared_memory.SharedMemory).parameters
+_TRACKED = not _TRACK_OPTION and os.name == 'posix'
+
+# Handles held by this process: segment name -> SharedSignal
+_registry = {}
+_registry_lock = threading.Lock()
+
+# Handles a forked child inherited (kept alive, but not counted as its own)
+_inherited = []
+
+# Segments this process closed while other processes were still attached
+_detached = set()
+
+
+def _open(name=None, size=0):
+    """Create (size > 0) or open a segment, untracked by multiprocessing's resource tracker."""
+    if _TRACK_OPTION:
+        return shared_memory.SharedMemory(name, create=size > 0, size=size, track=False)
+    shm = shared_memory.SharedMemory(name, create=size > 0, size=size)
+    if _TRACKED:  # the tracker would unlink it when this process exits
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def _unlink(shm):
+    if _TRACKED:  # unlink() unregisters it again
+        resource_tracker.register(shm._name, 'shared_memory')
+    shm.unlink()
+
+
+@contextlib.contextmanager
+def _locked(shm):
+    """Hold an exclusive lock on a segment's id table (POSIX)."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(shm._fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(shm._fd, fcntl.LOCK_UN)
+
+
+def _alive(pid):
+    if os.name != 'posix':
+        return True  # os.kill would terminate the process on Windows
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _prune(pids):
+    """Clear the entries of exited processes; return the number still attached."""
+    for slot in np.flatnonzero(pids):
+        if not _alive(pids[slot]):
+            pids[slot] = 0
+    return np.count_nonzero(pids)
+
+
+def _pid_table(shm):
+    return np.ndarray(MAX_ATTACHED, dtype='<i8', buffer=shm.buf, offset=_PIDS_OFFSET)
+
+
+def _add_pid(pids):
+    free = np.flatnonzero(pids == 0)
+    if not free.size:
+        raise ValueError(f"More than {MAX_ATTACHED} processes attached to one shared signal")
+    pids[free[0]] = os.getpid()
+
+
+class SharedSignal:
+    """
+    A signal stored in a named shared-memory segment.
+
+    Obtain handles with create(), share(), attach() or output(); the
+    handle pickles as its name, so passing it to another process attaches
+    there instead of copying the samples.
+
+    Attributes:
+        name (str): Segment name, to attach from other processes
+        values (numpy.ndarray): The samples, a view of the segment (invalid
+            once every view is released after close())
+    """
+
+    __slots__ = ('name', 'values', '_shm', '_pids')
+
+    def __init__(self, shm):
+        self._shm = shm
+        self.name = shm.name
+        magic, version, ndim, dtype = _HEADER.unpack_from(shm.buf)
+        if magic != _MAGIC or version > _VERSION:
+            raise ValueError(f"Shared memory segment {shm.name!r} does not hold a shared signal")
+        shape = struct.unpack_from(f'<{ndim}q', shm.buf, _SHAPE_OFFSET)
+        self._pids = _pid_table(shm)
+        self.values = np.ndarray(shape, dtype=np.dtype(dtype.rstrip(b'\0').decode('ascii')),
+                                 buffer=shm.buf, offset=_DATA_OFFSET)
+
+    def __repr__(self):
+        state = 'closed' if self._shm is None else f"shape={self.shape}, dtype={self.dtype}"
+        return f"SharedSignal({self.name!r}, {state})"
+
+    def __reduce__(self):
+        return attach, (self.name,)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    @property
+    def buf(self):
+        """memoryview of the samples (no copy)."""
+        return memoryview(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return self.values.astype(dtype or self.dtype)
+        return self.values if dtype is None else self.values.astype(dtype, copy=False)
+
+    def __buffer__(self, flags):
+        return memoryview(self.values)
+
+    @property
+    def references(self):
+        """Number of live processes attached to the segment (entries of exited ones are cleared)."""
+        with _locked(self._shm):
+            return _prune(self._pids)
+
+    def close(self):
+        """
+        Detach this process, unlinking the segment if no live process remains.
+
+        Views of the samples taken earlier keep the mapping valid until
+        they are released. Idempotent.
+        """
+        shm = self._shm
+        if shm is None:
+            return
+        with _registry_lock:
+            if _registry.get(self.name) is self:
+                del _registry[self.name]
+        with _locked(shm):
+            mine = np.flatnonzero(self._pids == os.getpid())
+            if mine.size:
+                self._pids[mine[0]] = 0
+            if _prune(self._pids):
+                _detached.add(self.name)  # collect() unlinks it once they are gone
+            else:
+                _unlink(shm)
+        self.values = self._pids = self._shm = None
+        try:
+            shm.close()
+        except BufferError:
+            pass  # views are still exported; the mapping goes with the last of them
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def create(shape, dtype=float, name=None):
+    """
+    Allocate a zero-filled signal in a new shared-memory segment.
+
+    Parameters:
+        shape (int or tuple): Samples, or (channels..., samples)
+        dtype (numpy dtype): Sample dtype
+        name (str): Segment name (default: a random unique name)
+
+    Returns:
+        SharedSignal: The handle (registered in this process)
+    """
+    shape = tuple(int(n) for n in np.atleast_1d(shape))
+    dtype = np.dtype(dtype)
+    if len(shape) > MAX_DIMS or any(n < 0 for n in shape):
+        raise ValueError(f"Invalid shape {shape} for a shared signal")
+    if dtype.hasobject or dtype.kind == 'V':
+        raise ValueError(f"Cannot share samples of dtype {dtype}")
+    shm = _open(name, _DATA_OFFSET + max(math.prod(shape) * dtype.itemsize, 1))
+    with _locked(shm):
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, len(shape), dtype.str.encode('ascii'))
+        struct.pack_into(f'<{len(shape)}q', shm.buf, _SHAPE_OFFSET, *shape)
+        pids = _pid_table(shm)
+        _add_pid(pids)
+        del pids
+        handle = SharedSignal(shm)
+    with _registry_lock:
+        _registry[handle.name] = handle
+    return handle
+
+
+def share(array, name=None):
+    """Copy an array into a new shared segment (the one copy) and return its handle."""
+    array = np.asarray(array)
+    handle = create(array.shape, array.dtype, name)
+    handle.values[...] = array
+    return handle
+
+
+def attach(name):
+    """
+    Map a shared signal created by any process, without copying it.
+
+    Attaching twice in one process returns the same handle.
+
+    Returns:
+        SharedSignal: The handle (registered in this process)
+
+    Raises:
+        FileNotFoundError: If no live segment has that name
+    """
+    with _registry_lock:
+        handle = _registry.get(name)
+        if handle is not None:
+            return handle
+        shm = _open(name)
+        with _locked(shm):
+            pids = _pid_table(shm)
+            if not _prune(pids):  # its last process is unlinking it
+                del pids
+                shm.close()
+                raise FileNotFoundError(f"Shared signal {name!r} is being released")
+            _add_pid(pids)
+            del pids
+            handle = SharedSignal(shm)
+        _registry[name] = handle
+    return handle
+
+
+def release(name):
+    """Close this process's handle of the named segment, if it holds one."""
+    with _registry_lock:
+        handle = _registry.get(name)
+    if handle is not None:
+        handle.close()
+
+
+def output(name, shape, dtype):
+    """
+    Return the handle a generator or operation writes into for ``out=name``.
+
+    The segment is created on first use and reused (here or, by attaching,
+    in another process) while its shape and dtype match.
+    """
+    shape = tuple(int(n) for n in np.atleast_1d(shape))
+    try:
+        handle = create(shape, dtype, name)
+    except FileExistsError:
+        handle = attach(name)
+    if handle.shape != shape or handle.dtype != np.dtype(dtype):
+        raise ValueError(f"Shared signal {name!r} holds {handle.shape} {handle.dtype}, "
+                         f"not {shape} {np.dtype(dtype)}")
+    return handle
+
+
+def resolve(out, shape, dtype):
+    """Return the array an ``out=`` argument (array, SharedSignal or segment name) designates."""
+    if isinstance(out, str):
+        out = output(out, shape, dtype)
+    return out.values if isinstance(out, SharedSignal) else out
+
+
+def collect(name=None):
+    """
+    Unlink a segment if every process attached to it has exited.
+
+    Parameters:
+        name (str): Segment name (default: every segment this process
+            closed while other processes were still attached)
+
+    Returns:
+        list: Names of the segments unlinked
+    """
+    if name is None:
+        return [name for name in sorted(_detached) if collect(name)]
+    _detached.discard(name)
+    if name in _registry:
+        return []
+    try:
+        shm = _open(name)
+    except FileNotFoundError:
+        return []
+    try:
+        with _locked(shm):
+            pids = _pid_table(shm)
+            remaining = _prune(pids)
+            del pids
+            if remaining:
+                _detached.add(name)
+            else:
+                _unlink(shm)
+    finally:
+        shm.close()
+    return [] if remaining else [name]
+
+
+def _forget_inherited():
+    """After fork: the parent's handles are not the child's, so attach() must record the child."""
+    _inherited.extend(_registry.values())
+    _registry.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_inherited)
+
+
+@atexit.register
+def _release_all():
+    for handle in list(_registry.values()):
+        handle.close()
+    collect()
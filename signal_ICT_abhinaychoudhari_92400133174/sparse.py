@@ -0,0 +1,472 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/sparse.py
+"""
+Sparse and run-length signal module
+
+Compact forms of the unitary signals, for long signals that are zero
+almost everywhere or made of a few constant or linear runs:
+
+    SparseSignal     - (index, value) pairs, zero elsewhere (impulse trains)
+    PiecewiseSignal  - polynomial segments: runs of a constant (steps), of a
+                       line (ramps), and their sums and products
+
+Both are indexed by array position 0 .. length-1, like the dense arrays the
+generators return, and record the length they stand for. The unitary
+generators return them with ``compact=True``; signal_addition,
+signal_multiplication and time_shift then work on the pairs or segments
+only, at O(nonzeros) or O(segments) cost whatever the length:
+
+    sparse + sparse        -> SparseSignal on the union of the indices
+    sparse * sparse        -> SparseSignal on the intersection of the indices
+    sparse * other         -> SparseSignal (the other operand sampled at the indices)
+    compact + compact      -> PiecewiseSignal (impulses become 1-sample segments)
+    piecewise * piecewise  -> PiecewiseSignal (segment polynomials multiplied)
+
+Pairs whose sum or product is exactly zero are dropped. As with arrays,
+the shorter operand is zero-padded. Any other combination with a dense
+array returns a dense array. ``to_array()`` (or np.asarray) densifies on
+demand, and functions that need samples (time_scale, the plotting
+functions, ...) densify their input.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import numpy as np
+
+from . import expression, precision
+from .container import Signal
+
+
+class SparseSignal:
+    """
+    Signal of ``length`` samples that is zero except at ``index``.
+
+    Attributes:
+        index (numpy.ndarray): Sorted, unique positions of the stored samples
+        values (numpy.ndarray): Sample values at index
+        length (int): Number of samples the signal stands for
+    """
+
+    __slots__ = ('index', 'values', 'length')
+
+    def __init__(self, index, values, length):
+        self.index = np.asarray(index, dtype=np.intp)
+        self.values = np.asarray(values)
+        self.length = int(length)
+        if self.index.ndim != 1 or self.values.shape != self.index.shape:
+            raise ValueError(f"index and values must be 1-D of one length, got shapes "
+                             f"{self.index.shape} and {self.values.shape}")
+        if len(self.index) and (self.index[0] < 0 or self.index[-1] >= self.length
+                                or np.any(self.index[1:] <= self.index[:-1])):
+            raise ValueError(f"index must be increasing and within [0, {self.length})")
+
+    def __repr__(self):
+        return f"SparseSignal(length={self.length}, nonzeros={len(self.index)}, dtype={self.dtype})"
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def shape(self):
+        return (self.length,)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the index and values (not by the dense signal)."""
+        return self.index.nbytes + self.values.nbytes
+
+    def astype(self, dtype):
+        """Return the signal with its values converted to dtype."""
+        return SparseSignal(self.index, self.values.astype(dtype, copy=False), self.length)
+
+    def shift(self, k):
+        """Return the signal delayed by k samples (advanced for k<0), as time_shift does, in O(nonzeros)."""
+        k = int(k)
+        index = self.index + k
+        keep = index >= 0
+        return SparseSignal(index[keep], self.values[keep], max(self.length + k, 0))
+
+    def to_array(self, dtype=None):
+        """Return the dense signal."""
+        out = np.zeros(self.length, dtype=self.dtype if dtype is None else dtype)
+        out[self.index] = self.values
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_array(dtype)
+
+
+class PiecewiseSignal:
+    """
+    Signal of ``length`` samples made of polynomial segments.
+
+    Segment s covers positions [starts[s], starts[s+1]) (the last one up to
+    length) and holds x[p] = Σ_j coeffs[s, j]·(p - starts[s])^j, so a step is
+    two constant runs and a ramp a zero run and a linear one.
+
+    Attributes:
+        starts (numpy.ndarray): Increasing segment starts, the first one 0
+        coeffs (numpy.ndarray): (segments, degree + 1) coefficients, in
+            increasing powers of the offset into the segment
+        length (int): Number of samples the signal stands for
+    """
+
+    __slots__ = ('starts', 'coeffs', 'length')
+
+    def __init__(self, starts, coeffs, length):
+        self.starts = np.asarray(starts, dtype=np.intp)
+        coeffs = np.asarray(coeffs)
+        self.coeffs = coeffs.reshape(-1, 1) if coeffs.ndim == 1 else coeffs
+        self.length = int(length)
+        if self.starts.ndim != 1 or self.coeffs.ndim != 2 or len(self.coeffs) != len(self.starts):
+            raise ValueError(f"Expected one row of coefficients per segment start, got shapes "
+                             f"{self.starts.shape} and {self.coeffs.shape}")
+        if self.length and (not len(self.starts) or self.starts[0] != 0 or self.starts[-1] >= self.length
+                            or np.any(self.starts[1:] <= self.starts[:-1])):
+            raise ValueError(f"starts must increase from 0 and stay below {self.length}")
+        if not self.length and len(self.starts):
+            raise ValueError("An empty signal has no segments")
+
+    def __repr__(self):
+        return (f"PiecewiseSignal(length={self.length}, segments={len(self.starts)}, "
+                f"degree={self.degree}, dtype={self.dtype})")
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def dtype(self):
+        return self.coeffs.dtype
+
+    @property
+    def shape(self):
+        return (self.length,)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the segment starts and coefficients (not by the dense signal)."""
+        return self.starts.nbytes + self.coeffs.nbytes
+
+    @property
+    def degree(self):
+        """Highest polynomial degree of the segments."""
+        return self.coeffs.shape[1] - 1
+
+    def astype(self, dtype):
+        """Return the signal with its coefficients converted to dtype."""
+        return PiecewiseSignal(self.starts, self.coeffs.astype(dtype, copy=False), self.length)
+
+    def shift(self, k):
+        """Return the signal delayed by k samples (advanced for k<0), as time_shift does, in O(segments)."""
+        k = int(k)
+        length = max(self.length + k, 0)
+        starts, coeffs = self.starts + k, self.coeffs
+        if not length:
+            return PiecewiseSignal(starts[:0], coeffs[:0], 0)
+        if k > 0:
+            starts = np.concatenate(([0], starts))
+            coeffs = np.concatenate((np.zeros((1, coeffs.shape[1]), dtype=coeffs.dtype), coeffs))
+        elif k < 0:
+            first = np.searchsorted(starts, 0, side='right') - 1
+            head = _recenter(coeffs[first:first + 1], -starts[first:first + 1])
+            starts = np.concatenate(([0], starts[first + 1:]))
+            coeffs = np.concatenate((head, coeffs[first + 1:]))
+        return _normalized(starts, coeffs, length)
+
+    def at(self, positions):
+        """Return the samples at the given positions (each within [0, length))."""
+        positions = np.asarray(positions, dtype=np.intp)
+        segment = np.searchsorted(self.starts, positions, side='right') - 1
+        return _horner(self.coeffs[segment], positions - self.starts[segment]).astype(self.dtype, copy=False)
+
+    def to_array(self, dtype=None):
+        """Return the dense signal."""
+        dtype = self.dtype if dtype is None else np.dtype(dtype)
+        lengths = np.diff(np.append(self.starts, self.length))
+        if not self.degree:
+            return np.repeat(self.coeffs[:, 0].astype(dtype, copy=False), lengths)
+        work = precision.compute_dtype(np.result_type(self.coeffs, dtype))
+        offsets = (np.arange(self.length) - np.repeat(self.starts, lengths)).astype(work, copy=False)
+        out = np.repeat(self.coeffs[:, -1].astype(work, copy=False), lengths)
+        for j in range(self.degree - 1, -1, -1):
+            out *= offsets
+            out += np.repeat(self.coeffs[:, j].astype(work, copy=False), lengths)
+        return out.astype(dtype, copy=False)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_array(dtype)
+
+
+def is_compact(signal):
+    """Return True for a SparseSignal or PiecewiseSignal."""
+    return isinstance(signal, (SparseSignal, PiecewiseSignal))
+
+
+def involves(*signals):
+    """Return True if an operand is compact and none is a Signal or a deferred expression."""
+    return (any(is_compact(s) for s in signals)
+            and not any(isinstance(s, (Signal, expression.Expr)) for s in signals))
+
+
+def _union(index1, index2):
+    """Sorted union of two increasing index arrays, by a merge of the two runs."""
+    merged = np.concatenate((index1, index2))
+    merged.sort(kind='stable')
+    keep = np.ones(len(merged), dtype=bool)
+    keep[1:] = merged[1:] != merged[:-1]
+    return merged[keep]
+
+
+def _nonzero(index, values, length):
+    """SparseSignal of the pairs whose value is not zero."""
+    keep = values != 0
+    return SparseSignal(index[keep], values[keep], length)
+
+
+def _horner(coeffs, x):
+    """Evaluate each row of coeffs as a polynomial at the matching x."""
+    value = coeffs[:, -1]
+    for j in range(coeffs.shape[1] - 2, -1, -1):
+        value = value * x + coeffs[:, j]
+    return value
+
+
+def _recenter(coeffs, delta):
+    """Re-expand each row's polynomial about its offset delta (a Taylor shift, by Horner's scheme)."""
+    degree = coeffs.shape[1] - 1
+    if not degree:
+        return coeffs
+    work = np.result_type(coeffs, delta)
+    delta = np.asarray(delta, dtype=work)
+    out = coeffs.astype(work)
+    for i in range(degree):
+        for j in range(degree - 1, i - 1, -1):
+            out[:, j] += out[:, j + 1] * delta
+    return out.astype(coeffs.dtype, copy=False)
+
+
+def _normalized(starts, coeffs, length):
+    """PiecewiseSignal with vanishing top coefficients dropped and equal neighbouring segments merged."""
+    while coeffs.shape[1] > 1 and not np.any(coeffs[:, -1]):
+        coeffs = coeffs[:, :-1]
+    if len(starts) > 1:
+        continued = _recenter(coeffs[:-1], np.diff(starts))
+        keep = np.ones(len(starts), dtype=bool)
+        keep[1:] = np.any(continued != coeffs[1:], axis=1)
+        starts, coeffs = starts[keep], coeffs[keep]
+    return PiecewiseSignal(starts, coeffs, length)
+
+
+def _as_piecewise(signal):
+    """Return a compact signal as a PiecewiseSignal (each impulse a 1-sample segment)."""
+    if isinstance(signal, PiecewiseSignal):
+        return signal
+    index, values = signal.index, signal.values
+    starts = np.zeros(2 * len(index) + 1, dtype=np.intp)
+    starts[1::2] = index
+    starts[2::2] = index + 1
+    coeffs = np.zeros(len(starts), dtype=values.dtype)
+    coeffs[1::2] = values
+    # Of equal starts, keep the last (the others are empty segments)
+    keep = np.append(starts[1:] != starts[:-1], True) & (starts < signal.length)
+    return _normalized(starts[keep], coeffs[keep].reshape(-1, 1), signal.length)
+
+
+def _coefficients_at(signal, length, points):
+    """Coefficients of signal, zero-padded to length, re-expanded about each of the points."""
+    starts, coeffs = signal.starts, signal.coeffs
+    if signal.length < length:
+        starts = np.append(starts, signal.length)
+        coeffs = np.concatenate((coeffs, np.zeros((1, coeffs.shape[1]), dtype=coeffs.dtype)))
+    segment = np.searchsorted(starts, points, side='right') - 1
+    return _recenter(coeffs[segment], points - starts[segment])
+
+
+def _aligned(signal1, signal2):
+    """Common segment starts, both operands' coefficients on them, and the common length."""
+    length = max(signal1.length, signal2.length)
+    points = _union(signal1.starts, signal2.starts)
+    shorter = min(signal1.length, signal2.length)
+    if shorter < length:
+        points = _union(points, [shorter])
+    return (points, _coefficients_at(signal1, length, points),
+            _coefficients_at(signal2, length, points), length)
+
+
+def _split(signal1, signal2):
+    """Return (compact operand, other operand), preferring a sparse one as the first."""
+    if isinstance(signal2, SparseSignal) or not is_compact(signal1):
+        return signal2, signal1
+    return signal1, signal2
+
+
+def add(signal1, signal2, dtype=None):
+    """
+    Add two signals, at least one of them compact.
+
+    Parameters:
+        signal1, signal2 (SparseSignal, PiecewiseSignal or array-like): Operands
+        dtype (numpy dtype): Output dtype (default: NumPy promotion)
+
+    Returns:
+        SparseSignal if both operands are sparse, PiecewiseSignal if both are
+        compact, else a dense numpy.ndarray
+    """
+    if dtype is None:
+        dtype = np.result_type(signal1.dtype if is_compact(signal1) else np.asarray(signal1),
+                               signal2.dtype if is_compact(signal2) else np.asarray(signal2))
+    length = max(len(signal1), len(signal2))
+    if isinstance(signal1, SparseSignal) and isinstance(signal2, SparseSignal):
+        index = _union(signal1.index, signal2.index)
+        values = np.zeros(len(index), dtype=dtype)
+        values[np.searchsorted(index, signal1.index)] = signal1.values
+        values[np.searchsorted(index, signal2.index)] += signal2.values
+        return _nonzero(index, values, length)
+    if is_compact(signal1) and is_compact(signal2):
+        starts, coeffs1, coeffs2, length = _aligned(_as_piecewise(signal1), _as_piecewise(signal2))
+        coeffs = np.zeros((len(starts), max(coeffs1.shape[1], coeffs2.shape[1])), dtype=dtype)
+        coeffs[:, :coeffs1.shape[1]] = coeffs1
+        coeffs[:, :coeffs2.shape[1]] += coeffs2
+        return _normalized(starts, coeffs, length)
+    compact, other = _split(signal1, signal2)
+    other = np.asarray(other)
+    out = np.zeros(length, dtype=dtype)
+    out[:len(other)] = other
+    if isinstance(compact, SparseSignal):
+        out[compact.index] += compact.values
+    else:
+        out[:compact.length] += compact.to_array(dtype)
+    return out
+
+
+def multiply(signal1, signal2, dtype=None):
+    """
+    Multiply two signals, at least one of them compact.
+
+    Parameters:
+        signal1, signal2 (SparseSignal, PiecewiseSignal or array-like): Operands
+        dtype (numpy dtype): Output dtype (default: NumPy promotion)
+
+    Returns:
+        SparseSignal if either operand is sparse, PiecewiseSignal if both
+        are compact, else a dense numpy.ndarray
+    """
+    if dtype is None:
+        dtype = np.result_type(signal1.dtype if is_compact(signal1) else np.asarray(signal1),
+                               signal2.dtype if is_compact(signal2) else np.asarray(signal2))
+    length = max(len(signal1), len(signal2))
+    compact, other = _split(signal1, signal2)
+    if isinstance(compact, SparseSignal):
+        if isinstance(other, SparseSignal):
+            index, i, j = np.intersect1d(compact.index, other.index, assume_unique=True, return_indices=True)
+            return _nonzero(index, (compact.values[i] * other.values[j]).astype(dtype, copy=False), length)
+        inside = compact.index < len(other)
+        index = compact.index[inside]
+        sampled = other.at(index) if isinstance(other, PiecewiseSignal) else np.asarray(other)[index]
+        return _nonzero(index, (compact.values[inside] * sampled).astype(dtype, copy=False), length)
+    if is_compact(other):
+        starts, coeffs1, coeffs2, length = _aligned(compact, other)
+        coeffs = np.zeros((len(starts), coeffs1.shape[1] + coeffs2.shape[1] - 1), dtype=dtype)
+        for i in range(coeffs1.shape[1]):
+            for j in range(coeffs2.shape[1]):
+                coeffs[:, i + j] += coeffs1[:, i] * coeffs2[:, j]
+        return _normalized(starts, coeffs, length)
+    other = np.asarray(other)
+    overlap = min(compact.length, len(other))
+    out = np.zeros(length, dtype=dtype)
+    np.multiply(compact.to_array(dtype)[:overlap], other[:overlap], out=out[:overlap],
+                dtype=precision.compute_dtype(dtype))
+    return out
+
+
+def _grid(n):
+    """Return n as a 1-D array-like (a range is kept as is) and its length."""
+    if not isinstance(n, range):
+        n = np.asarray(n)
+        if n.ndim != 1:
+            raise ValueError(f"Compact signals need 1-D indices, got shape {n.shape}")
+    return n, len(n)
+
+
+def _nonnegative_runs(n):
+    """Return the run starts of n >= 0 / n < 0 and whether each run is n >= 0."""
+    n, length = _grid(n)
+    if not length:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=bool)
+    if isinstance(n, range):
+        # n is monotonic, so n >= 0 holds on a prefix or a suffix
+        if n.step > 0:
+            boundary = -(n.start // n.step)
+        else:
+            boundary = n.start // -n.step + 1
+        starts = np.array([0] + ([boundary] if 0 < boundary < length else []), dtype=np.intp)
+        return starts, n.start + n.step * starts >= 0
+    mask = n >= 0
+    starts = np.concatenate(([0], np.flatnonzero(mask[1:] != mask[:-1]) + 1))
+    return starts, mask[starts]
+
+
+def step(n, dtype=None):
+    """
+    Unit step u[n] as a PiecewiseSignal of constant runs.
+
+    Parameters:
+        n (array-like or range): 1-D time indices; a range is never materialised
+        dtype (numpy dtype): Output dtype (default: int, as unit_step)
+
+    Returns:
+        PiecewiseSignal: One run per change of sign of n
+    """
+    starts, flags = _nonnegative_runs(n)
+    return PiecewiseSignal(starts, flags.astype(int if dtype is None else dtype), len(n))
+
+
+def impulse(n, dtype=None):
+    """
+    Unit impulse δ[n] as a SparseSignal.
+
+    Parameters:
+        n (array-like or range): 1-D time indices; a range is never materialised
+        dtype (numpy dtype): Output dtype (default: float64, as unit_impulse)
+
+    Returns:
+        SparseSignal: A 1 at each position where n == 0
+    """
+    n, length = _grid(n)
+    if isinstance(n, range):
+        index = [n.index(0)] if 0 in n else []
+    else:
+        index = np.flatnonzero(n == 0)
+    return SparseSignal(index, np.ones(len(index), dtype=np.float64 if dtype is None else dtype), length)
+
+
+def ramp(n, dtype=None):
+    """
+    Ramp r[n] as a PiecewiseSignal of a zero run and a linear run.
+
+    Parameters:
+        n (array-like or range): 1-D, evenly spaced time indices; a range is
+            never materialised
+        dtype (numpy dtype): Output dtype (default: n's dtype, as ramp_signal)
+
+    Returns:
+        PiecewiseSignal: Zero where n < 0, n where n >= 0
+    """
+    n, length = _grid(n)
+    if isinstance(n, range):
+        values, spacing = (lambda p: n.start + n.step * p), n.step
+        default = np.dtype(int)
+    else:
+        spacing = n[1] - n[0] if length > 1 else 0
+        if length > 2 and not np.allclose(n, n[0] + spacing * np.arange(length), rtol=1e-12, atol=1e-9 * abs(spacing)):
+            raise ValueError("A compact ramp_signal needs evenly spaced n")
+        values, default = (lambda p: n[p]), n.dtype
+    starts, flags = _nonnegative_runs(n)
+    coeffs = np.zeros((len(starts), 2), dtype=default if dtype is None else dtype)
+    coeffs[flags, 0] = values(starts[flags])
+    coeffs[flags, 1] = spacing
+    return _normalized(starts, coeffs, length)
@@ -0,0 +1,212 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/spectral.py
+"""
+Spectral analysis module
+
+One-sided amplitude spectra and Welch power spectral density estimates of
+real signals, computed with real FFTs (rfft), which take about half the
+time and memory of complex transforms of the same length.
+
+Transform lengths are padded to fast 5-smooth sizes (see
+systems.next_fast_length) unless nfft is given: a prime-length transform
+costs several times a 5-smooth one. Each window, its normalisation sums
+and the padded FFT length are decided once per (length, window, nfft)
+by plan() and cached, so repeated calls on signals or segments of
+one length only transform.
+
+``welch`` reads the signal one batch of overlapping segments at a time,
+sized from ``memory_limit``, so long arrays, memory maps, SignalFiles and
+deferred expressions (see the outofcore and expression modules) are
+analysed in bounded memory. Segments are transformed in float64 whatever
+the signal's dtype: NumPy's float32 rfft is slower and allocates several
+times more than its float64 one.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import functools
+
+import numpy as np
+
+from . import expression
+from .systems import next_fast_length
+
+# Default working-memory budget of welch, in bytes
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Window name -> periodic (DFT-even) window of a given length
+_WINDOWS = {
+    'boxcar': np.ones,
+    'hann': lambda length: np.hanning(length + 1)[:-1],
+    'hamming': lambda length: np.hamming(length + 1)[:-1],
+    'blackman': lambda length: np.blackman(length + 1)[:-1],
+}
+
+_SCALINGS = ('density', 'spectrum')
+
+_DETRENDS = ('constant', None)
+
+# Dtype every signal is windowed and transformed in (see the module docstring)
+_WORK_DTYPE = np.dtype(np.float64)
+
+
+def _check_real(dtype):
+    """Raise ValueError unless samples of the given dtype are real."""
+    if np.issubdtype(np.dtype(dtype), np.complexfloating):
+        raise ValueError("Spectral analysis here expects a real signal")
+
+
+@functools.lru_cache(maxsize=64)
+def window(name, length):
+    """
+    Return the (cached, read-only, float64) periodic window of the given length.
+
+    Parameters:
+        name (str): 'hann', 'hamming', 'blackman' or 'boxcar'
+        length (int): Number of samples
+
+    Returns:
+        numpy.ndarray: The window
+    """
+    if name not in _WINDOWS:
+        raise ValueError(f"Unknown window {name!r}; expected one of {tuple(_WINDOWS)}")
+    values = np.asarray(_WINDOWS[name](length), dtype=_WORK_DTYPE)
+    values.setflags(write=False)
+    return values
+
+
+@functools.lru_cache(maxsize=64)
+def plan(length, window_name='hann', nfft=None):
+    """
+    Plan (and cache) the transform of length-sample segments.
+
+    Parameters:
+        length (int): Samples per segment
+        window_name (str): Window applied to each segment
+        nfft (int): FFT length (default: the next fast length >= length)
+
+    Returns:
+        tuple: (nfft, window, gain, power) where gain = Σw and power = Σw²
+    """
+    if length < 1:
+        raise ValueError(f"Segment length must be at least 1, got {length}")
+    nfft = next_fast_length(length) if nfft is None else int(nfft)
+    if nfft < length:
+        raise ValueError(f"nfft ({nfft}) must be at least the segment length ({length})")
+    values = window(window_name, length)
+    return nfft, values, float(values.sum()), float(np.dot(values, values))
+
+
+def _one_sided(values, nfft):
+    """Double the bins of a one-sided spectrum that stand for two (not DC or Nyquist)."""
+    values[..., 1:(nfft + 1) // 2] *= 2
+    return values
+
+
+def spectrum(signal, fs=1.0, window='boxcar', nfft=None):
+    """
+    One-sided amplitude spectrum of a real signal (along its last axis).
+
+    The window's coherent gain is divided out, so a sinusoid of amplitude A
+    on a bin shows a peak of A (zero padding interpolates the bins without
+    changing this).
+
+    Parameters:
+        signal (array-like): Real signal, or (channels..., samples) bank
+        fs (float): Sample rate in Hz
+        window (str): Window name (see window())
+        nfft (int): FFT length (default: the next fast length >= len(signal))
+
+    Returns:
+        tuple: (frequencies, amplitudes) of nfft // 2 + 1 bins
+    """
+    signal = np.asarray(signal)
+    _check_real(signal.dtype)
+    nfft, values, gain, _ = plan(signal.shape[-1], window, nfft)
+    weighted = np.multiply(signal, values, dtype=_WORK_DTYPE)
+    amplitudes = np.abs(np.fft.rfft(weighted, nfft))
+    amplitudes /= gain
+    return np.fft.rfftfreq(nfft, 1 / fs), _one_sided(amplitudes, nfft)
+
+
+def _reader(signal):
+    """Return (read(start, stop), length, dtype, leading shape) for a signal of any supported kind."""
+    if isinstance(signal, expression.Expr):
+        return signal._chunk, signal.length, signal.dtype, ()
+    signal = signal if isinstance(signal, np.ndarray) else np.asarray(signal)
+    return (lambda i, j: signal[..., i:j]), signal.shape[-1], signal.dtype, signal.shape[:-1]
+
+
+def welch(signal, fs=1.0, nperseg=256, noverlap=None, window='hann', nfft=None,
+          detrend='constant', scaling='density', memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Welch power spectral density estimate of a real signal (along its last axis).
+
+    The signal is split into segments of nperseg samples overlapping by
+    noverlap; each is detrended, windowed and transformed with rfft, and
+    the periodograms are averaged. Segments are read in batches that keep
+    the working memory within memory_limit, so the signal itself is never
+    loaded whole.
+
+    Parameters:
+        signal (array-like, numpy.memmap, SignalFile or Expr): Real signal,
+            or (channels..., samples) array
+        fs (float): Sample rate in Hz
+        nperseg (int): Samples per segment (at most the signal length)
+        noverlap (int): Samples shared by consecutive segments (default nperseg // 2)
+        window (str): Window name (see window())
+        nfft (int): FFT length per segment (default: the next fast length >= nperseg)
+        detrend (str or None): 'constant' removes each segment's mean; None keeps it
+        scaling (str): 'density' (V²/Hz) or 'spectrum' (V², a sinusoid of
+            amplitude A shows a peak of A²/2)
+        memory_limit (int): Working-memory budget in bytes
+
+    Returns:
+        tuple: (frequencies, psd) of nfft // 2 + 1 bins
+    """
+    if scaling not in _SCALINGS:
+        raise ValueError(f"Unknown scaling {scaling!r}; expected one of {_SCALINGS}")
+    if detrend not in _DETRENDS:
+        raise ValueError(f"Unknown detrend {detrend!r}; expected one of {_DETRENDS}")
+    read, length, dtype, leading = _reader(signal)
+    nperseg = int(nperseg)
+    if not 1 <= nperseg <= length:
+        raise ValueError(f"nperseg must be within [1, {length}], got {nperseg}")
+    noverlap = nperseg // 2 if noverlap is None else int(noverlap)
+    if not 0 <= noverlap < nperseg:
+        raise ValueError(f"noverlap must be within [0, {nperseg}), got {noverlap}")
+    _check_real(dtype)
+    work = _WORK_DTYPE
+    nfft, values, gain, power = plan(nperseg, window, nfft)
+    step = nperseg - noverlap
+    segments = (length - noverlap) // step
+    # Per segment: the windowed samples, the padded transform input, the
+    # complex bins and the periodogram, all in the work dtype
+    per_segment = int(np.prod(leading)) * work.itemsize * (nperseg + 3 * (nfft + 2))
+    batch = max(int(memory_limit) // per_segment, 1)
+
+    total = np.zeros(leading + (nfft // 2 + 1,), dtype=np.float64)
+    token = expression._deferred.set(False)
+    try:
+        for first in range(0, segments, batch):
+            count = min(batch, segments - first)
+            start = first * step
+            chunk = np.asarray(read(start, start + (count - 1) * step + nperseg))
+            frames = np.lib.stride_tricks.sliding_window_view(chunk, nperseg, axis=-1)[..., ::step, :]
+            if detrend == 'constant':
+                frames = np.subtract(frames, frames.mean(axis=-1, keepdims=True, dtype=work), dtype=work)
+                frames *= values
+            else:
+                frames = np.multiply(frames, values, dtype=work)
+            del chunk
+            bins = np.fft.rfft(frames, nfft)
+            del frames
+            periodogram = np.square(bins.real)
+            periodogram += np.square(bins.imag)
+            del bins
+            total += periodogram.sum(axis=-2, dtype=np.float64)
+    finally:
+        expression._deferred.reset(token)
+    scale = 1.0 / (fs * power) if scaling == 'density' else 1.0 / gain ** 2
+    total *= scale / segments
+    return np.fft.rfftfreq(nfft, 1 / fs), _one_sided(total, nfft)
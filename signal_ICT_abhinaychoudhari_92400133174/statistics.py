@@ -0,0 +1,198 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/statistics.py
+"""
+Streaming signal statistics module
+
+Computes max, min, mean, RMS, variance and peak-to-RMS ratio in one
+chunked pass. Each cache-sized chunk is copied once into a float64
+scratch buffer and reduced there, so the signal itself is read from memory
+once and no signal-sized temporaries (such as x**2) are created.
+
+Results are held in an Accumulator: count, mean and the sum of squared
+deviations (M2) combine exactly with Chan's parallel update, and min/max
+combine trivially, so accumulators from chunks, threads, processes (they
+pickle) or stream blocks merge into the statistics of the whole signal.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import math
+
+import numpy as np
+
+from . import expression, parallel
+
+# Samples per chunk: the float64 scratch buffer stays in L2 cache
+DEFAULT_CHUNK_SIZE = 32768
+
+
+class Accumulator:
+    """
+    Mergeable running statistics of a signal.
+
+    Attributes:
+        count (int): Number of samples seen
+        mean (float): Running mean
+        m2 (float): Sum of squared deviations from the mean
+        maximum, minimum (float): Extremes seen so far
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'maximum', 'minimum')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.maximum = -math.inf
+        self.minimum = math.inf
+
+    def update(self, block, scratch=None):
+        """
+        Add a block of samples.
+
+        Parameters:
+            block (array-like): Samples (any shape; all elements count)
+            scratch (numpy.ndarray): Optional float64 buffer of at least
+                block.size elements, reused to avoid allocation
+
+        Returns:
+            Accumulator: self
+        """
+        block = np.asarray(block).reshape(-1)
+        n = block.size
+        if n == 0:
+            return self
+        if scratch is None or len(scratch) < n:
+            scratch = np.empty(n)
+        values = scratch[:n]
+        np.copyto(values, block, casting='unsafe')
+        other = Accumulator()
+        other.count = n
+        other.maximum = float(values.max())
+        other.minimum = float(values.min())
+        other.mean = float(values.sum()) / n
+        values -= other.mean
+        other.m2 = float(np.dot(values, values))
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Combine another accumulator into this one (Chan's parallel update).
+
+        Returns:
+            Accumulator: self
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.maximum, self.minimum = other.maximum, other.minimum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.maximum = max(self.maximum, other.maximum)
+        self.minimum = min(self.minimum, other.minimum)
+        return self
+
+    @classmethod
+    def combine(cls, accumulators):
+        """Return a new accumulator merging all the given ones."""
+        total = cls()
+        for accumulator in accumulators:
+            total.merge(accumulator)
+        return total
+
+    @property
+    def variance(self):
+        """Population variance (as np.var)."""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def rms(self):
+        """Root mean square, sqrt(mean² + variance)."""
+        return math.sqrt(self.mean * self.mean + self.variance) if self.count else math.nan
+
+    @property
+    def peak(self):
+        """Largest absolute sample value."""
+        return max(abs(self.maximum), abs(self.minimum)) if self.count else math.nan
+
+    @property
+    def peak_to_rms(self):
+        """Crest factor: peak / RMS."""
+        rms = self.rms
+        return self.peak / rms if rms else math.nan
+
+    def result(self):
+        """Return the statistics as a dict."""
+        return {'samples': self.count, 'max': self.maximum if self.count else math.nan,
+                'min': self.minimum if self.count else math.nan,
+                'mean': self.mean if self.count else math.nan, 'rms': self.rms,
+                'variance': self.variance, 'peak_to_rms': self.peak_to_rms}
+
+    def __repr__(self):
+        return ("Accumulator(" + ", ".join(f"{key}={value:.6g}" for key, value in self.result().items()) + ")")
+
+
+def _accumulate(signal, chunk_size, start=0, stop=None):
+    """Accumulate samples [start, stop) of a 1-D array or Expr with one scratch buffer."""
+    stop = len(signal) if stop is None else stop
+    accumulator = Accumulator()
+    scratch = np.empty(min(chunk_size, stop - start))
+    for i in range(start, stop, chunk_size):
+        j = min(i + chunk_size, stop)
+        if isinstance(signal, expression.Expr):
+            block = signal._chunk(i, j)
+        else:
+            block = signal[i:j]
+        accumulator.update(block, scratch)
+    return accumulator
+
+
+def _partitioned(signal, chunk_size, workers):
+    """Accumulate ranges of an array or Expr on separate threads and merge them."""
+    workers = parallel.check_workers(workers)
+    if workers == 1:
+        return _accumulate(signal, chunk_size)
+    bounds = parallel.chunk_bounds(len(signal), workers, chunk_size)
+    parts = [None] * len(bounds)
+
+    def run(k):
+        parts[k] = _accumulate(signal, chunk_size, *bounds[k])
+
+    parallel.for_each(run, range(len(bounds)), workers)
+    return Accumulator.combine(parts)
+
+
+def signal_statistics(signal, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """
+    Compute max, min, mean, RMS, variance and peak-to-RMS in one chunked pass.
+
+    Parameters:
+        signal: Array-like (including memmaps), deferred expression or
+            SignalFile, or an iterator of blocks (e.g. sine_wave_stream)
+        chunk_size (int): Samples reduced per chunk
+        workers (int): Threads reducing separate ranges of an array or
+            expression (their accumulators are merged)
+
+    Returns:
+        Accumulator: Statistics (see Accumulator.result())
+    """
+    if isinstance(signal, expression.Expr):
+        token = expression._deferred.set(False)
+        try:
+            return _partitioned(signal, chunk_size, workers)
+        finally:
+            expression._deferred.reset(token)
+    if not hasattr(signal, '__next__'):
+        return _partitioned(np.asarray(signal).reshape(-1), chunk_size, workers)
+    accumulator = Accumulator()
+    scratch = np.empty(chunk_size)
+    for block in signal:
+        block = np.asarray(block).reshape(-1)
+        for i in range(0, block.size, chunk_size):
+            accumulator.update(block[i:i + chunk_size], scratch)
+    return accumulator
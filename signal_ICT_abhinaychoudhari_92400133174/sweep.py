@@ -0,0 +1,182 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/sweep.py
+"""
+Parameter sweep module
+
+Generates sine or cosine waves for every combination of amplitude,
+frequency and phase on a grid, optionally pushes each one through a chain
+of operations, and fans the work out over a process pool. Workers write
+their results straight into one multiprocessing.shared_memory block, so
+only (start, stop) batch bounds and small timing reports cross process
+boundaries; no arrays are pickled back. Each worker's throughput is
+reported so scaling against core count can be checked.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import concurrent.futures
+import math
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import trigonometric_signals
+
+# Samples generated per batch handed to a worker
+DEFAULT_BATCH_SAMPLES = 1 << 20
+
+# Batches per worker, so uneven batches still balance across the pool
+_BATCHES_PER_WORKER = 4
+
+_WAVEFORMS = {
+    'sine': trigonometric_signals.sine_wave,
+    'cosine': trigonometric_signals.cosine_wave,
+}
+
+# Per-worker state set by _attach: (shared memory, values view, job parameters)
+_worker = None
+
+
+class SweepResult:
+    """
+    Sweep output held in shared memory.
+
+    Attributes:
+        values (numpy.ndarray): Results of shape (len(A), len(f), len(phi), samples),
+            a view of the shared-memory block (copy it to keep it after close())
+        workers (list of dict): Per-worker pid, combinations, samples, seconds
+            and samples_per_second
+        elapsed (float): Wall-clock seconds for the whole sweep
+    """
+
+    __slots__ = ('values', 'workers', 'elapsed', '_shm')
+
+    def __init__(self, shm, shape, dtype):
+        self._shm = shm
+        self.values = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        self.workers = []
+        self.elapsed = 0.0
+
+    @property
+    def name(self):
+        """Name of the shared-memory block holding the values."""
+        return self._shm.name
+
+    @property
+    def samples_per_second(self):
+        """Overall throughput of the sweep."""
+        return self.values.size / self.elapsed if self.elapsed else float('inf')
+
+    def close(self):
+        """Release and unlink the shared-memory block (values becomes invalid)."""
+        if self._shm is not None:
+            self.values = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _fill(values, axes, t, waveform, method, chain, start, stop):
+    """Compute flat grid combinations [start, stop) into values; return a timing report."""
+    began = time.perf_counter()
+    ia, jf, kp = np.unravel_index(np.arange(start, stop), tuple(len(axis) for axis in axes))
+    A, f, phi = axes[0][ia], axes[1][jf], axes[2][kp]
+    rows = values.reshape(-1, values.shape[-1])[start:stop]
+    generate = _WAVEFORMS[waveform]
+    if chain is None:
+        generate(A, f, phi, t, method=method, out=rows)
+    else:
+        for row, signal in zip(rows, generate(A, f, phi, t, method=method)):
+            row[...] = chain(signal)
+    return os.getpid(), stop - start, rows.size, time.perf_counter() - began
+
+
+def _attach(name, shape, dtype, axes, t, waveform, method, chain):
+    """Pool initializer: attach to the shared output block once per worker."""
+    global _worker
+    shm = shared_memory.SharedMemory(name=name)
+    values = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker = (shm, values, (axes, t, waveform, method, chain))
+
+
+def _run(bounds):
+    _, values, job = _worker
+    return _fill(values, *job, *bounds)
+
+
+def _summarise(reports):
+    per_worker = {}
+    for pid, combinations, samples, seconds in reports:
+        entry = per_worker.setdefault(pid, {'pid': pid, 'combinations': 0, 'samples': 0, 'seconds': 0.0})
+        entry['combinations'] += combinations
+        entry['samples'] += samples
+        entry['seconds'] += seconds
+    for entry in per_worker.values():
+        entry['samples_per_second'] = entry['samples'] / entry['seconds'] if entry['seconds'] else float('inf')
+    return list(per_worker.values())
+
+
+def parameter_sweep(t, A, f, phi, waveform='sine', chain=None, workers=None,
+                    batch_samples=DEFAULT_BATCH_SAMPLES, method='direct'):
+    """
+    Generate a waveform for every (A, f, phi) combination on a grid.
+
+    Parameters:
+        t (array-like): Time values shared by every combination
+        A, f, phi (scalar or 1-D array-like): Grid axes of amplitude, frequency and phase
+        waveform (str): 'sine' or 'cosine'
+        chain (callable): Optional picklable function applied to each generated
+            signal (e.g. functools.partial(time_shift, k=5)); it must return
+            signals of the same length for every combination
+        workers (int): Worker processes (default os.cpu_count(); 1 runs in-process)
+        batch_samples (int): Target output samples per batch of combinations
+        method (str): Oscillator method passed to the generator
+
+    Returns:
+        SweepResult: Shared-memory results and per-worker throughput; call
+        close() (or use it as a context manager) to free the block
+    """
+    if waveform not in _WAVEFORMS:
+        raise ValueError(f"Unknown waveform {waveform!r}; expected one of {tuple(_WAVEFORMS)}")
+    t = np.asarray(t)
+    axes = tuple(np.atleast_1d(np.asarray(p, dtype=float)) for p in (A, f, phi))
+    if any(axis.ndim != 1 for axis in axes):
+        raise ValueError("A, f and phi must be scalars or 1-D arrays")
+    workers = (os.cpu_count() or 1) if workers is None else int(workers)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    # Probe one combination for the output length and dtype of the chain
+    probe = _WAVEFORMS[waveform](axes[0][:1], axes[1][:1], axes[2][:1], t, method=method)[0]
+    if chain is not None:
+        probe = np.asarray(chain(probe))
+    shape = tuple(len(axis) for axis in axes) + (len(probe),)
+    total = math.prod(shape[:-1])
+    shm = shared_memory.SharedMemory(create=True, size=max(math.prod(shape) * probe.dtype.itemsize, 1))
+    result = SweepResult(shm, shape, probe.dtype)
+
+    batch = max(1, min(batch_samples // max(len(probe), 1),
+                       -(-total // (workers * _BATCHES_PER_WORKER))))
+    bounds = [(i, min(i + batch, total)) for i in range(0, total, batch)]
+    began = time.perf_counter()
+    try:
+        if workers == 1:
+            reports = [_fill(result.values, axes, t, waveform, method, chain, *b) for b in bounds]
+        else:
+            job = (shm.name, shape, probe.dtype.str, axes, t, waveform, method, chain)
+            with concurrent.futures.ProcessPoolExecutor(workers, initializer=_attach, initargs=job) as pool:
+                reports = list(pool.map(_run, bounds))
+    except BaseException:
+        result.close()
+        raise
+    result.elapsed = time.perf_counter() - began
+    result.workers = _summarise(reports)
+    return result
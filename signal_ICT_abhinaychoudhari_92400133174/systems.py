@@ -0,0 +1,246 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/systems.py
+"""
+LTI systems module
+
+Pushes signals through linear time-invariant systems given by their
+impulse response h[n]: y[n] = (x * h)[n]. Short kernels are convolved
+directly; longer ones use FFT overlap-add with block lengths padded to fast
+5-smooth sizes. Kernel spectra are cached, so convolving many signals with
+the same system only transforms the kernel once, and BlockConvolver
+processes a stream block by block while carrying the overlap tail.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import collections
+import functools
+import hashlib
+import threading
+
+import numpy as np
+
+from . import precision
+
+# Kernels up to this many taps are convolved directly by default
+DIRECT_MAX_TAPS = 64
+
+# FFT size is about this many times the kernel length for overlap-add
+_FFT_OVERSIZE = 8
+
+# Blocks transformed together by one vectorised overlap-add pass
+_BLOCKS_PER_PASS = 64
+
+# Number of kernel spectra kept by the cache
+KERNEL_CACHE_SIZE = 32
+
+_METHODS = ('auto', 'direct', 'fft')
+
+_kernel_cache = collections.OrderedDict()
+_kernel_cache_lock = threading.Lock()  # convolve runs on worker and executor threads
+
+
+@functools.lru_cache(maxsize=256)
+def next_fast_length(n):
+    """Return the smallest 2^a·3^b·5^c >= n (a length pocketfft handles fast)."""
+    if n <= 1:
+        return 1
+    best = 1 << (n - 1).bit_length()
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            length = power35
+            while length < n:
+                length *= 2
+            best = min(best, length)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+def kernel_spectrum(kernel, nfft):
+    """
+    Return the (cached, read-only) FFT of a kernel zero-padded to nfft.
+
+    Real kernels use rfft. The cache is keyed on a digest of the kernel
+    bytes, so equal kernels share a spectrum across calls and objects.
+    Thread-safe: the FFT is computed outside the lock, so two threads
+    missing on the same kernel may both compute it.
+    """
+    kernel = np.ascontiguousarray(kernel)
+    key = (hashlib.blake2b(kernel.tobytes(), digest_size=16).digest(),
+           kernel.dtype.str, len(kernel), nfft)
+    with _kernel_cache_lock:
+        spectrum = _kernel_cache.get(key)
+        if spectrum is not None:
+            _kernel_cache.move_to_end(key)
+            return spectrum
+    if np.iscomplexobj(kernel):
+        spectrum = np.fft.fft(kernel, nfft)
+    else:
+        spectrum = np.fft.rfft(kernel, nfft)
+    spectrum.setflags(write=False)
+    with _kernel_cache_lock:
+        _kernel_cache[key] = spectrum
+        if len(_kernel_cache) > KERNEL_CACHE_SIZE:
+            _kernel_cache.popitem(last=False)
+    return spectrum
+
+
+def clear_kernel_cache():
+    """Drop all cached kernel spectra."""
+    with _kernel_cache_lock:
+        _kernel_cache.clear()
+
+
+def _fft_conv(blocks, kernel, nfft):
+    """Full linear convolution of each row of blocks with kernel, via FFT."""
+    spectrum = kernel_spectrum(kernel, nfft)
+    if np.iscomplexobj(blocks) or np.iscomplexobj(kernel):
+        return np.fft.ifft(np.fft.fft(blocks, nfft) * spectrum, nfft)
+    return np.fft.irfft(np.fft.rfft(blocks, nfft) * spectrum, nfft)
+
+
+def _overlap_add(signal, kernel, dtype=float):
+    """Full convolution of a long signal with a long kernel by overlap-add, computed in dtype."""
+    taps = len(kernel)
+    nfft = next_fast_length(_FFT_OVERSIZE * taps)
+    block = nfft - taps + 1
+    blocks = -(-len(signal) // block)
+    dtype = np.result_type(signal, kernel, dtype)
+    out = np.zeros((blocks + 1) * block, dtype=dtype)
+    for first in range(0, blocks, _BLOCKS_PER_PASS):
+        count = min(_BLOCKS_PER_PASS, blocks - first)
+        start = first * block
+        chunk = signal[start:start + count * block]
+        chunk = np.pad(chunk, (0, count * block - len(chunk))).reshape(count, block)
+        result = _fft_conv(chunk, kernel, nfft)
+        # Each block's head lands in its own slot; its tail (taps-1 < block
+        # samples) overlaps the start of the next slot.
+        out[start:start + count * block].reshape(count, block)[...] += result[:, :block]
+        tails = out[start + block:start + (count + 1) * block]
+        tails.reshape(count, block)[:, :taps - 1] += result[:, block:]
+    return out[:len(signal) + taps - 1]
+
+
+def _choose(method, signal_length, taps):
+    if method not in _METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {_METHODS}")
+    if method == 'auto':
+        return 'direct' if min(signal_length, taps) <= DIRECT_MAX_TAPS else 'fft'
+    return method
+
+
+def convolve(signal, kernel, method='auto', dtype=None):
+    """
+    Convolve a signal with an impulse response (full linear convolution).
+
+    Parameters:
+        signal (array-like): Input signal x[n]
+        kernel (array-like): System impulse response h[n]
+        method (str): 'direct', 'fft' (overlap-add), or 'auto' to pick by
+            kernel length (direct up to DIRECT_MAX_TAPS taps)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else the inputs' result type, as np.convolve gives); the
+            convolution runs in its compute dtype, so float32 is convolved
+            and transformed in float32
+
+    Returns:
+        numpy.ndarray: y = x * h of length len(signal) + len(kernel) - 1, of
+        the same dtype whichever method runs. Integer results from 'fft'
+        are rounded back to integers, exact while |y| stays far below 2^52.
+    """
+    signal = np.asarray(signal)
+    kernel = np.asarray(kernel)
+    if len(signal) == 0 or len(kernel) == 0:
+        raise ValueError("signal and kernel must be non-empty")
+    if len(kernel) > len(signal):
+        signal, kernel = kernel, signal
+    dtype = precision.resolve(dtype)
+    if dtype is None:
+        dtype = np.result_type(signal, kernel)
+    elif np.iscomplexobj(signal) or np.iscomplexobj(kernel):
+        # Complex inputs stay complex, at the policy's precision
+        dtype = np.result_type(dtype, 1j)
+    exact = dtype.kind in 'biu'
+    if not exact:
+        compute = precision.compute_dtype(dtype)
+        signal, kernel = signal.astype(compute, copy=False), kernel.astype(compute, copy=False)
+    if _choose(method, len(signal), len(kernel)) == 'direct':
+        result = np.convolve(signal, kernel)
+    else:
+        result = _overlap_add(signal, kernel, float if exact else compute)
+    if exact and result.dtype.kind in 'fc':
+        result = np.rint(result.real)
+    return result.astype(dtype, copy=False)
+
+
+class BlockConvolver:
+    """
+    Streaming convolution that carries the overlap tail between blocks.
+
+    process() returns as many output samples as it receives input samples;
+    flush() returns the final len(kernel)-1 samples. Concatenated, they
+    equal convolve(whole_signal, kernel).
+
+    The FFT size is fixed per instance, so every block reuses one cached
+    kernel spectrum whatever its length; blocks longer than max_block are
+    processed in max_block pieces.
+
+    Parameters:
+        kernel (array-like): System impulse response h[n]
+        method (str): 'direct', 'fft' or 'auto' (see convolve)
+        max_block (int): Largest block transformed at once (default: the
+            overlap-add block length of convolve, whose spectrum it shares)
+    """
+
+    __slots__ = ('kernel', 'method', 'max_block', '_nfft', '_tail')
+
+    def __init__(self, kernel, method='auto', max_block=None):
+        self.kernel = np.asarray(kernel)
+        taps = len(self.kernel)
+        if taps == 0:
+            raise ValueError("kernel must be non-empty")
+        self.method = _choose(method, np.inf, taps)
+        if max_block is None:
+            self._nfft = next_fast_length(_FFT_OVERSIZE * taps)
+        elif max_block > 0:
+            self._nfft = next_fast_length(int(max_block) + taps - 1)
+        else:
+            raise ValueError("max_block must be a positive integer")
+        # next_fast_length may round up, which leaves room for a longer block
+        self.max_block = self._nfft - taps + 1
+        self.reset()
+
+    def reset(self):
+        """Clear the carried tail and start a new stream."""
+        self._tail = np.zeros(len(self.kernel) - 1, dtype=np.result_type(self.kernel, float))
+
+    def process(self, block):
+        """
+        Convolve the next input block.
+
+        Returns:
+            numpy.ndarray: len(block) output samples
+        """
+        block = np.asarray(block)
+        if len(block) == 0:
+            return np.zeros(0, dtype=self._tail.dtype)
+        if self.method == 'direct':
+            result = np.convolve(block, self.kernel)
+        elif len(block) > self.max_block:
+            return np.concatenate([self.process(block[i:i + self.max_block])
+                                   for i in range(0, len(block), self.max_block)])
+        else:
+            result = _fft_conv(block, self.kernel, self._nfft)[:len(block) + len(self.kernel) - 1]
+        result = result.astype(np.result_type(result, self._tail), copy=False)
+        result[:len(self._tail)] += self._tail
+        self._tail = result[len(block):].copy()
+        return result[:len(block)]
+
+    def flush(self):
+        """Return the remaining len(kernel)-1 output samples and reset."""
+        tail = self._tail
+        self.reset()
+        return tail
@@ -0,0 +1,429 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/trigonometric_signals.py
+"""
+Trigonometric signals module
+
+Generates sine, cosine and exponential signals over a time vector.
+Generators return arrays only; pass ``plot=True`` to also display the signal.
+The ``*_stream`` variants yield fixed-size blocks of an unbounded signal
+with constant memory and exact phase continuity across blocks.
+
+Sine and cosine accept ``method='phasor'`` to generate a uniformly sampled
+wave by complex-phasor rotation instead of evaluating sin/cos per sample;
+``quadrature_wave`` returns both outputs from a single rotation pass.
+``method='wavetable_linear'``/``'wavetable_cubic'`` interpolate a
+precomputed table with an integer phase accumulator (see the wavetable
+module).
+
+``A``, ``f``, ``phi`` (and ``a``) may be arrays: they are broadcast against
+each other and the result has shape (channels..., samples), e.g. a bank of
+tones in one vectorised call. ``dtype=``/``out=`` select or supply the output
+buffer, which is then filled in place without intermediate temporaries;
+``out=`` may also name a shared-memory segment (see the shared module).
+``workers=`` fills that buffer in chunks from a thread pool (see the
+parallel module); results are identical to the serial path.
+
+Inside ``expression.deferred()`` the generators return expression nodes
+that are evaluated chunk by chunk (see the expression module). While the
+cache module is enabled, repeated calls return cached read-only arrays.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+from fractions import Fraction
+
+import numpy as np
+
+from . import cache, expression, instrumentation, parallel, precision, shared, wavetable
+from ._plotting import plot_continuous
+
+
+_METHODS = ('direct', 'phasor', 'wavetable_linear', 'wavetable_cubic')
+
+# Renormalise the block-start phasor to unit magnitude every this many steps
+_RENORM_INTERVAL = 64
+
+
+def _phasor(f, phi, t, spacing=None):
+    """
+    Return exp(i(2πft + φ)) for a uniformly spaced time vector t.
+
+    spacing is (t0, dt, first) from expression.grid_spacing, which is called
+    (and raises ValueError for an unevenly spaced t) if it is not given.
+
+    The output is built in blocks of B ≈ √N samples: a table of B base
+    phasors exp(iωk) is multiplied by the start phasor of each block, and
+    the start phasors follow the recurrence s[m+1] = s[m]·exp(iωB), so
+    each output sample costs one complex multiply and only about 2√N
+    complex exponentials are evaluated. The start phasor is renormalised to
+    unit magnitude every _RENORM_INTERVAL steps.
+
+    Error bound: each recurrence step adds at most ~4·eps of magnitude and
+    phase error, and the rounding of ω·B accumulates linearly, so the
+    absolute error of the unit phasor is below about (|ω|·N + 4·M)·eps
+    with M = N/B blocks. The first term is the same order as the phase
+    rounding of the direct 2πft evaluation; for N = 10^7 the observed
+    deviation from np.sin is ~1e-11.
+
+    Inside a deferred chunk (see expression.grid_position) the blocks and
+    the recurrence are those of the whole grid, and only the blocks the
+    chunk overlaps are expanded, so chunks equal the eager result exactly.
+    """
+    t = np.asarray(t, dtype=float)
+    t0, dt, first = expression.grid_spacing(t) if spacing is None else spacing
+    n = np.size(expression.grid_position(t)[0])
+    if n < 2:
+        return np.exp(1j * (2 * np.pi * f * t + phi))
+    omega = 2 * np.pi * f * dt
+    block = max(64, int(np.sqrt(n)))
+    lo, hi = first // block, -(-(first + t.size) // block)
+
+    base = np.exp(1j * omega * np.arange(block))
+    rotation = complex(np.exp(1j * omega * block))
+    starts = np.empty(hi - lo, dtype=complex)
+    start = complex(np.exp(1j * (2 * np.pi * f * t0 + phi)))
+    for m in range(hi):
+        if m >= lo:
+            starts[m - lo] = start
+        start *= rotation
+        if m % _RENORM_INTERVAL == _RENORM_INTERVAL - 1:
+            start /= abs(start)
+
+    phasor = np.empty((hi - lo, block), dtype=complex)
+    np.multiply(starts[:, None], base, out=phasor)
+    offset = first - lo * block
+    return phasor.ravel()[offset:offset + t.size].reshape(t.shape)
+
+
+def _check_method(method):
+    if method not in _METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {_METHODS}")
+
+
+def _prepare(t, params, dtype, out):
+    """
+    Broadcast scalar or array parameters against the time vector.
+
+    Returns t as an array, the parameters with trailing axes added so they
+    broadcast over the samples, and the output buffer of shape
+    (channels..., samples...) -- either allocated or the validated ``out``
+    (an array, a SharedSignal, or a shared segment name, see shared.resolve).
+    """
+    t = np.asarray(t)
+    params = [p if np.isscalar(p) else np.asarray(p) for p in params]
+    shape = np.broadcast(*[np.asarray(p) for p in params]).shape + t.shape
+    named = isinstance(out, str)
+    dtype = precision.resolve(dtype) if out is None or named or dtype is not None else None
+    if out is None or named:
+        dtype = np.result_type(*params, t, 1.0) if dtype is None else dtype
+        out = np.empty(shape, dtype=dtype) if out is None else shared.resolve(out, shape, dtype)
+    else:
+        out = shared.resolve(out, shape, dtype)
+        if out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, expected {shape}")
+        if dtype is not None and np.dtype(dtype) != out.dtype:
+            raise ValueError(f"dtype {np.dtype(dtype)} does not match out.dtype {out.dtype}")
+    expand = (Ellipsis,) + (None,) * t.ndim
+    params = [p[expand] if np.ndim(p) else p for p in params]
+    return t, params, out
+
+
+def _fill_phasor(out, A, f, phi, t, part, workers=None):
+    """
+    Fill each channel of out with A×(real or imag part of) the phasor.
+
+    The phasor recurrence runs along the whole time vector, so with
+    workers > 1 the channels, not chunks of samples, are spread over threads.
+    t's spacing is checked once, not per channel.
+    """
+    channels = out.shape[:out.ndim - t.ndim]
+    first = (0,) * t.ndim
+    A, f, phi = (np.broadcast_to(p, channels + (1,) * t.ndim) for p in (A, f, phi))
+    spacing = expression.grid_spacing(t)
+
+    def channel(index):
+        phasor = _phasor(f[index + first], phi[index + first], t, spacing)
+        np.multiply(A[index + first], getattr(phasor, part), out=out[index])
+
+    parallel.for_each(channel, np.ndindex(*channels), workers)
+
+
+def _fill_wavetable(out, A, f, phi, t, waveform, method, workers=None):
+    """Fill each channel of out from the wavetable ('wavetable_linear' or 'wavetable_cubic')."""
+    channels = out.shape[:out.ndim - t.ndim]
+    first = (0,) * t.ndim
+    A, f, phi = (np.broadcast_to(p, channels + (1,) * t.ndim) for p in (A, f, phi))
+    interpolation = method.split('_')[1]
+    spacing = expression.grid_spacing(t)
+
+    def channel(index):
+        wavetable.fill(out[index], A[index + first], f[index + first], phi[index + first], t,
+                       waveform, wavetable.DEFAULT_SIZE, interpolation, spacing)
+
+    parallel.for_each(channel, np.ndindex(*channels), workers)
+
+
+def _fill_direct(out, t, func, A, f, phi):
+    """out = A×func(2πft + φ), computed in place (float16 via float32 blocks)."""
+    def fill(out, t):
+        np.multiply(2 * np.pi * f, t, out=out)
+        out += phi
+        func(out, out=out)
+        out *= A
+
+    precision.blockwise(fill, out, t)
+
+
+@instrumentation.instrument
+@cache.memoize('t')
+def sine_wave(A, f, phi, t, plot=False, method='direct', dtype=None, out=None, workers=None):
+    """
+    Generate a sine wave signal.
+
+    Parameters:
+        A (float or array-like): Amplitude
+        f (float or array-like): Frequency in Hz
+        phi (float or array-like): Phase shift in radians
+        t (array-like): Time vector
+        plot (bool): If True, plot the generated signal
+        method (str): 'direct' evaluates np.sin per sample; 'phasor' uses
+            complex-phasor rotation; 'wavetable_linear'/'wavetable_cubic'
+            interpolate a precomputed table (all but 'direct' need a
+            uniformly spaced t and raise ValueError otherwise)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else float64 or t's float dtype; float16 is computed in float32)
+        out (numpy.ndarray, SharedSignal or str): Preallocated output to fill
+            in place, or the name of a shared-memory segment to write into
+        workers (int): Threads filling the output in chunks (default: serial)
+
+    Returns:
+        numpy.ndarray: Sine wave: A×sin(2πft + φ), of shape
+        (channels..., samples) when the parameters are arrays
+    """
+    _check_method(method)
+    if not plot and out is None and expression.is_deferred():
+        params = dict(A=A, f=f, phi=phi, method=method, dtype=precision.resolve(dtype))
+        return expression.Generator(sine_wave, 't', t, params)
+    t, (A, f, phi), signal = _prepare(t, (A, f, phi), dtype, out)
+    if method == 'phasor':
+        _fill_phasor(signal, A, f, phi, t, 'imag', workers)
+    elif method != 'direct':
+        _fill_wavetable(signal, A, f, phi, t, 'sine', method, workers)
+    else:
+        parallel.fill(lambda out, t: _fill_direct(out, t, np.sin, A, f, phi), signal, t, workers=workers)
+    if plot:
+        plot_continuous(t, signal, f'Sine Wave: {A}sin(2π×{f}×t + {phi})')
+    return signal
+
+
+@instrumentation.instrument
+@cache.memoize('t')
+def cosine_wave(A, f, phi, t, plot=False, method='direct', dtype=None, out=None, workers=None):
+    """
+    Generate a cosine wave signal.
+
+    Parameters:
+        A (float or array-like): Amplitude
+        f (float or array-like): Frequency in Hz
+        phi (float or array-like): Phase shift in radians
+        t (array-like): Time vector
+        plot (bool): If True, plot the generated signal
+        method (str): 'direct' evaluates np.cos per sample; 'phasor' uses
+            complex-phasor rotation; 'wavetable_linear'/'wavetable_cubic'
+            interpolate a precomputed table (all but 'direct' need a
+            uniformly spaced t and raise ValueError otherwise)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else float64 or t's float dtype; float16 is computed in float32)
+        out (numpy.ndarray, SharedSignal or str): Preallocated output to fill
+            in place, or the name of a shared-memory segment to write into
+        workers (int): Threads filling the output in chunks (default: serial)
+
+    Returns:
+        numpy.ndarray: Cosine wave: A×cos(2πft + φ), of shape
+        (channels..., samples) when the parameters are arrays
+    """
+    _check_method(method)
+    if not plot and out is None and expression.is_deferred():
+        params = dict(A=A, f=f, phi=phi, method=method, dtype=precision.resolve(dtype))
+        return expression.Generator(cosine_wave, 't', t, params)
+    t, (A, f, phi), signal = _prepare(t, (A, f, phi), dtype, out)
+    if method == 'phasor':
+        _fill_phasor(signal, A, f, phi, t, 'real', workers)
+    elif method != 'direct':
+        _fill_wavetable(signal, A, f, phi, t, 'cosine', method, workers)
+    else:
+        parallel.fill(lambda out, t: _fill_direct(out, t, np.cos, A, f, phi), signal, t, workers=workers)
+    if plot:
+        plot_continuous(t, signal, f'Cosine Wave: {A}cos(2π×{f}×t + {phi})')
+    return signal
+
+
+@instrumentation.instrument
+def quadrature_wave(A, f, phi, t, plot=False, method='phasor', dtype=None):
+    """
+    Generate a sine and a cosine wave of the same frequency in one pass.
+
+    Parameters:
+        A (float): Amplitude
+        f (float): Frequency in Hz
+        phi (float): Phase shift in radians
+        t (array-like): Time vector (uniformly spaced, else every method but
+            'direct' raises ValueError)
+        plot (bool): If True, plot both generated signals
+        method (str): 'phasor' (default), 'direct', 'wavetable_linear' or 'wavetable_cubic'
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else float64 or t's float dtype; float16 is computed in float32)
+
+    Returns:
+        tuple: (A×sin(2πft + φ), A×cos(2πft + φ)) as numpy.ndarrays
+    """
+    _check_method(method)
+    t = np.asarray(t)
+    dtype = precision.resolve(dtype)
+    dtype = np.result_type(A, f, phi, t, 1.0) if dtype is None else dtype
+    sine, cosine = np.empty(t.shape, dtype=dtype), np.empty(t.shape, dtype=dtype)
+    if method == 'phasor':
+        phasor = _phasor(f, phi, t)
+        np.multiply(A, phasor.imag, out=sine)
+        np.multiply(A, phasor.real, out=cosine)
+    elif method != 'direct':
+        interpolation = method.split('_')[1]
+        spacing = expression.grid_spacing(t)
+        wavetable.fill(sine, A, f, phi, t, 'sine', wavetable.DEFAULT_SIZE, interpolation, spacing)
+        wavetable.fill(cosine, A, f, phi, t, 'cosine', wavetable.DEFAULT_SIZE, interpolation, spacing)
+    else:
+        _fill_direct(sine, t, np.sin, A, f, phi)
+        _fill_direct(cosine, t, np.cos, A, f, phi)
+    if plot:
+        plot_continuous(t, sine, f'Sine Wave: {A}sin(2π×{f}×t + {phi})')
+        plot_continuous(t, cosine, f'Cosine Wave: {A}cos(2π×{f}×t + {phi})')
+    return sine, cosine
+
+
+def _fill_exponential(out, t, A, a):
+    """out = A×e^(at), computed in place (float16 via float32 blocks)."""
+    def fill(out, t):
+        np.multiply(a, t, out=out)
+        np.exp(out, out=out)
+        out *= A
+
+    precision.blockwise(fill, out, t)
+
+
+@instrumentation.instrument
+@cache.memoize('t')
+def exponential_signal(A, a, t, plot=False, dtype=None, out=None, workers=None):
+    """
+    Generate an exponential signal.
+
+    Parameters:
+        A (float or array-like): Amplitude scaling factor
+        a (float or array-like): Exponential parameter (positive=growth, negative=decay)
+        t (array-like): Time vector
+        plot (bool): If True, plot the generated signal
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else float64 or t's float dtype; float16 is computed in float32)
+        out (numpy.ndarray, SharedSignal or str): Preallocated output to fill
+            in place, or the name of a shared-memory segment to write into
+        workers (int): Threads filling the output in chunks (default: serial)
+
+    Returns:
+        numpy.ndarray: Exponential signal: A×e^(at), of shape
+        (channels..., samples) when the parameters are arrays
+    """
+    if not plot and out is None and expression.is_deferred():
+        params = dict(A=A, a=a, dtype=precision.resolve(dtype))
+        return expression.Generator(exponential_signal, 't', t, params)
+    t, (A, a), signal = _prepare(t, (A, a), dtype, out)
+    parallel.fill(lambda out, t: _fill_exponential(out, t, A, a), signal, t, workers=workers)
+    if plot:
+        plot_continuous(t, signal, f'Exponential Signal: {A}e^({a}t)')
+    return signal
+
+
+def _phase_blocks(f, phi, fs, block_size, n_samples, start):
+    """
+    Yield blocks of instantaneous phase 2π·f·n/fs + φ for n = start, start+1, ...
+
+    The phase at the start of each block is reduced modulo one cycle using
+    exact rational arithmetic (floats are exact binary fractions), so the
+    error stays at a few ulps however many samples have been produced.
+    Within a block the error is bounded by block_size·eps cycles.
+    """
+    if fs <= 0:
+        raise ValueError("Sampling rate fs must be positive")
+    if block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+    step = Fraction(float(f)) / Fraction(float(fs))
+    offsets = np.arange(block_size) * float(step)
+    index = int(start)
+    remaining = None if n_samples is None else int(n_samples)
+    while remaining is None or remaining > 0:
+        size = block_size if remaining is None else min(block_size, remaining)
+        cycles = float((index * step) % 1)
+        phase = offsets[:size] + cycles
+        phase *= 2 * np.pi
+        phase += phi
+        yield phase
+        index += size
+        if remaining is not None:
+            remaining -= size
+
+
+def _wave_blocks(func, A, f, phi, fs, block_size, n_samples, start, dtype):
+    """Yield blocks of A×func(phase) stored in dtype (None: float64), computed in its compute dtype."""
+    dtype = np.dtype(float if dtype is None else dtype)
+    compute = precision.compute_dtype(dtype)
+    for phase in _phase_blocks(f, phi, fs, block_size, n_samples, start):
+        block = phase.astype(compute, copy=False)
+        func(block, out=block)
+        block *= A
+        yield block.astype(dtype, copy=False)
+
+
+def sine_wave_stream(A, f, phi, fs, block_size=4096, n_samples=None, start=0, dtype=None):
+    """
+    Generate a sine wave as an iterator of fixed-size blocks.
+
+    Sample n of the stream equals sine_wave(A, f, phi, t=n/fs). Only one
+    block is held in memory at a time, so the duration is unbounded.
+
+    Parameters:
+        A (float): Amplitude
+        f (float): Frequency in Hz
+        phi (float): Phase shift in radians
+        fs (float): Sampling rate in Hz
+        block_size (int): Samples per yielded block
+        n_samples (int or None): Total samples to produce (None=infinite)
+        start (int): Index of the first sample (for resuming a stream)
+        dtype (numpy dtype): Block dtype (default: the dtype policy in effect
+            when the stream is created, else float64; float16 is computed in float32)
+
+    Yields:
+        numpy.ndarray: Consecutive blocks of A×sin(2πfn/fs + φ)
+    """
+    return _wave_blocks(np.sin, A, f, phi, fs, block_size, n_samples, start, precision.resolve(dtype))
+
+
+def cosine_wave_stream(A, f, phi, fs, block_size=4096, n_samples=None, start=0, dtype=None):
+    """
+    Generate a cosine wave as an iterator of fixed-size blocks.
+
+    Sample n of the stream equals cosine_wave(A, f, phi, t=n/fs). Only one
+    block is held in memory at a time, so the duration is unbounded.
+
+    Parameters:
+        A (float): Amplitude
+        f (float): Frequency in Hz
+        phi (float): Phase shift in radians
+        fs (float): Sampling rate in Hz
+        block_size (int): Samples per yielded block
+        n_samples (int or None): Total samples to produce (None=infinite)
+        start (int): Index of the first sample (for resuming a stream)
+        dtype (numpy dtype): Block dtype (default: the dtype policy in effect
+            when the stream is created, else float64; float16 is computed in float32)
+
+    Yields:
+        numpy.ndarray: Consecutive blocks of A×cos(2πfn/fs + φ)
+    """
+    return _wave_blocks(np.cos, A, f, phi, fs, block_size, n_samples, start, precision.resolve(dtype))
@@ -0,0 +1,154 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/unitary_signals.py
+"""
+Unitary signals module
+
+Generates the basic discrete-time signals: unit step u[n], unit impulse
+δ[n] and ramp r[n]. Generators return arrays only; pass ``plot=True`` to
+also display the signal. Inside ``expression.deferred()`` they return
+expression nodes instead. ``workers=`` evaluates long index vectors in
+chunks from a thread pool (see the parallel module), and while the cache
+module is enabled repeated calls return cached read-only arrays. Under a
+dtype policy or with ``dtype=`` the values are written straight into an
+output of that dtype by the comparison ufuncs (see the precision module).
+With ``compact=True`` they return the compact forms of the sparse module
+instead: a SparseSignal of (index, value) pairs for the impulse, and a
+PiecewiseSignal of runs for the step and the ramp.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import numpy as np
+
+from . import cache, expression, instrumentation, parallel, precision, sparse
+from ._plotting import plot_discrete
+
+
+def _indicator(compare, n, out):
+    """
+    Write compare(n, 0) into out as 0/1.
+
+    NumPy converts to float16 in software, so float16 outputs get the bit
+    pattern of 1.0 written through an unsigned-integer view instead.
+    """
+    if out.dtype != np.float16:
+        return compare(n, 0, out=out)
+    bits = out.view(np.uint16)
+    compare(n, 0, out=bits)
+    bits *= np.ones((), dtype=np.float16).view(np.uint16)
+    return out
+
+
+@instrumentation.instrument
+@cache.memoize('n')
+def unit_step(n, plot=False, workers=None, dtype=None, compact=False):
+    """
+    Generate a unit step signal u[n].
+
+    Parameters:
+        n (array-like or range): Time indices or sample points (a range is
+            not materialised with compact=True)
+        plot (bool): If True, stem-plot the generated signal
+        workers (int): Threads filling the output in chunks (default: serial)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else from n as before)
+        compact (bool): If True, return a PiecewiseSignal of constant runs
+
+    Returns:
+        numpy.ndarray: Unit step signal values (1 for n>=0, 0 for n<0); a
+        PiecewiseSignal with compact=True
+    """
+    dtype = precision.resolve(dtype)
+    if compact:
+        step = sparse.step(n, dtype)
+        if plot:
+            plot_discrete(np.asarray(n), step.to_array(), 'Unit Step Signal u[n]')
+        return step
+    if not plot and expression.is_deferred():
+        return expression.Generator(unit_step, 'n', n, dict(dtype=dtype))
+    n = np.asarray(n)
+    if dtype is None:
+        step = parallel.elementwise(lambda n: np.where(n >= 0, 1, 0), n, workers)
+    else:
+        step = np.empty(n.shape, dtype=dtype)
+        parallel.fill(lambda out, n: _indicator(np.greater_equal, n, out), step, n, workers=workers)
+    if plot:
+        plot_discrete(n, step, 'Unit Step Signal u[n]')
+    return step
+
+
+@instrumentation.instrument
+@cache.memoize('n')
+def unit_impulse(n, plot=False, workers=None, dtype=None, compact=False):
+    """
+    Generate a unit impulse signal δ[n].
+
+    Parameters:
+        n (array-like or range): Time indices or sample points (a range is
+            not materialised with compact=True)
+        plot (bool): If True, stem-plot the generated signal
+        workers (int): Threads filling the output in chunks (default: serial)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else from n as before)
+        compact (bool): If True, return a SparseSignal of (index, value) pairs
+
+    Returns:
+        numpy.ndarray: Unit impulse signal values (1 for n=0, 0 elsewhere); a
+        SparseSignal with compact=True
+    """
+    dtype = precision.resolve(dtype)
+    if compact:
+        impulse = sparse.impulse(n, dtype)
+        if plot:
+            plot_discrete(np.asarray(n), impulse.to_array(), 'Unit Impulse Signal δ[n]')
+        return impulse
+    if not plot and expression.is_deferred():
+        return expression.Generator(unit_impulse, 'n', n, dict(dtype=dtype))
+    n = np.asarray(n)
+    if dtype is None:
+        impulse = parallel.elementwise(lambda n: np.where(n == 0, 1.0, 0.0), n, workers)
+    else:
+        impulse = np.empty(n.shape, dtype=dtype)
+        parallel.fill(lambda out, n: _indicator(np.equal, n, out), impulse, n, workers=workers)
+    if plot:
+        plot_discrete(n, impulse, 'Unit Impulse Signal δ[n]')
+    return impulse
+
+
+@instrumentation.instrument
+@cache.memoize('n')
+def ramp_signal(n, plot=False, workers=None, dtype=None, compact=False):
+    """
+    Generate a ramp signal r[n].
+
+    Parameters:
+        n (array-like or range): Time indices or sample points (a range is
+            not materialised with compact=True)
+        plot (bool): If True, stem-plot the generated signal
+        workers (int): Threads filling the output in chunks (default: serial)
+        dtype (numpy dtype): Output dtype (default: the dtype policy in
+            effect, else from n as before)
+        compact (bool): If True, return a PiecewiseSignal of a zero and a linear run
+            (n must then be evenly spaced)
+
+    Returns:
+        numpy.ndarray: Ramp signal values (n for n>=0, 0 for n<0); a
+        PiecewiseSignal with compact=True
+    """
+    dtype = precision.resolve(dtype)
+    if compact:
+        ramp = sparse.ramp(n, dtype)
+        if plot:
+            plot_discrete(np.asarray(n), ramp.to_array(), 'Ramp Signal r[n]')
+        return ramp
+    if not plot and expression.is_deferred():
+        return expression.Generator(ramp_signal, 'n', n, dict(dtype=dtype))
+    n = np.asarray(n)
+    if dtype is None:
+        ramp = parallel.elementwise(lambda n: np.where(n >= 0, n, 0), n, workers)
+    else:
+        ramp = np.empty(n.shape, dtype=dtype)
+        parallel.fill(lambda out, n: np.maximum(n, 0, out=out), ramp, n, workers=workers)
+    if plot:
+        plot_discrete(n, ramp, 'Ramp Signal r[n]')
+    return ramp
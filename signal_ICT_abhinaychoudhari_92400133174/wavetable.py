@@ -0,0 +1,163 @@
+# File: signal_ICT_abhinaychoudhari_92400133174/wavetable.py
+"""
+Wavetable oscillator module
+
+Backs ``method='wavetable_linear'`` and ``method='wavetable_cubic'`` of
+sine_wave and cosine_wave. One cycle of a sine is tabulated once per
+process for each power-of-two size, as per-segment polynomial
+coefficients, and each output sample is a table lookup plus linear or
+cubic (Catmull-Rom) interpolation instead of a call to sin.
+
+The phase is a 64-bit unsigned integer accumulator, phase[n] = phase[0] +
+n·increment (mod 2^64), with one cycle spanning 2^64: its top log2(size)
+bits index the table and the remaining bits give the interpolation
+fraction. The accumulator is exact and wraps naturally, so the phase never
+drifts however long the signal is; the frequency is quantised to 2^-64
+cycles per sample. The time vector must be uniformly spaced;
+fill() raises ValueError otherwise.
+
+Signal-to-noise ratio of a full-scale sine (noise = deviation from np.sin),
+measured over 10^6 samples at an incommensurate frequency:
+
+    size      linear    cubic
+    256        85 dB    135 dB
+    1024      109 dB    171 dB
+    4096      133 dB    207 dB
+    16384     157 dB   >216 dB
+    65536     181 dB   >216 dB
+
+Linear interpolation gains 12 dB and cubic 18 dB per doubling of the
+table. Beyond 16384 entries the cubic error falls below the phase rounding
+of the float64 reference (2πft + φ evaluated directly), about 216 dB.
+The cubic table of DEFAULT_SIZE entries takes 128 KiB and stays in cache.
+
+Author: Abhinay Choudhari
+Contact: 92400133174
+"""
+
+import functools
+
+import numpy as np
+
+from . import expression
+
+# Table length used by the generators' wavetable methods (a power of two)
+DEFAULT_SIZE = 4096
+
+INTERPOLATIONS = ('linear', 'cubic')
+
+# Samples synthesised per pass, so the phase scratch stays in cache
+_BLOCK = 16384
+
+_CYCLE = 2.0 ** 64
+
+
+@functools.lru_cache(maxsize=None)
+def table(size=DEFAULT_SIZE, interpolation='cubic'):
+    """
+    Return the (cached, read-only) coefficient table of one sine cycle.
+
+    Column i holds the coefficients of the polynomial in the fraction x in
+    [0, 1) between samples i and i+1: (c0, c1) for linear interpolation
+    (c0 + c1·x) and (c0, c1, c2, c3) for Catmull-Rom cubic interpolation.
+    Each coefficient is a contiguous row, so lookups are fast np.take calls.
+    """
+    if size < 4 or size & (size - 1):
+        raise ValueError(f"Table size must be a power of two >= 4, got {size}")
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation {interpolation!r}; expected one of {INTERPOLATIONS}")
+    y = np.sin(2 * np.pi * np.arange(-1, size + 2) / size)
+    p0, p1, p2, p3 = y[:-3], y[1:-2], y[2:-1], y[3:]
+    if interpolation == 'linear':
+        coefficients = np.stack([p1, p2 - p1])
+    else:
+        coefficients = np.stack([
+            p1,
+            0.5 * (p2 - p0),
+            p0 - 2.5 * p1 + 2 * p2 - 0.5 * p3,
+            1.5 * (p1 - p2) + 0.5 * (p3 - p0),
+        ])
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+def _phase_step(f, phi, t0, dt, offset):
+    """Return the accumulator start and increment (as 64-bit integers) for a uniform grid t0 + dt·k."""
+    start = (f * t0 + phi / (2 * np.pi) + offset) % 1.0
+    step = (f * dt) % 1.0
+    return int(start * _CYCLE) % 2 ** 64, int(step * _CYCLE) % 2 ** 64
+
+
+def fill(out, A, f, phi, t, waveform='sine', size=DEFAULT_SIZE, interpolation='cubic', spacing=None):
+    """
+    Fill out with A×sin(2πft + φ) (or cos) synthesised from the wavetable.
+
+    Parameters:
+        out (numpy.ndarray): Output of t's shape, filled in place
+        A, f, phi (float): Amplitude, frequency in Hz and phase in radians
+        t (array-like): Uniformly spaced time vector
+        waveform (str): 'sine' or 'cosine'
+        size (int): Table length (a power of two)
+        interpolation (str): 'linear' or 'cubic'
+        spacing (tuple): (t0, dt, first) from expression.grid_spacing, when
+            the caller has already checked t
+
+    Returns:
+        numpy.ndarray: out
+
+    Raises:
+        ValueError: If t is not evenly spaced
+    """
+    if out.size == 0:
+        return out
+    coefficients = table(size, interpolation)
+    bits = size.bit_length() - 1
+    shift = np.uint64(64 - bits)
+    mask = np.uint64((1 << (64 - bits)) - 1)
+    scale = 2.0 ** -(64 - bits)
+    # Inside a deferred chunk, continue the accumulator of the whole grid
+    t0, dt, first = expression.grid_spacing(t) if spacing is None else spacing
+    start, step = _phase_step(f, phi, t0, dt, 0.25 if waveform == 'cosine' else 0.0)
+
+    target = out if out.flags.c_contiguous else np.empty(out.shape)
+    flat = target.reshape(-1)
+    length = min(_BLOCK, flat.size)
+    counter = np.arange(length, dtype=np.uint64)
+    phase = np.empty(length, dtype=np.uint64)
+    index = np.empty(length, dtype=np.uint64)
+    x = np.empty(length)
+    value = np.empty(length)
+    term = np.empty(length)
+    for begin in range(0, flat.size, _BLOCK):
+        n = min(_BLOCK, flat.size - begin)
+        p, i, frac, v, c = phase[:n], index[:n], x[:n], value[:n], term[:n]
+        np.multiply(counter[:n], np.uint64(step), out=p)
+        p += np.uint64((start + (first + begin) * step) % 2 ** 64)
+        np.right_shift(p, shift, out=i)
+        np.bitwise_and(p, mask, out=p)
+        np.multiply(p, scale, out=frac)
+        # Horner evaluation of the segment polynomial at the fraction; the
+        # indices are < size by construction, so 'clip' just skips bounds checks
+        i = i.view(np.int64)
+        np.take(coefficients[-1], i, out=v, mode='clip')
+        for row in coefficients[-2::-1]:
+            v *= frac
+            np.take(row, i, out=c, mode='clip')
+            v += c
+        np.multiply(v, A, out=flat[begin:begin + n])
+    if target is not out:
+        out[...] = target
+    return out
+
+
+def wave(A, f, phi, t, waveform='sine', size=DEFAULT_SIZE, interpolation='cubic'):
+    """
+    Generate a sine or cosine wave from the wavetable with explicit table settings.
+
+    Returns:
+        numpy.ndarray: A×sin(2πft + φ) ('sine') or A×cos(2πft + φ) ('cosine')
+    """
+    if waveform not in ('sine', 'cosine'):
+        raise ValueError(f"Unknown waveform {waveform!r}; expected 'sine' or 'cosine'")
+    t = np.asarray(t)
+    return fill(np.empty(t.shape), A, f, phi, t, waveform, size, interpolation)
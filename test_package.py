@@ -86,6 +86,179 @@ def test_trigonometric_signals():
         print(f"✗ Trigonometric signals test failed: {e}")
         return False
 
+def test_multichannel_generation():
+    """Test broadcasted multi-channel generation with dtype/out"""
+    print("\nTesting multi-channel generation...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import sine_wave, cosine_wave, exponential_signal
+        
+        t = np.linspace(0, 1, 500)
+        A = np.array([1.0, 2.0, 0.5])
+        f = np.array([5.0, 7.5, 11.0])
+        phi = np.array([0.0, 0.3, np.pi / 2])
+        
+        # Each row matches a single-channel call exactly
+        bank = sine_wave(A, f, phi, t)
+        assert bank.shape == (3, 500), "Tone bank shape incorrect"
+        for i in range(3):
+            assert np.array_equal(bank[i], sine_wave(A[i], f[i], phi[i], t)), "Tone bank row mismatch"
+        phasor_bank = cosine_wave(A, f, phi, t, method='phasor')
+        assert np.allclose(phasor_bank, cosine_wave(A, f, phi, t), atol=1e-10), "Phasor bank mismatch"
+        
+        # Scalars broadcast against arrays; exponential supports banks too
+        assert sine_wave(2, f, 0, t).shape == (3, 500), "Scalar broadcasting failed"
+        decays = exponential_signal(1, np.array([-1.0, -2.0]), t)
+        assert np.array_equal(decays[1], exponential_signal(1, -2.0, t)), "Exponential bank mismatch"
+        
+        # Preallocated output is filled in place; dtype selects precision
+        out = np.empty((3, 500))
+        assert cosine_wave(A, f, phi, t, out=out) is out, "out buffer not used"
+        assert sine_wave(A, f, phi, t, dtype=np.float32).dtype == np.float32, "dtype ignored"
+        
+        print("✓ Multi-channel generation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Multi-channel generation test failed: {e}")
+        return False
+
+def test_phasor_oscillator():
+    """Test the recursive phasor oscillator mode"""
+    print("\nTesting phasor oscillator...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import sine_wave, cosine_wave, quadrature_wave
+        
+        t = np.linspace(0, 1, 100000)
+        for f, phi in [(5, 0), (123.4, 0.7), (-3, np.pi / 3)]:
+            sine = sine_wave(A=2, f=f, phi=phi, t=t, method='phasor')
+            cosine = cosine_wave(A=2, f=f, phi=phi, t=t, method='phasor')
+            assert np.allclose(sine, sine_wave(A=2, f=f, phi=phi, t=t), atol=1e-10), "Phasor sine mismatch"
+            assert np.allclose(cosine, cosine_wave(A=2, f=f, phi=phi, t=t), atol=1e-10), "Phasor cosine mismatch"
+        
+        sine, cosine = quadrature_wave(A=1, f=5, phi=0, t=t[:1000])
+        assert np.allclose(sine ** 2 + cosine ** 2, 1.0), "Quadrature outputs not orthogonal"
+        assert np.allclose(sine, sine_wave(A=1, f=5, phi=0, t=t[:1000])), "Quadrature sine mismatch"
+        
+        try:
+            sine_wave(A=1, f=1, phi=0, t=t, method='table')
+            assert False, "Unknown method should raise ValueError"
+        except ValueError:
+            pass
+        
+        # An unevenly spaced grid raises instead of returning wrong values
+        uneven = np.sort(np.random.default_rng(0).random(1000))
+        for generate in (lambda: sine_wave(A=1, f=5, phi=0, t=uneven, method='phasor'),
+                         lambda: cosine_wave(A=[1, 2], f=5, phi=0, t=uneven, method='phasor'),
+                         lambda: quadrature_wave(A=1, f=5, phi=0, t=uneven)):
+            try:
+                generate()
+                assert False, "Unevenly spaced t should raise ValueError"
+            except ValueError:
+                pass
+        assert np.allclose(sine_wave(1, 5, 0, t.astype(np.float32), method='phasor'),
+                           sine_wave(1, 5, 0, t), atol=1e-5), "float32 linspace grid rejected or wrong"
+        
+        print("✓ Phasor oscillator tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Phasor oscillator test failed: {e}")
+        return False
+
+def test_wavetable_oscillator():
+    """Test the interpolated wavetable oscillator backend"""
+    print("\nTesting wavetable oscillator...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import sine_wave, cosine_wave, wavetable
+        
+        t = np.arange(200000) / 48000
+        reference = sine_wave(A=2, f=997.5, phi=0.3, t=t)
+        linear = sine_wave(A=2, f=997.5, phi=0.3, t=t, method='wavetable_linear')
+        cubic = sine_wave(A=2, f=997.5, phi=0.3, t=t, method='wavetable_cubic')
+        assert np.max(np.abs(linear - reference)) < 2e-6, "Linear wavetable too inaccurate"
+        assert np.max(np.abs(cubic - reference)) < 2e-9, "Cubic wavetable too inaccurate"
+        cosine = cosine_wave(A=[1, 3], f=[5, -40], phi=0, t=t, method='wavetable_cubic')
+        assert np.allclose(cosine, cosine_wave(A=[1, 3], f=[5, -40], phi=0, t=t), atol=1e-8), "Cosine bank mismatch"
+        
+        # SNR grows with the table size, as documented
+        snrs = [10 * np.log10(np.mean(reference ** 2) / np.mean((wavetable.wave(2, 997.5, 0.3, t, size=size,
+                interpolation='linear') - reference) ** 2)) for size in (256, 1024, 4096)]
+        assert snrs[0] > 80 and snrs[1] > snrs[0] + 20 and snrs[2] > snrs[1] + 20, f"Unexpected SNRs {snrs}"
+        
+        # Tables are built once per process and shared read-only
+        assert wavetable.table(4096, 'cubic') is wavetable.table(4096, 'cubic'), "Table rebuilt"
+        assert not wavetable.table(4096, 'cubic').flags.writeable, "Table is writeable"
+        try:
+            wavetable.table(1000)
+            assert False, "Non-power-of-two table size should raise ValueError"
+        except ValueError:
+            pass
+
+        # Empty grids and deferred evaluation work like the direct method
+        from signal_ICT_abhinaychoudhari_92400133174 import quadrature_wave, expression, dtype_policy
+        for method in ('wavetable_linear', 'wavetable_cubic'):
+            assert sine_wave(2, 5, 0, np.zeros(0), method=method).shape == (0,), "Empty grid failed"
+            assert cosine_wave([1, 2], 5, 0, np.zeros(0), method=method).shape == (2, 0), "Empty bank failed"
+            assert all(q.shape == (0,) for q in quadrature_wave(2, 5, 0, np.zeros(0), method=method)), \
+                "Empty quadrature failed"
+            with dtype_policy('float32'):
+                assert sine_wave(2, 5, 0, np.zeros(0), method=method).dtype == np.float32, "Empty grid dtype wrong"
+            with expression.deferred():
+                node = sine_wave(2, 997.5, 0.3, t, method=method)
+            assert isinstance(node, expression.Expr), "Wavetable not deferred"
+            assert np.array_equal(np.asarray(node), sine_wave(2, 997.5, 0.3, t, method=method)), \
+                "Deferred wavetable differs"
+            
+            # An unevenly spaced grid raises instead of returning wrong values
+            uneven = np.sort(np.random.default_rng(0).random(1000))
+            for generate in (lambda: sine_wave(2, 5, 0, uneven, method=method),
+                             lambda: cosine_wave([1, 2], 5, 0, uneven, method=method),
+                             lambda: quadrature_wave(2, 5, 0, uneven, method=method),
+                             lambda: wavetable.wave(2, 5, 0, uneven, interpolation=method.split('_')[1])):
+                try:
+                    generate()
+                    assert False, "Unevenly spaced t should raise ValueError"
+                except ValueError:
+                    pass
+
+        print("✓ Wavetable oscillator tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Wavetable oscillator test failed: {e}")
+        return False
+
+def test_streaming_oscillators():
+    """Test block-wise streaming oscillators"""
+    print("\nTesting streaming oscillators...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            sine_wave, cosine_wave, sine_wave_stream, cosine_wave_stream
+        )
+        
+        fs = 1000
+        t = np.arange(2500) / fs
+        
+        # Concatenated blocks match the whole-array generators
+        blocks = list(sine_wave_stream(A=2, f=5, phi=0.3, fs=fs, block_size=256, n_samples=2500))
+        assert [len(b) for b in blocks[-2:]] == [256, 196], "Block sizes incorrect"
+        assert np.allclose(np.concatenate(blocks), sine_wave(A=2, f=5, phi=0.3, t=t)), "Sine stream mismatch"
+        blocks = cosine_wave_stream(A=1, f=7, phi=0, fs=fs, block_size=100, n_samples=2500)
+        assert np.allclose(np.concatenate(list(blocks)), cosine_wave(A=1, f=7, phi=0, t=t)), "Cosine stream mismatch"
+        
+        # Phase stays exact far into the stream (f/fs = 1/800)
+        start = 10**12 + 3
+        block = next(sine_wave_stream(A=1, f=1.25, phi=0, fs=fs, block_size=4, start=start))
+        expected = np.sin(2 * np.pi * ((start + np.arange(4)) % 800) / 800)
+        assert np.allclose(block, expected, atol=1e-12), "Phase drifted after 10^12 samples"
+
+        # NumPy scalar parameters behave like Python floats
+        blocks = sine_wave_stream(A=2, f=np.float32(5), phi=0.3, fs=np.int64(fs), block_size=256, n_samples=2500)
+        assert np.allclose(np.concatenate(list(blocks)), sine_wave(A=2, f=5, phi=0.3, t=t)), "NumPy scalar stream mismatch"
+
+        print("✓ Streaming oscillator tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Streaming oscillator test failed: {e}")
+        return False
+
 def test_operations():
     """Test signal operations functionality"""
     print("\nTesting signal operations...")
@@ -123,6 +296,1028 @@ def test_operations():
         print(f"✗ Operations test failed: {e}")
         return False
 
+def test_polyphase_resampling():
+    """Test anti-aliased rational resampling behind time_scale"""
+    print("\nTesting polyphase resampling...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import time_scale, Resampler, resampling
+        
+        n = np.arange(2000)
+        middle = slice(200, -200)
+        
+        # A slow tone survives compression and fractional ratios accurately
+        for k in (2, 0.5, 1.5, 160 / 147):
+            up, down = resampling.ratio(k)
+            scaled = time_scale(np.sin(2 * np.pi * 0.01 * n), k)
+            expected = np.sin(2 * np.pi * 0.01 * np.arange(len(scaled)) * down / up)
+            assert len(scaled) == len(n) * up // down, f"Length incorrect for k={k}"
+            assert np.allclose(scaled[middle], expected[middle], atol=2e-3), f"Resampling inaccurate for k={k}"
+        
+        assert np.array_equal(time_scale(n, np.float32(0.5)), time_scale(n, 0.5)), "NumPy scalar factor failed"
+        
+        # A tone above the new Nyquist rate is filtered out instead of aliasing
+        fast = np.sin(2 * np.pi * 0.4 * n)
+        assert np.max(np.abs(time_scale(fast, 2)[middle])) < 0.01, "Polyphase output aliased"
+        assert np.max(np.abs(time_scale(fast, 2, method='index'))) > 0.5, "Index method should alias"
+        
+        # Filter designs are cached per ratio
+        assert resampling.design(2, 3) is resampling.design(2, 3), "Filter design not cached"
+        
+        # Streaming with carried filter state matches the whole-array result exactly
+        x = np.random.default_rng(0).standard_normal(5000)
+        resampler = Resampler(k=147 / 160)
+        blocks = [resampler.process(x[i:i + 333]) for i in range(0, len(x), 333)]
+        blocks.append(resampler.flush())
+        assert np.array_equal(np.concatenate(blocks), time_scale(x, 147 / 160)), "Streaming resampler mismatch"
+        
+        print("✓ Polyphase resampling tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Polyphase resampling test failed: {e}")
+        return False
+
+def test_lti_convolution():
+    """Test convolution against impulse and step responses"""
+    print("\nTesting LTI convolution...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            unit_step, unit_impulse, exponential_signal, convolve, BlockConvolver, systems
+        )
+        
+        n = np.arange(-10, 2000)
+        t = np.arange(500) / 100
+        for taps in (32, 500):
+            h = exponential_signal(A=1, a=-2, t=t[:taps])
+            for method in ('direct', 'fft', 'auto'):
+                # Impulse response reproduces h, step response its running sum
+                impulse_response = convolve(unit_impulse(n), h, method=method)
+                step_response = convolve(unit_step(n), h, method=method)
+                assert len(impulse_response) == len(n) + taps - 1, "Convolution length incorrect"
+                assert np.allclose(impulse_response[10:10 + taps], h), f"Impulse response wrong ({method})"
+                assert np.allclose(impulse_response[:10], 0), f"Response before impulse ({method})"
+                assert np.allclose(step_response[10:10 + taps], np.cumsum(h)), f"Step response wrong ({method})"
+        
+        # Kernel spectra are cached across calls
+        systems.clear_kernel_cache()
+        convolve(unit_step(n), h, method='fft')
+        convolve(unit_impulse(n), h.copy(), method='fft')
+        assert len(systems._kernel_cache) == 1, "Kernel spectrum not reused"
+        
+        # Streaming with preserved tail matches the whole-signal step response
+        convolver = BlockConvolver(h, method='fft')
+        step = unit_step(n)
+        blocks = [convolver.process(step[i:i + 300]) for i in range(0, len(step), 300)]
+        blocks.append(convolver.flush())
+        assert np.allclose(np.concatenate(blocks), convolve(step, h)), "Block convolution mismatch"
+        
+        # Blocks of any length share one FFT size, and so one cached spectrum
+        systems.clear_kernel_cache()
+        convolver = BlockConvolver(h, method='fft', max_block=1000)
+        sizes = [100, 333, 1000, 7, 2500]
+        edges = np.cumsum([0] + sizes)
+        blocks = [convolver.process(step[i:j]) for i, j in zip(edges[:-1], edges[1:])]
+        blocks.append(convolver.flush())
+        assert len(systems._kernel_cache) == 1, "Block sizes recomputed the kernel spectrum"
+        assert np.allclose(np.concatenate(blocks), convolve(step[:edges[-1]], h)), "Variable block convolution mismatch"
+        
+        # Integer inputs give the same exact integers by either method
+        x, k = np.arange(-300, 300) % 17, np.arange(100) % 5 - 2
+        direct, fft = convolve(x, k, method='direct'), convolve(x, k, method='fft')
+        assert direct.dtype == fft.dtype == np.result_type(x, k), f"Dtypes differ: {direct.dtype}, {fft.dtype}"
+        assert np.array_equal(direct, fft), "FFT integer convolution not exact"
+        
+        # The spectrum cache survives concurrent convolutions that keep evicting it
+        import concurrent.futures
+        kernels = [np.random.default_rng(seed).standard_normal(100) for seed in range(systems.KERNEL_CACHE_SIZE + 8)]
+        signal = np.random.default_rng(99).standard_normal(5000)
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda h: convolve(signal, h, method='fft'), kernels * 4))
+        assert all(np.allclose(y, np.convolve(signal, h)) for y, h in zip(results, kernels * 4)), \
+            "Threaded convolution mismatch"
+        assert len(systems._kernel_cache) <= systems.KERNEL_CACHE_SIZE, "Spectrum cache overgrew"
+        
+        print("✓ LTI convolution tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ LTI convolution test failed: {e}")
+        return False
+
+def test_block_pipeline():
+    """Test stateful block-processing pipeline stages"""
+    print("\nTesting block pipeline...")
+    try:
+        import tracemalloc
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            pipeline, Pipeline, unit_step, sine_wave, time_shift, time_scale
+        )
+        
+        x = np.random.default_rng(0).standard_normal(8000)
+        step = unit_step(np.arange(-100, 7900))
+        
+        def run(stage_or_pipeline, size):
+            return np.concatenate([stage_or_pipeline.process(x[i:i + size].copy()).copy()
+                                   for i in range(0, len(x), size)])
+        
+        # Ring-buffer delay matches time_shift, including blocks larger than max_block
+        for k in (0, 5, 300):
+            assert np.array_equal(run(pipeline.Delay(k, max_block=256), 1000), time_shift(x, k)[:len(x)]), "Delay mismatch"
+        
+        # Streaming resample matches time_scale exactly on the samples emitted so far
+        for k in (2, 0.5, 160 / 147):
+            streamed = run(pipeline.Resample(k, max_block=500), 500)
+            assert np.array_equal(streamed, time_scale(x, k)[:len(streamed)]), f"Resample stage mismatch for k={k}"
+        
+        # Mixers match signal_addition / signal_multiplication with their sources
+        added = run(pipeline.Add(pipeline.ArraySource(step), max_block=64), 100)
+        assert np.array_equal(added, x + step), "Add stage mismatch"
+        carrier = pipeline.Oscillator(A=2, f=5, phi=0.3, fs=1000, max_block=64)
+        mixed = run(pipeline.Multiply(carrier, max_block=64), 100)
+        assert np.allclose(mixed, x * sine_wave(A=2, f=5, phi=0.3, t=np.arange(len(x)) / 1000)), "Multiply stage mismatch"
+        carrier = pipeline.Oscillator(A=2, f=np.float32(5), phi=0.3, fs=np.int64(1000), max_block=64)
+        assert np.array_equal(run(pipeline.Multiply(carrier, max_block=64), 100), mixed), "NumPy scalar oscillator mismatch"
+        
+        # A full chain processes blocks without allocating sample memory
+        chain = Pipeline([
+            pipeline.Delay(5), pipeline.Resample(0.5),
+            pipeline.Add(pipeline.ArraySource(step)),
+            pipeline.Multiply(pipeline.Oscillator(A=1, f=5, phi=0, fs=1000)),
+        ])
+        block = np.ones(1024)
+        chain.process(block)
+        tracemalloc.start()
+        for _ in range(50):
+            chain.process(block)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < block.nbytes, f"Pipeline allocated {peak} bytes per block"
+        
+        print("✓ Block pipeline tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Block pipeline test failed: {e}")
+        return False
+
+def test_signal_container():
+    """Test zero-copy shifting and index alignment with Signal objects"""
+    print("\nTesting Signal container...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            Signal, time_shift, signal_addition, signal_multiplication
+        )
+        
+        signal1 = np.array([1, 2, 3, 4, 5])
+        signal2 = np.array([5, 4, 3, 2, 1])
+        
+        # Shifting only moves the start index and shares the buffer
+        shifted = time_shift(Signal(signal1), 2)
+        assert shifted.start == 2 and np.shares_memory(shifted.data, signal1), "Shift copied data"
+        for k in (2, 0, -2):
+            assert np.array_equal(time_shift(Signal(signal1), k).to_array(), time_shift(signal1, k)), "Shift densification mismatch"
+        
+        # Addition/multiplication align by sample index
+        added = signal_addition(shifted, signal2)
+        assert (added.start, len(added)) == (0, 7), "Addition support incorrect"
+        assert np.array_equal(added.to_array(), [5, 4, 4, 4, 4, 4, 5]), "Aligned addition incorrect"
+        product = signal_multiplication(shifted, Signal(signal2))
+        assert (product.start, len(product)) == (2, 3), "Multiplication support incorrect"
+        assert np.array_equal(np.asarray(product), [0, 0, 3, 4, 3]), "Aligned multiplication incorrect"
+        
+        try:
+            signal_addition(Signal(signal1, fs=100), Signal(signal2, fs=200))
+            assert False, "Mismatched sample rates should raise ValueError"
+        except ValueError:
+            pass
+        
+        print("✓ Signal container tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Signal container test failed: {e}")
+        return False
+
+def test_deferred_evaluation():
+    """Test chunk-fused deferred evaluation of operation chains"""
+    print("\nTesting deferred evaluation...")
+    try:
+        import tracemalloc
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            unit_step, ramp_signal, sine_wave, exponential_signal, deferred, evaluate,
+            time_shift, time_scale, signal_addition, signal_multiplication
+        )
+        
+        n = np.arange(-50000, 50000)
+        t = np.linspace(0, 1, len(n))
+        
+        def chain():
+            step = time_shift(unit_step(n), 3)
+            mixed = signal_multiplication(signal_addition(step, ramp_signal(n)), sine_wave(A=2, f=5, phi=0.3, t=t))
+            return signal_addition(time_scale(mixed, 0.5), exponential_signal(A=1, a=-2, t=t))
+        
+        eager = chain()
+        with deferred():
+            graph = chain()
+        assert not isinstance(graph, np.ndarray), "deferred() did not build a graph"
+        
+        # Bit-for-bit equal to the eager path, independent of chunk size
+        for chunk_size in (1000, 4096, 10**6):
+            assert np.array_equal(evaluate(graph, chunk_size=chunk_size), eager), "Deferred result differs"
+
+        # The phasor recurrence runs over the whole grid, not restarted per chunk
+        with deferred():
+            phasor = sine_wave(2, 997.5, 0.3, t, method='phasor')
+        for chunk_size in (777, 4096):
+            assert np.array_equal(phasor.evaluate(chunk_size=chunk_size), sine_wave(2, 997.5, 0.3, t, method='phasor')), \
+                "Deferred phasor differs"
+
+        # Scratch memory stays bounded by the chunk size, not the signal length
+        out = np.empty(len(graph))
+        tracemalloc.start()
+        graph.evaluate(chunk_size=1000, out=out)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < 200000, f"Deferred evaluation used {peak} bytes of scratch"
+        
+        print("✓ Deferred evaluation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Deferred evaluation test failed: {e}")
+        return False
+
+def test_threaded_evaluation():
+    """Test workers= chunked evaluation against the serial path"""
+    print("\nTesting threaded evaluation...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            unit_step, ramp_signal, sine_wave, cosine_wave, exponential_signal,
+            signal_addition, signal_multiplication, parallel
+        )
+        
+        t = np.linspace(0, 1, 300001)
+        n = np.arange(-150000, 150001)
+        x = np.random.default_rng(0).standard_normal(300001)
+        y = np.arange(200000)
+        for workers in (2, 4):
+            assert np.array_equal(sine_wave(2, 50, 0.3, t, workers=workers), sine_wave(2, 50, 0.3, t)), "Threaded sine differs"
+            assert np.array_equal(cosine_wave([1, 2], [3, 4], 0, t, method='phasor', workers=workers),
+                                  cosine_wave([1, 2], [3, 4], 0, t, method='phasor')), "Threaded phasor differs"
+            assert np.array_equal(exponential_signal(1, -2, t, workers=workers), exponential_signal(1, -2, t)), "Threaded exp differs"
+            for generator in (unit_step, ramp_signal):
+                assert np.array_equal(generator(n, workers=workers), generator(n)), "Threaded unitary signal differs"
+            for op in (signal_addition, signal_multiplication):
+                for a, b in ((x, y), (y, x)):
+                    result = op(a, b, workers=workers)
+                    assert result.dtype == op(a, b).dtype and np.array_equal(result, op(a, b)), "Threaded op differs"
+        assert len(parallel.chunk_bounds(300001, 4)) > 1, "Long signals were not split into chunks"
+        
+        print("✓ Threaded evaluation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Threaded evaluation test failed: {e}")
+        return False
+
+def test_streaming_statistics():
+    """Test single-pass, mergeable signal statistics"""
+    print("\nTesting streaming statistics...")
+    try:
+        import pickle
+        import tracemalloc
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            signal_statistics, sine_wave, sine_wave_stream, signal_addition, deferred
+        )
+        from signal_ICT_abhinaychoudhari_92400133174.statistics import Accumulator
+        
+        x = np.random.default_rng(0).standard_normal(300001) * 3 + 2
+        stats = signal_statistics(x, chunk_size=10000)
+        expected = {'samples': len(x), 'max': np.max(x), 'min': np.min(x), 'mean': np.mean(x),
+                    'rms': np.sqrt(np.mean(x ** 2)), 'variance': np.var(x),
+                    'peak_to_rms': np.max(np.abs(x)) / np.sqrt(np.mean(x ** 2))}
+        for key, value in stats.result().items():
+            assert np.isclose(value, expected[key], rtol=1e-12), f"Statistic {key} incorrect"
+        
+        # Accumulators merge across chunks, threads and (pickled) processes
+        parts = [pickle.loads(pickle.dumps(Accumulator().update(part))) for part in np.array_split(x, 7)]
+        merged = Accumulator.combine(parts)
+        threaded = signal_statistics(x, chunk_size=10000, workers=4)
+        for other in (merged, threaded):
+            assert other.count == stats.count and other.maximum == stats.maximum, "Merged extremes differ"
+            assert np.isclose(other.variance, stats.variance, rtol=1e-12), "Merged variance differs"
+        
+        # Streams and deferred expressions are reduced without materialising them
+        streamed = signal_statistics(sine_wave_stream(A=2, f=5, phi=0, fs=1000, block_size=300, n_samples=10000))
+        assert np.isclose(streamed.rms, np.sqrt(2)) and np.isclose(streamed.peak_to_rms, np.sqrt(2)), "Stream stats wrong"
+        with deferred():
+            graph = signal_addition(sine_wave(1, 5, 0, np.linspace(0, 1, 10**6)), x)
+        tracemalloc.start()
+        lazy = signal_statistics(graph, chunk_size=10000)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < 1000000, f"Statistics of an expression used {peak} bytes"
+        assert lazy.count == 10**6, "Expression statistics incomplete"
+        
+        print("✓ Streaming statistics tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Streaming statistics test failed: {e}")
+        return False
+
+def test_signal_cache():
+    """Test the opt-in byte-budgeted generator cache"""
+    print("\nTesting signal cache...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import cache, deferred, sine_wave, cosine_wave, unit_step
+        
+        t = np.linspace(0, 1, 10000)
+        n = np.arange(-10, 10)
+        assert not cache.is_enabled(), "Cache must be off by default"
+        assert sine_wave(1, 5, 0, t) is not sine_wave(1, 5, 0, t), "Disabled cache returned a shared array"
+        
+        cache.clear()
+        with cache.caching(max_bytes=200000):
+            first = sine_wave(1, 5, 0, t)
+            assert sine_wave(A=1, f=5, phi=0, t=t) is first, "Equal call not served from cache"
+            assert not first.flags.writeable, "Cached arrays must be read-only"
+            assert np.array_equal(first, np.sin(2 * np.pi * 5 * t)), "Cached value incorrect"
+            assert sine_wave(1, 6, 0, t) is not first, "Different parameters shared an entry"
+            assert sine_wave(1, 5, 0, t[:-1]) is not first, "Different grids shared an entry"
+            perturbed = t.copy()
+            perturbed[1234] += 1e-6  # one interior sample, between any evenly spaced probes
+            assert not np.array_equal(sine_wave(1, 5, 0, perturbed), first), "Grids differing in one sample shared an entry"
+            
+            # Read-only grids are hashed once and recognised by identity; writeable ones every call
+            frozen = cache.freeze(perturbed)
+            assert not frozen.flags.writeable and perturbed.flags.writeable, "freeze() changed the caller's grid"
+            assert cache.fingerprint(frozen) is cache.fingerprint(frozen), "Read-only grid fingerprint not remembered"
+            assert cache.freeze(frozen) is frozen, "freeze() copied a read-only grid"
+            view = perturbed[:]
+            view.setflags(write=False)
+            before = cache.fingerprint(view)
+            perturbed[0] += 1  # the view is read-only but its base is not
+            assert cache.fingerprint(view) != before, "Digest of a grid with a writeable base was trusted"
+            assert unit_step(n) is unit_step(n), "Unitary generator not cached"
+            
+            # Budget holds two 80 kB signals: the least recently used is evicted
+            cosine_wave(1, 5, 0, t)
+            stats = cache.stats()
+            assert stats['bytes'] <= 200000 and stats['evictions'] >= 2, "Byte budget not enforced"
+            assert stats['hits'] == 2, f"Unexpected hit count {stats['hits']}"
+            
+            # Deferred evaluation and out= bypass the cache
+            with deferred():
+                graph = sine_wave(1, 7, 0, t)
+            graph.evaluate(chunk_size=1000)
+            assert cache.stats()['misses'] == stats['misses'], "Deferred chunks went through the cache"
+        assert not cache.is_enabled(), "caching() did not restore the disabled state"
+        cache.clear()
+        
+        print("✓ Signal cache tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Signal cache test failed: {e}")
+        return False
+
+def test_instrumentation():
+    """Test the opt-in call instrumentation and its exporters"""
+    print("\nTesting instrumentation...")
+    try:
+        import json
+        import os
+        import subprocess
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            instrumentation, instrumented, deferred, sine_wave, unit_step, signal_addition, quadrature_wave
+        )
+        
+        t = np.linspace(0, 1, 1000)
+        n = np.arange(-10, 10)
+        instrumentation.reset()
+        assert not instrumentation.is_enabled(), "Instrumentation must be off by default"
+        sine_wave(1, 5, 0, t)
+        assert instrumentation.report() == {}, "Disabled instrumentation recorded a call"
+        
+        with instrumented():
+            for _ in range(3):
+                sine_wave(1, 5, 0, t)
+            signal_addition(unit_step(n), t)
+            with deferred():
+                graph = sine_wave(1, 5, 0, t)
+            graph.evaluate(chunk_size=100)
+        assert not instrumentation.is_enabled(), "instrumented() did not restore the disabled state"
+        
+        report = instrumentation.report()
+        sine = report['sine_wave']
+        assert sine['calls'] == 4, f"Deferred chunks were recorded as calls: {sine['calls']}"
+        assert sine['input_samples'] == 4000 and sine['max_input_samples'] == 1000, "Input sizes wrong"
+        assert sine['allocated_bytes'] == 3 * t.nbytes, "Allocated bytes wrong"
+        assert 0 < sine['p50_seconds'] <= sine['p99_seconds'] <= sine['total_seconds'], "Timings inconsistent"
+        assert report['signal_addition']['input_samples'] == 1020, "Operation inputs wrong"
+        assert report['unit_step']['calls'] == 1, "Unitary generator not recorded"
+        
+        assert json.loads(instrumentation.to_json()) == report, "JSON export does not round-trip"
+        text = instrumentation.to_prometheus()
+        assert 'signal_ict_call_seconds_count{function="sine_wave"} 4' in text, "Prometheus count missing"
+        assert '# TYPE signal_ict_call_seconds summary' in text, "Prometheus type line missing"
+        
+        with instrumented(memory=True):
+            signal_addition(t, t)
+        assert instrumentation.report()['signal_addition']['allocated_bytes'] >= 2 * t.nbytes, \
+            "Traced allocation smaller than the result"
+        instrumentation.reset()
+        
+        # Tuple results count the bytes of every part
+        with instrumented():
+            quadrature_wave(1, 5, 0, t)
+        assert instrumentation.report()['quadrature_wave']['allocated_bytes'] == 2 * t.nbytes, \
+            "Tuple result bytes not summed"
+        instrumentation.reset()
+        
+        # The environment variable enables recording at import
+        code = ("import numpy as np; import signal_ICT_abhinaychoudhari_92400133174 as s; "
+                "s.unit_step(np.arange(5)); print(s.instrumentation.report()['unit_step']['calls'])")
+        env = dict(os.environ, SIGNAL_ICT_INSTRUMENT="1")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert result.stdout.strip() == "1", f"Environment variable not honoured: {result.stderr}"
+        
+        print("✓ Instrumentation tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Instrumentation test failed: {e}")
+        return False
+
+def test_plot_envelope():
+    """Test min/max envelope decimation and Agg rendering of long signals"""
+    print("\nTesting plot envelope...")
+    try:
+        import os
+        import tempfile
+        from signal_ICT_abhinaychoudhari_92400133174.plotting import envelope, Panel, render_all
+        
+        x = np.random.default_rng(0).standard_normal(1000003)
+        index, values = envelope(x, pixels=1000)
+        bucket = -(-len(x) // 1000)
+        assert len(index) == 2 * (-(-len(x) // bucket)), f"Unexpected envelope length {len(index)}"
+        assert np.all(np.diff(index) >= 0), "Envelope samples not in time order"
+        assert np.array_equal(values, x[index]), "Envelope values are not signal samples"
+        full = len(x) // bucket
+        pairs = values.reshape(-1, 2)[:full]
+        buckets = x[:full * bucket].reshape(full, bucket)
+        assert np.array_equal(pairs.max(axis=1), buckets.max(axis=1)), "Bucket maxima not exact"
+        assert np.array_equal(pairs.min(axis=1), buckets.min(axis=1)), "Bucket minima not exact"
+        short = np.arange(10.0)
+        assert np.array_equal(envelope(short, pixels=5)[1], short), "Short signals must not be decimated"
+        
+        t = np.linspace(0, 1, len(x))
+        wave = Panel('Noisy sine', 'Time (s)').line(t, np.sin(2 * np.pi * 5 * t) + 0.1 * x, label='x')
+        stems = Panel('Stems', 'n').stem(None, x, basefmt='b-')
+        small = Panel('Step', 'n').stem(np.arange(-10, 10), np.arange(-10, 10) >= 0, basefmt='b-')
+        assert sum(len(trace[1]) for trace in wave.traces + stems.traces) <= 6000, "Panels not decimated"
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = render_all([(os.path.join(tmp, 'a.png'), [wave, stems], {'title': 'Envelope'}),
+                                (os.path.join(tmp, 'b.png'), [small, wave], {'ncols': 2})], workers=2)
+            for path in paths:
+                with open(path, 'rb') as f:
+                    assert f.read(8) == b'\x89PNG\r\n\x1a\n', f"{path} is not a PNG image"
+        
+        print("✓ Plot envelope tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Plot envelope test failed: {e}")
+        return False
+
+def test_dtype_policy():
+    """Test the package-wide dtype policy and per-call dtype= in each mode"""
+    print("\nTesting dtype policy...")
+    try:
+        import tracemalloc
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            precision, dtype_policy, set_default_dtype, deferred, evaluate,
+            unit_step, unit_impulse, ramp_signal, sine_wave, cosine_wave, exponential_signal,
+            time_shift, time_scale, signal_addition, signal_multiplication,
+            quadrature_wave, sine_wave_stream, cosine_wave_stream, convolve
+        )
+        
+        t = np.linspace(0, 1, 100000)
+        n = np.arange(-1000, 1000)
+        assert precision.get_default_dtype() is None, "No policy must be set by default"
+        assert unit_step(n).dtype == np.int64 and sine_wave(2, 5, 0, t).dtype == np.float64, \
+            "Historical dtypes changed without a policy"
+        
+        # Error bound relative to the amplitude for each storage dtype
+        tolerances = {'float64': 1e-12, 'float32': 2e-6, 'float16': 1e-3}
+        sine_ref = 2 * np.sin(2 * np.pi * 5 * t + 0.3)
+        product_ref = sine_ref * 2 * np.cos(2 * np.pi * 5 * t + 0.3)
+        for name, tolerance in tolerances.items():
+            dtype = np.dtype(name)
+            with dtype_policy(name):
+                sine = sine_wave(2, 5, 0.3, t)
+                cosine = cosine_wave(2, 5, 0.3, t)
+                outputs = {
+                    'sine': sine, 'cosine': cosine, 'exponential': exponential_signal(1, -2, t),
+                    'phasor': sine_wave(2, 5, 0.3, t, method='phasor'),
+                    'step': unit_step(n), 'impulse': unit_impulse(n), 'ramp': ramp_signal(n),
+                    'sum': signal_addition(unit_step(n), ramp_signal(n).astype(np.float64)),
+                    'product': signal_multiplication(sine, cosine, workers=2),
+                    'shifted': time_shift(sine, 5), 'scaled': time_scale(sine, 0.5),
+                    'stream': np.concatenate(list(sine_wave_stream(2, 5, 0.3, 99999, 4096, len(t)))),
+                    'convolution': convolve(sine, np.ones(100) / 100, method='fft'),
+                    'direct convolution': convolve(sine, np.ones(10) / 10, method='direct'),
+                }
+                outputs['quadrature sine'], outputs['quadrature cosine'] = quadrature_wave(2, 5, 0.3, t)
+                outputs['direct quadrature'] = quadrature_wave(2, 5, 0.3, t, method='direct')[0]
+                stream = cosine_wave_stream(2, 5, 0.3, 1000, 256, 1000)
+                with deferred():
+                    graph = signal_addition(sine_wave(2, 5, 0.3, t), unit_step(np.arange(len(t))))
+                outputs['deferred'] = evaluate(graph)
+            outputs['late stream'] = next(stream)  # the policy of the call that created it
+            for key, value in outputs.items():
+                assert value.dtype == dtype, f"{name}: {key} came out as {value.dtype}"
+            for key in ('stream', 'quadrature sine', 'direct quadrature'):
+                assert np.max(np.abs(outputs[key] - sine_ref)) <= 2 * tolerance, f"{name}: {key} error too large"
+            smoothed = np.convolve(sine_ref, np.ones(100) / 100)
+            assert np.max(np.abs(outputs['convolution'] - smoothed)) <= 4 * tolerance, \
+                f"{name}: convolution error too large"
+            assert np.max(np.abs(sine - sine_ref)) <= 2 * tolerance, f"{name}: sine error too large"
+            assert np.max(np.abs(outputs['phasor'] - sine_ref)) <= 2 * tolerance, f"{name}: phasor error too large"
+            assert np.max(np.abs(outputs['product'] - product_ref)) <= 4 * tolerance, f"{name}: product error too large"
+            assert np.max(np.abs(outputs['exponential'] - np.exp(-2 * t))) <= tolerance, \
+                f"{name}: exponential error too large"
+            assert np.array_equal(outputs['sum'], np.where(n >= 0, n + 1, 0)), f"{name}: step + ramp incorrect"
+            assert np.array_equal(outputs['impulse'], n == 0), f"{name}: impulse incorrect"
+        
+        # Per-call dtype= overrides the policy; the global default applies everywhere
+        with dtype_policy('float16'):
+            assert sine_wave(1, 5, 0, t, dtype=np.float32).dtype == np.float32, "dtype= did not override policy"
+            assert all(q.dtype == np.float32 for q in quadrature_wave(1, 5, 0, t, dtype=np.float32)), \
+                "dtype= did not override policy for quadrature_wave"
+            assert convolve(t, t[:200], dtype=np.float64).dtype == np.float64, "dtype= did not override policy for convolve"
+        x32 = t.astype(np.float32)
+        assert convolve(x32, x32[:200], method='fft', dtype=np.float32).dtype == np.float32, "float32 convolve upcast"
+        set_default_dtype('float32')
+        try:
+            assert ramp_signal(n).dtype == np.float32, "Global default ignored"
+        finally:
+            set_default_dtype(None)
+        try:
+            set_default_dtype('int32')
+            assert False, "Non-float policy accepted"
+        except ValueError:
+            pass
+        
+        # No hidden upcasts: an int + float64 sum into float32 allocates only its output
+        step, ramp = unit_step(np.arange(10 ** 6)), np.ones(10 ** 6)
+        tracemalloc.start()
+        total = signal_addition(step, ramp, dtype=np.float32)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert total.dtype == np.float32 and peak < 1.25 * total.nbytes, f"Upcast temporaries: peak {peak} B"
+        half_t = t.astype(np.float16)
+        tracemalloc.start()
+        half = sine_wave(1, 5, 0, half_t, dtype=np.float16)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < 1.5 * half.nbytes, f"float16 generation allocated float32 temporaries: peak {peak} B"
+        
+        print("✓ Dtype policy tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Dtype policy test failed: {e}")
+        return False
+
+def test_sparse_signals():
+    """Test the sparse and piecewise forms of the unitary signals against the dense ones"""
+    print("\nTesting sparse signals...")
+    try:
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            SparseSignal, PiecewiseSignal, dtype_policy, unit_step, unit_impulse, ramp_signal,
+            sine_wave, time_shift, signal_addition, signal_multiplication
+        )
+        
+        n = np.arange(-50, 50)
+        step, impulse, ramp = (unit_step(n, compact=True), unit_impulse(n, compact=True),
+                               ramp_signal(n, compact=True))
+        assert isinstance(impulse, SparseSignal) and len(impulse.index) == 1, "Impulse not stored as one pair"
+        assert isinstance(step, PiecewiseSignal) and len(step.starts) == 2, "Step not stored as two runs"
+        assert len(ramp.starts) == 2 and ramp.degree == 1, "Ramp not stored as a zero and a linear run"
+        for compact, dense in ((step, unit_step(n)), (impulse, unit_impulse(n)), (ramp, ramp_signal(n))):
+            assert np.array_equal(compact.to_array(), dense) and compact.dtype == dense.dtype, \
+                f"{compact!r} does not densify to the dense generator's output"
+        
+        # Operations stay compact and match the dense results, including shifts both ways
+        train = SparseSignal([3, 40, 77], [1.0, -2.0, 0.5], len(n))
+        sine = sine_wave(1, 5, 0, np.linspace(0, 1, len(n)))
+        cases = [
+            (signal_addition(step, ramp), signal_addition(unit_step(n), ramp_signal(n)), PiecewiseSignal),
+            (signal_multiplication(ramp, ramp), ramp_signal(n) ** 2, PiecewiseSignal),
+            (signal_addition(train, impulse), train.to_array() + unit_impulse(n), SparseSignal),
+            (signal_multiplication(train, ramp), train.to_array() * ramp_signal(n), SparseSignal),
+            (signal_multiplication(train, sine), train.to_array() * sine, SparseSignal),
+            (signal_addition(step, train), unit_step(n) + train.to_array(), PiecewiseSignal),
+            (signal_addition(ramp, sine), ramp_signal(n) + sine, np.ndarray),
+            (time_shift(ramp, 7), time_shift(ramp_signal(n), 7), PiecewiseSignal),
+            (time_shift(ramp, -60), time_shift(ramp_signal(n), -60), PiecewiseSignal),
+            (time_shift(train, -10), time_shift(train.to_array(), -10), SparseSignal),
+        ]
+        for k, (result, expected, kind) in enumerate(cases):
+            assert isinstance(result, kind), f"Case {k} returned {type(result).__name__}"
+            assert np.allclose(np.asarray(result), expected), f"Case {k} differs from the dense result"
+        
+        # A range is never materialised: cost depends on the segments, not the length
+        long = range(-10 ** 12, 10 ** 12)
+        product = signal_multiplication(signal_addition(unit_step(long, compact=True), ramp_signal(long, compact=True)),
+                                        time_shift(unit_impulse(long, compact=True), 5))
+        assert len(product) == 2 * 10 ** 12 + 5 and product.values.tolist() == [6], "Long compact chain incorrect"
+        with dtype_policy('float32'):
+            assert signal_addition(unit_step(long, compact=True), impulse).dtype == np.float32, "Policy ignored"
+        try:
+            ramp_signal(np.array([0, 1, 3]), compact=True)
+            assert False, "Unevenly spaced compact ramp accepted"
+        except ValueError:
+            pass
+        
+        print("✓ Sparse signal tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Sparse signal test failed: {e}")
+        return False
+
+
+def test_spectral_analysis():
+    """Test amplitude spectra and Welch PSD, including memory-mapped input"""
+    print("\nTesting spectral analysis...")
+    try:
+        import os
+        import tempfile
+        import tracemalloc
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            spectral, outofcore, spectrum, welch, sine_wave, cosine_wave, signal_multiplication
+        )
+        
+        # The assignment's 5 Hz tone and its sine × cosine product (A²/2 at 10 Hz)
+        fs = 1000
+        t = np.arange(0, 2, 1 / fs)
+        sine = sine_wave(2, 5, 0, t)
+        freqs, amplitudes = spectrum(sine, fs)
+        assert freqs[amplitudes.argmax()] == 5 and np.isclose(amplitudes.max(), 2), "5 Hz tone not found"
+        freqs, amplitudes = spectrum(signal_multiplication(sine, cosine_wave(2, 5, 0, t)), fs, window='hann')
+        assert freqs[amplitudes.argmax()] == 10 and np.isclose(amplitudes.max(), 2), "Product not at 10 Hz"
+        assert spectrum(np.ones(1009))[0].size == spectral.next_fast_length(1009) // 2 + 1, \
+            "Prime length not padded to a fast length"
+        assert spectral.plan(1009, 'hann') is spectral.plan(1009, 'hann'), "Plan not cached"
+        for analyse in (lambda: spectrum(np.ones(64, dtype=complex)), lambda: welch(np.ones(64, dtype=complex), nperseg=16)):
+            try:
+                analyse()
+                assert False, "Complex signals should raise ValueError"
+            except ValueError:
+                pass
+        
+        # White noise: flat density whose integral is the variance
+        rng = np.random.default_rng(0)
+        noise = rng.standard_normal(2 ** 18)
+        freqs, psd = welch(noise, fs=fs, nperseg=1024)
+        assert abs(psd.sum() * freqs[1] - 1) < 0.02, "Welch PSD does not integrate to the variance"
+        assert np.allclose(psd[1:-1].mean(), 2 / fs, rtol=0.02), "White noise density incorrect"
+        freqs, power = welch(sine, fs=fs, nperseg=200, window='boxcar', scaling='spectrum')
+        assert np.isclose(power.max(), 2) and freqs[power.argmax()] == 5, "Welch power spectrum incorrect"
+        
+        # Memory-mapped files give the same estimate within the memory budget
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'noise.npy')
+            np.save(path, noise)
+            tracemalloc.start()
+            _, mapped = welch(outofcore.load(path), fs=fs, nperseg=1024, memory_limit=2 ** 20)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert np.allclose(mapped, psd) and peak < 2 ** 20, f"SignalFile Welch differs or peaked at {peak} B"
+            _, mapped = welch(np.load(path, mmap_mode='r'), fs=fs, nperseg=1024, memory_limit=2 ** 20)
+            assert np.allclose(mapped, psd), "memmap Welch differs"
+        bank = welch(np.stack([noise, 2 * noise]), fs=fs, nperseg=1024)[1]
+        assert np.allclose(bank, [psd, 4 * psd]), "Multi-channel Welch incorrect"
+        try:
+            welch(noise, nperseg=256, noverlap=256)
+            assert False, "noverlap >= nperseg accepted"
+        except ValueError:
+            pass
+        
+        print("✓ Spectral analysis tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Spectral analysis test failed: {e}")
+        return False
+
+
+def test_async_streaming():
+    """Test async generators, the async pipeline's backpressure and the latency harness"""
+    print("\nTesting async streaming...")
+    try:
+        import asyncio
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            asynchronous, pipeline, AsyncPipeline, dtype_policy, sine_wave, sine_wave_stream,
+            unit_step, ramp_signal, signal_addition
+        )
+        
+        t = np.linspace(0, 1, 100000)
+        n = np.arange(-500, 500)
+        
+        async def scenario():
+            blocks = [b async for b in asynchronous.generate(sine_wave, 2, 5, 0, t=t, block_size=30000)]
+            assert np.array_equal(np.concatenate(blocks), sine_wave(2, 5, 0, t)), "Async sine blocks differ"
+            steps = [b async for b in asynchronous.generate(unit_step, n=n, block_size=64)]
+            assert np.array_equal(np.concatenate(steps), unit_step(n)), "Async step blocks differ"
+            with dtype_policy('float32'):
+                total = await asynchronous.offload(signal_addition, unit_step(n), ramp_signal(n))
+            assert total.dtype == np.float32, "Context not carried into the executor"
+            
+            # Stage outputs equal the synchronous pipeline, offloaded or not
+            reference = pipeline.Pipeline([pipeline.Delay(3), pipeline.Resample(0.5)])
+            expected = np.concatenate([reference.process(b.copy()).copy()
+                                       for b in sine_wave_stream(1, 5, 0, 1000, 3000, 10000)])
+            for offload_samples in (1000, 10 ** 9):
+                flow = AsyncPipeline(sine_wave_stream(1, 5, 0, 1000, 3000, 10000),
+                                     [pipeline.Delay(3), pipeline.Resample(0.5)], offload_samples=offload_samples)
+                output = np.concatenate([b async for b in flow])
+                assert np.array_equal(output, expected), "Async pipeline output differs"
+            
+            # float32 and float16 streams stay in their dtype through the queue and every stage
+            carrier = pipeline.Oscillator(2, 7, 0, 1000)
+            reference = pipeline.Pipeline([pipeline.Delay(3), pipeline.Resample(0.5), pipeline.Multiply(carrier)])
+            expected = np.concatenate([reference.process(b.copy()).copy()
+                                       for b in sine_wave_stream(1, 5, 0, 1000, 3000, 10000)])
+            for name, tolerance in (('float32', 1e-4), ('float16', 1e-2)):
+                with dtype_policy(name):
+                    stages = [pipeline.Delay(3), pipeline.Resample(0.5),
+                              pipeline.Multiply(pipeline.Oscillator(2, 7, 0, 1000))]
+                    source = sine_wave_stream(1, 5, 0, 1000, 3000, 10000)
+                flow = AsyncPipeline(source, stages)
+                blocks = [b async for b in flow]
+                assert all(b.dtype == name for b in blocks), f"{name} blocks were promoted"
+                assert np.allclose(np.concatenate(blocks), expected, atol=tolerance), f"{name} pipeline inaccurate"
+            
+            # A slow consumer holds the source back to the queue bound
+            pulled = 0
+            
+            def source():
+                nonlocal pulled
+                for _ in range(60):
+                    pulled += 1
+                    yield np.ones(16)
+            flow = AsyncPipeline(source(), queue_size=3)
+            received = 0
+            async for _ in flow:
+                received += 1
+                assert pulled - received <= 3 + 2, f"Source read {pulled - received} blocks ahead"
+                await asyncio.sleep(0.001)
+            assert received == 60 and flow.max_depth <= 3, "Backpressure bound exceeded"
+        
+        asyncio.run(scenario())
+        
+        metrics = asynchronous.measure_latency(blocks=20, block_size=8192, consumer_delay=0.002, queue_size=2)
+        assert metrics['blocks'] == 20 and metrics['samples'] == 20 * 8192, "Harness lost blocks"
+        assert metrics['max_queue_depth'] <= 2 and metrics['max_in_flight'] <= 2 + 2, "Harness exceeded queue bound"
+        assert 0 < metrics['latency']['p50_seconds'] <= metrics['latency']['max_seconds'], "Latency not measured"
+        
+        print("✓ Async streaming tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Async streaming test failed: {e}")
+        return False
+
+
+def test_compressed_container():
+    """Test the compressed container: exact round trips, seeking, appending and recovery"""
+    print("\nTesting compressed container...")
+    try:
+        import os
+        import tempfile
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            compressed, CompressedSignal, CompressedWriter, sine_wave_stream, unit_step, signal_addition
+        )
+        
+        rng = np.random.default_rng(0)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "signal.sigz")
+            
+            # Every codec and filter combination decodes bit-identically
+            for x in (rng.standard_normal(1000), unit_step(np.arange(-500, 500)).astype(np.int16),
+                      rng.standard_normal(1000).astype(np.float32) + 1j):
+                for codec in ('zlib', 'lzma', 'none'):
+                    for delta in (False, True):
+                        stored = compressed.save(x, path, chunk_size=64, codec=codec, delta=delta)
+                        assert stored.read().tobytes() == x.tobytes(), f"{codec} round trip not exact"
+                        assert np.array_equal(stored.read(130, 700, workers=3), x[130:700]), "Range read differs"
+            
+            # Smooth signals compress, and time ranges seek to their chunks
+            blocks = list(sine_wave_stream(2, 5, 0, 1000, 128, 10000))
+            with CompressedWriter(path, chunk_size=1000, delta=True, fs=1000, start_time=1.0) as writer:
+                writer.extend(blocks)
+            stored = compressed.load(path)
+            expected = np.concatenate(blocks)
+            assert stored.length == 10000 and stored.chunks == 10, "Wrong layout"
+            assert np.array_equal(stored.read(), expected), "Streamed samples differ"
+            assert stored.ratio > 2, f"Sine compressed only {stored.ratio:.1f}x"
+            t, values = stored.time_range(3.0, 5.0)
+            assert len(t) == 2000 and t[0] == 3.0 and np.array_equal(values, expected[2000:4000]), "Time range wrong"
+            
+            # Appending resumes a partial chunk; an unclosed file still opens
+            with CompressedWriter(path, append=True) as writer:
+                writer.write(np.zeros(500))
+            assert compressed.load(path).length == 10500, "Append lost samples"
+            writer = CompressedWriter(path, chunk_size=100)
+            writer.write(np.arange(450.0))
+            writer._file.flush()
+            recovered = CompressedSignal(path)
+            assert not recovered.closed and np.array_equal(recovered.read(), np.arange(400.0)), "Recovery failed"
+            writer.close()
+            
+            # As an expression node it feeds the operations
+            total = signal_addition(compressed.load(path), compressed.load(path))
+            assert np.array_equal(np.asarray(total), 2 * np.arange(450.0)), "Container as operand failed"
+            
+            try:
+                compressed.save(x, path, codec='zip')
+                assert False, "Should reject unknown codecs"
+            except ValueError:
+                pass
+        
+        print("✓ Compressed container tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Compressed container test failed: {e}")
+        return False
+
+
+def test_shared_signals():
+    """Test zero-copy shared-memory signals across processes and their cleanup"""
+    print("\nTesting shared signals...")
+    try:
+        import concurrent.futures
+        import multiprocessing
+        import os
+        import pickle
+        from multiprocessing import shared_memory
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            shared, SharedSignal, sine_wave, cosine_wave, signal_addition, signal_multiplication
+        )
+        
+        t = np.linspace(0, 1, 10000)
+        name = f"test_tone_{os.getpid()}"
+        
+        # Generators and operations write straight into named segments
+        tone = sine_wave(2, 5, 0, t, out=name)
+        handle = shared.attach(name)
+        assert isinstance(handle, SharedSignal) and np.shares_memory(tone, np.asarray(handle)), "Not zero-copy"
+        assert np.array_equal(tone, sine_wave(2, 5, 0, t)), "Shared sine wave differs"
+        carrier = cosine_wave(1, 3, 0, t)
+        with shared.create(len(t)) as product:
+            signal_multiplication(handle, carrier, out=product)
+            assert np.array_equal(product.values, tone * carrier), "Shared product differs"
+        total = signal_addition(tone, carrier, out=f"{name}_sum")
+        assert np.array_equal(total, tone + carrier), "Shared sum differs"
+        shared.release(f"{name}_sum")
+        assert memoryview(handle.buf).nbytes == tone.nbytes, "Buffer view size wrong"
+        assert len(pickle.dumps(handle)) < 200, "Handle pickled its samples"
+        
+        # Another process attaches by name and reads the same memory
+        with concurrent.futures.ProcessPoolExecutor(1) as pool:
+            assert np.isclose(pool.submit(np.sum, handle).result(), tone.sum()), "Worker read differs"
+        
+        # A process that exits without closing is not counted
+        worker = multiprocessing.Process(target=shared.attach, args=(name,))
+        worker.start()
+        worker.join()
+        assert handle.references == 1, f"{handle.references} references after the worker exited"
+        
+        try:
+            sine_wave(2, 5, 0, t[:10], out=name)
+            assert False, "Should reject a segment of another shape"
+        except ValueError:
+            pass
+        
+        # A segment whose last process died without closing is collected
+        with concurrent.futures.ProcessPoolExecutor(1) as pool:
+            orphan = shared.share(np.ones(100))
+            pool.submit(np.sum, orphan).result()
+            orphan.close()
+            assert not shared.collect(orphan.name), "Unlinked while a worker was attached"
+        assert orphan.name in shared.collect(), "Orphaned segment not collected"
+        
+        # The last close unlinks the segment
+        del tone
+        handle.close()
+        for segment in (name, f"{name}_sum"):
+            try:
+                shared_memory.SharedMemory(name=segment)
+                assert False, f"Segment {segment} leaked"
+            except FileNotFoundError:
+                pass
+        
+        print("✓ Shared signals tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Shared signals test failed: {e}")
+        return False
+
+
+def test_out_of_core():
+    """Test chunked processing of memory-mapped files larger than the memory cap"""
+    print("\nTesting out-of-core processing...")
+    try:
+        import os
+        import subprocess
+        import tempfile
+        from signal_ICT_abhinaychoudhari_92400133174 import (
+            outofcore, deferred, sine_wave, ramp_signal,
+            time_shift, time_scale, signal_addition, signal_multiplication
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            # Small files: results equal the in-memory operations
+            x = np.random.default_rng(0).standard_normal(10000)
+            y = np.random.default_rng(1).standard_normal(7000)
+            np.save(os.path.join(tmp, 'x.npy'), x)
+            y.tofile(os.path.join(tmp, 'y.raw'))
+            fx = outofcore.load(os.path.join(tmp, 'x.npy'))
+            fy = outofcore.load(os.path.join(tmp, 'y.raw'), dtype=np.float64)
+            cases = [
+                (signal_addition(fx, fy), signal_addition(x, y)),
+                (signal_multiplication(fx, fy), signal_multiplication(x, y)),
+                (time_shift(fx, 5), time_shift(x, 5)),
+                (time_shift(fx, -5), time_shift(x, -5)),
+                (time_scale(fx, 0.75), time_scale(x, 0.75)),
+            ]
+            for i, (graph, expected) in enumerate(cases):
+                path = os.path.join(tmp, f'out{i}.npy')
+                outofcore.save(graph, path, memory_limit=20000)
+                assert np.array_equal(np.load(path), expected), f"Out-of-core case {i} differs"
+
+            # Large files: peak RSS grows by far less than the files being processed
+            samples, limit = 4 * 10**6, 4 * 2**20
+            with deferred():
+                t = np.linspace(0, 1, samples)
+                outofcore.save(sine_wave(A=1, f=50, phi=0, t=t), os.path.join(tmp, 'a.npy'), limit)
+                outofcore.save(ramp_signal(np.arange(samples)), os.path.join(tmp, 'b.raw'), limit)
+            script = (
+                "import os, resource, sys\n"
+                "import numpy as np\n"
+                "from signal_ICT_abhinaychoudhari_92400133174 import *\n"
+                "from signal_ICT_abhinaychoudhari_92400133174 import outofcore\n"
+                "tmp, limit = sys.argv[1], int(sys.argv[2])\n"
+                "a = outofcore.load(os.path.join(tmp, 'a.npy'))\n"
+                "b = outofcore.load(os.path.join(tmp, 'b.raw'), dtype=np.int64)\n"
+                "before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+                "mixed = signal_multiplication(signal_addition(a, b), time_shift(a, 100))\n"
+                "out = outofcore.save(time_scale(mixed, 0.5), os.path.join(tmp, 'c.npy'), limit)\n"
+                "after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+                "print(len(out), (after - before) * 1024)\n"
+            )
+            result = subprocess.run([sys.executable, '-c', script, tmp, str(limit)],
+                                    capture_output=True, text=True, timeout=300)
+            assert result.returncode == 0, result.stderr
+            length, growth = map(int, result.stdout.split())
+            assert length == 2 * (samples + 100), f"Unexpected output length {length}"
+            processed = 3 * samples * 8 + length * 8
+            assert processed > 10 * limit, "Test files are not larger than the memory cap"
+            assert growth < 4 * limit, f"Peak RSS grew by {growth} bytes with a {limit}-byte cap"
+
+        print("✓ Out-of-core processing tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Out-of-core processing test failed: {e}")
+        return False
+
+def test_parameter_sweep():
+    """Test the process-pool parameter sweep into shared memory"""
+    print("\nTesting parameter sweep...")
+    try:
+        import functools
+        from multiprocessing import shared_memory
+        from signal_ICT_abhinaychoudhari_92400133174 import parameter_sweep, sine_wave, cosine_wave, time_shift
+        
+        t = np.linspace(0, 1, 500)
+        A, f, phi = [1, 2], np.arange(1, 8), [0, 0.5, 1]
+        
+        # Workers fill the shared block with exactly the serial results
+        with parameter_sweep(t, A, f, phi, workers=2, batch_samples=2000) as result:
+            assert result.values.shape == (2, 7, 3, 500), "Sweep shape incorrect"
+            for i, j, k in np.ndindex(2, 7, 3):
+                assert np.array_equal(result.values[i, j, k], sine_wave(A[i], f[j], phi[k], t)), "Sweep value mismatch"
+            assert sum(w['combinations'] for w in result.workers) == 42, "Worker reports incomplete"
+            assert all(w['samples_per_second'] > 0 for w in result.workers), "Worker throughput missing"
+            name = result.name
+        try:
+            shared_memory.SharedMemory(name=name)
+            assert False, "Shared memory not unlinked on close"
+        except FileNotFoundError:
+            pass
+        
+        # An operations chain may change the output length
+        chain = functools.partial(time_shift, k=3)
+        with parameter_sweep(t, A, f, 0.2, waveform='cosine', chain=chain, workers=1) as result:
+            assert result.values.shape == (2, 7, 1, 503), "Chained sweep shape incorrect"
+            assert np.array_equal(result.values[1, 4, 0], time_shift(cosine_wave(2, 5, 0.2, t), 3)), "Chain mismatch"
+        
+        print("✓ Parameter sweep tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Parameter sweep test failed: {e}")
+        return False
+
 def test_assignment_requirements():
     """Test specific assignment requirements"""
     print("\nTesting assignment requirements...")
@@ -169,6 +1364,81 @@ def test_assignment_requirements():
         print(f"✗ Assignment requirements test failed: {e}")
         return False
 
+def test_headless_mode():
+    """Test that generators return arrays without importing matplotlib"""
+    print("\nTesting headless generation...")
+    try:
+        import subprocess
+        code = (
+            "import sys, numpy as np\n"
+            "import signal_ICT_abhinaychoudhari_92400133174 as s\n"
+            "assert 'signal_ICT_abhinaychoudhari_92400133174.operations' not in sys.modules\n"
+            "n = np.arange(-5, 6)\n"
+            "t = np.linspace(0, 1, 100)\n"
+            "assert isinstance(s.unit_step(n), np.ndarray)\n"
+            "assert isinstance(s.sine_wave(A=1, f=1, phi=0, t=t), np.ndarray)\n"
+            "assert isinstance(s.exponential_signal(A=1, a=-1, t=t), np.ndarray)\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib was imported'\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr.strip()
+        
+        print("✓ Headless mode tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Headless mode test failed: {e}")
+        return False
+
+def test_batch_mode():
+    """Test the headless batch mode of the signal-demo entry point"""
+    print("\nTesting batch mode...")
+    try:
+        import json
+        import os
+        import subprocess
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            code = ("import sys; from signal_ICT_abhinaychoudhari_92400133174.main import main; "
+                    "status = main(['--samples', '5000', '--dtype', 'float32', '--workers', '2', "
+                    "'--repeat', '2', '--output', sys.argv[1]]); "
+                    "print('matplotlib' in sys.modules); sys.exit(status)")
+            result = subprocess.run([sys.executable, "-c", code, tmp],
+                                    capture_output=True, text=True, timeout=60)
+            assert result.returncode == 0, f"Batch mode failed: {result.stderr}"
+            lines = result.stdout.strip().splitlines()
+            assert lines[-1] == "False", "Batch mode imported matplotlib"
+            assert any("Msamples/s" in line and "Peak MB" in line for line in lines), "No throughput report"
+            
+            with open(os.path.join(tmp, 'summary.json')) as f:
+                summary = json.load(f)
+            tasks = {task['task']: task for task in summary['tasks']}
+            assert len(tasks) == 10 and summary['dtype'] == 'float32', "Summary incomplete"
+            sine = np.load(tasks['sine_wave']['path'])
+            t = np.linspace(0, 1, 5000, dtype=np.float32)
+            assert sine.dtype == np.float32 and np.allclose(sine, 2 * np.sin(2 * np.pi * 5 * t), atol=1e-5), \
+                "Written sine wave incorrect"
+            assert tasks['time_shift']['samples'] == 5005, "Time shift result has the wrong length"
+            assert all(task['dtype'] == 'float32' for task in tasks.values()), "A task ignored --dtype"
+            assert all(np.load(task['path']).dtype == np.float32 for task in tasks.values()), "Written dtype wrong"
+            assert all(task['samples_per_second'] > 0 and task['mb_per_second'] > 0 and task['peak_bytes'] > 0
+                       for task in tasks.values()), "Missing throughput or memory metrics"
+        
+        # Every task's output follows the requested dtype policy
+        import io
+        from signal_ICT_abhinaychoudhari_92400133174 import batch
+        for dtype in batch.DTYPES:
+            metrics = batch.run(samples=3000, dtype=dtype, repeat=1, stream=io.StringIO())
+            wrong = {m['task']: m['dtype'] for m in metrics if m['dtype'] != dtype}
+            assert not wrong, f"{dtype} batch produced {wrong}"
+        
+        print("✓ Batch mode tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Batch mode test failed: {e}")
+        return False
+
 def test_console_script():
     """Test if console script is available"""
     print("\nTesting console script availability...")
@@ -200,8 +1470,32 @@ def generate_test_report():
         ("Import Test", test_imports),
         ("Unitary Signals Test", test_unitary_signals),
         ("Trigonometric Signals Test", test_trigonometric_signals),
+        ("Multi-channel Generation Test", test_multichannel_generation),
+        ("Phasor Oscillator Test", test_phasor_oscillator),
+        ("Wavetable Oscillator Test", test_wavetable_oscillator),
+        ("Streaming Oscillators Test", test_streaming_oscillators),
         ("Operations Test", test_operations),
+        ("Polyphase Resampling Test", test_polyphase_resampling),
+        ("LTI Convolution Test", test_lti_convolution),
+        ("Block Pipeline Test", test_block_pipeline),
+        ("Signal Container Test", test_signal_container),
+        ("Deferred Evaluation Test", test_deferred_evaluation),
+        ("Threaded Evaluation Test", test_threaded_evaluation),
+        ("Streaming Statistics Test", test_streaming_statistics),
+        ("Signal Cache Test", test_signal_cache),
+        ("Instrumentation Test", test_instrumentation),
+        ("Plot Envelope Test", test_plot_envelope),
+        ("Dtype Policy Test", test_dtype_policy),
+        ("Sparse Signals Test", test_sparse_signals),
+        ("Spectral Analysis Test", test_spectral_analysis),
+        ("Async Streaming Test", test_async_streaming),
+        ("Compressed Container Test", test_compressed_container),
+        ("Shared Signals Test", test_shared_signals),
+        ("Out-of-core Processing Test", test_out_of_core),
+        ("Parameter Sweep Test", test_parameter_sweep),
         ("Assignment Requirements Test", test_assignment_requirements),
+        ("Headless Mode Test", test_headless_mode),
+        ("Batch Mode Test", test_batch_mode),
         ("Console Script Test", test_console_script),
     ]
     